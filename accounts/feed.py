@@ -0,0 +1,79 @@
+# accounts/feed.py
+"""
+개인 피드
+────────────────────────────────────────────────────────
+run_pipeline 이 신규 법안을 적재한 뒤 fan_out() 을 호출하면
+- 같은 클러스터의 법안에 좋아요한 사용자  → 'cluster' 항목
+- 해당 법안에 표결한 의원을 좋아요한 사용자 → 'member' 항목
+을 bulk insert 한다. 조회는 (user, -created_at) 인덱스 범위 스캔 한 번.
+"""
+from collections import defaultdict
+
+from geovote.models import Vote
+from billview.models import Bill
+from .models import BillLike, FeedEntry, MemberLike
+
+_BATCH = 1000
+
+
+def fan_out(bill_ids) -> int:
+    """신규 법안 id 목록을 관심 사용자 피드로 팬아웃 → 생성 건수 반환"""
+    bill_ids = list(bill_ids)
+    if not bill_ids:
+        return 0
+
+    entries = []
+
+    # 1. 관심 클러스터 → 신규 법안
+    bill_clusters = dict(
+        Bill.objects.filter(id__in=bill_ids, cluster__isnull=False)
+        .values_list("id", "cluster")
+    )
+    cluster_users = defaultdict(set)
+    for user_id, cluster in (
+        BillLike.objects.filter(bill__cluster__in=set(bill_clusters.values()))
+        .values_list("user_id", "bill__cluster")
+        .distinct()
+    ):
+        cluster_users[cluster].add(user_id)
+
+    for bill_id, cluster in bill_clusters.items():
+        for user_id in cluster_users.get(cluster, ()):
+            entries.append(FeedEntry(user_id=user_id, bill_id=bill_id, reason=FeedEntry.REASON_CLUSTER))
+
+    # 2. 관심 의원 → 신규 표결
+    member_users = defaultdict(set)
+    for user_id, member_id in MemberLike.objects.values_list("user_id", "member_id"):
+        member_users[member_id].add(user_id)
+
+    if member_users:
+        for member_id, bill_id, result in (
+            Vote.objects.filter(bill_id__in=bill_ids, member_id__in=list(member_users))
+            .values_list("member_id", "bill_id", "result")
+        ):
+            for user_id in member_users[member_id]:
+                entries.append(FeedEntry(
+                    user_id=user_id, bill_id=bill_id, reason=FeedEntry.REASON_MEMBER,
+                    member_id=member_id, vote_result=result,
+                ))
+
+    # 재실행 시 중복 방지 (member 가 NULL 인 항목은 unique 제약으로 걸러지지 않음)
+    existing = set(
+        FeedEntry.objects.filter(bill_id__in=bill_ids)
+        .values_list("user_id", "bill_id", "reason", "member_id")
+    )
+    entries = [
+        e for e in entries
+        if (e.user_id, e.bill_id, e.reason, e.member_id) not in existing
+    ]
+
+    FeedEntry.objects.bulk_create(entries, batch_size=_BATCH, ignore_conflicts=True)
+    return len(entries)
+
+
+def get_feed(user, limit=20):
+    return (
+        FeedEntry.objects.filter(user=user)
+        .select_related("bill", "member")
+        .order_by("-created_at")[:limit]
+    )
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_remove_user_nickname'),
+        ('billview', '0002_initial'),
+        ('geovote', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(choices=[('cluster', '관심 주제 신규 법안'), ('member', '관심 의원 표결')], max_length=10)),
+                ('vote_result', models.CharField(blank=True, max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('bill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='billview.bill')),
+                ('member', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='geovote.member')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '피드 항목',
+                'verbose_name_plural': '피드 항목 목록',
+                'indexes': [models.Index(fields=['user', '-created_at'], name='accounts_fe_user_id_a3af07_idx')],
+                'unique_together': {('user', 'bill', 'reason', 'member')},
+            },
+        ),
+    ]
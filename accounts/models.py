@@ -40,3 +40,33 @@ class MemberLike(models.Model):
 
     def __str__(self):
         return f"{self.user.username} likes {self.member.name}"
+
+
+# ─────────────────────────────────────────────
+#  피드 모델 (적재 시 팬아웃, 조회는 사용자별 범위 스캔)
+# ─────────────────────────────────────────────
+class FeedEntry(models.Model):
+    REASON_CLUSTER = "cluster"   # 좋아요한 법안과 같은 클러스터의 신규 법안
+    REASON_MEMBER  = "member"    # 좋아요한 의원의 신규 표결
+    REASON_CHOICES = [
+        (REASON_CLUSTER, "관심 주제 신규 법안"),
+        (REASON_MEMBER,  "관심 의원 표결"),
+    ]
+
+    user        = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    bill        = models.ForeignKey(Bill, on_delete=models.CASCADE)
+    reason      = models.CharField(max_length=10, choices=REASON_CHOICES)
+    member      = models.ForeignKey(Member, on_delete=models.CASCADE, null=True, blank=True)
+    vote_result = models.CharField(max_length=10, blank=True)
+    created_at  = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together     = ("user", "bill", "reason", "member")
+        verbose_name        = "피드 항목"
+        verbose_name_plural = "피드 항목 목록"
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} ← {self.bill_id} ({self.reason})"
@@ -11,7 +11,6 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth import login as auth_login, logout as auth_logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Max
 from django.shortcuts import render, redirect
 from django.urls import reverse_lazy
 from django.views.generic import FormView, UpdateView
@@ -25,6 +24,8 @@ from .forms import (
 )
 
 from accounts.models import BillLike
+from accounts.feed import get_feed
+from billview.cards import get_cards
 from billview.models import Bill
 from geovote.models import Vote
 from main.models import ClusterKeyword, PartyClusterStats, VoteSummary
@@ -314,11 +315,9 @@ def my_page(request):
     liked_ids = list(
         BillLike.objects.filter(user=request.user).values_list("bill_id", flat=True)
     )
-    bill_list = (
-        Bill.objects.filter(id__in=liked_ids)
-        .annotate(latest_vote_date=Max("vote__date"))
-        .prefetch_related("vote_set")
-    )
+    # 좋아요 의안 목록은 BillCard(제목·클러스터·키워드·최근 표결일)만으로 렌더링 (좋아요 순서 유지)
+    cards = get_cards(liked_ids)
+    bill_list = [cards[bid] for bid in liked_ids if bid in cards]
 
     liked_clusters = [b.cluster for b in bill_list if b.cluster]
 
@@ -397,6 +396,9 @@ def my_page(request):
         "recommended_bills": recommended_bills,
         "top_similar_clusters": similar_clusters,
 
+        # 새 소식 피드
+        "feed_entries": get_feed(request.user),
+
         # 차트 데이터
         "cluster_data": cluster_stats_data["cluster_data"],
         "result_types": cluster_stats_data["result_types"],
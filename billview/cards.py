@@ -0,0 +1,126 @@
+# billview/cards.py
+"""
+BillCard 읽기 모델
+────────────────────────────────────────────────────────
+검색 · 히스토리 · 카드뉴스 · 마이페이지가 공통으로 쓰는 카드 데이터
+(제목 가공, 클러스터 키워드 · 색상, 개정 횟수, 최근 표결일, 좋아요 수)를
+의안별 한 행으로 미리 계산해 둔다. 목록 화면은 id IN (...) 한 번으로 읽는다.
+- refresh_cards(bill_ids)        : 지정 의안(+같은 라벨 의안) 카드 재계산, None 이면 전체
+- get_cards(bill_ids)            : {bill_id: BillCard} (없는 카드는 즉석 생성)
+- adjust_like_count(bill_id, d)  : 좋아요 이벤트 반영
+"""
+from django.db.models import Count, F, Max
+
+from accounts.models import BillLike
+from geovote.models import Vote
+from .models import Bill, BillCard
+
+PALETTE = [
+    '#bef264', '#67e8f9', '#f9a8d4', '#fde68a', '#fdba74',
+    '#6ee7b7', '#c3b4fc', '#fda4af', '#5eead4', '#34d399',
+    '#f472b6', '#facc15', '#fb7185', '#818cf8', '#38bdf8',
+]
+_CHUNK = 500
+_UPDATE_FIELDS = [
+    'age_number', 'title', 'title_custom', 'bill_number', 'label', 'cluster',
+    'cluster_keyword', 'color', 'revision_count', 'is_latest', 'last_vote_date', 'like_count',
+    'updated_at',
+]
+
+
+def format_title(title: str) -> str:
+    """4어절 이후 줄바꿈 (검색 카드 제목 형식)"""
+    words = title.split()
+    return " ".join(words[:4]) + "<br>" + " ".join(words[4:]) if len(words) > 4 else title
+
+
+def _cluster_color(cluster):
+    return PALETTE[(cluster - 1) % len(PALETTE)] if cluster and cluster > 0 else '#67e8f9'
+
+
+def _refresh_chunk(bill_ids):
+    rows = list(
+        Bill.objects.filter(id__in=bill_ids)
+        .values('id', 'age__number', 'title', 'bill_number', 'label', 'cluster', 'cluster_keyword')
+    )
+    labels = {r['label'] for r in rows if r['label'] is not None}
+    label_stats = {
+        r['label']: (r['cnt'], r['latest'])
+        for r in (
+            Bill.objects.filter(label__in=labels)
+            .values('label')
+            .annotate(cnt=Count('id'), latest=Max('bill_number'))
+        )
+    }
+    last_votes = dict(
+        Vote.objects.filter(bill_id__in=bill_ids)
+        .values('bill_id')
+        .annotate(last=Max('date'))
+        .values_list('bill_id', 'last')
+    )
+    likes = dict(
+        BillLike.objects.filter(bill_id__in=bill_ids)
+        .values('bill_id')
+        .annotate(cnt=Count('id'))
+        .values_list('bill_id', 'cnt')
+    )
+
+    cards = []
+    for r in rows:
+        cnt, latest = label_stats.get(r['label'], (1, r['bill_number']))
+        cards.append(BillCard(
+            bill_id=r['id'],
+            age_number=r['age__number'],
+            title=r['title'],
+            title_custom=format_title(r['title']),
+            bill_number=r['bill_number'],
+            label=r['label'],
+            cluster=r['cluster'],
+            cluster_keyword=r['cluster_keyword'] or '',
+            color=_cluster_color(r['cluster']),
+            revision_count=cnt,
+            is_latest=(r['bill_number'] == latest),
+            last_vote_date=last_votes.get(r['id']),
+            like_count=likes.get(r['id'], 0),
+        ))
+    BillCard.objects.bulk_create(
+        cards, update_conflicts=True, unique_fields=['bill'], update_fields=_UPDATE_FIELDS,
+    )
+    return len(cards)
+
+
+def refresh_cards(bill_ids=None) -> int:
+    """카드 재계산 → 갱신된 카드 수. 개정 횟수가 바뀌므로 같은 라벨 의안도 함께 갱신"""
+    if bill_ids is None:
+        ids = list(Bill.objects.order_by('id').values_list('id', flat=True))
+    else:
+        bill_ids = list(bill_ids)
+        labels = set(
+            Bill.objects.filter(id__in=bill_ids, label__isnull=False).values_list('label', flat=True)
+        )
+        ids = sorted(
+            set(bill_ids)
+            | set(Bill.objects.filter(label__in=labels).values_list('id', flat=True))
+        )
+
+    total = 0
+    for i in range(0, len(ids), _CHUNK):
+        total += _refresh_chunk(ids[i:i + _CHUNK])
+    return total
+
+
+def get_cards(bill_ids) -> dict:
+    bill_ids = list(bill_ids)
+    cards = BillCard.objects.in_bulk(bill_ids)
+    missing = [bid for bid in bill_ids if bid not in cards]
+    if missing:
+        _refresh_chunk(missing)
+        cards.update(BillCard.objects.in_bulk(missing))
+    return cards
+
+
+def adjust_like_count(bill_id, delta: int):
+    qs = BillCard.objects.filter(pk=bill_id)
+    if delta < 0:
+        qs = qs.filter(like_count__gte=-delta)
+    qs.update(like_count=F('like_count') + delta)
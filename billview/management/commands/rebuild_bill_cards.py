@@ -0,0 +1,17 @@
+# billview/management/commands/rebuild_bill_cards.py
+"""
+BillCard 전체 재생성 (초기 적재 · 복구용)
+
+    python manage.py rebuild_bill_cards
+"""
+from django.core.management.base import BaseCommand
+
+from billview.cards import refresh_cards
+
+
+class Command(BaseCommand):
+    help = "목록 UI 공용 카드 데이터(BillCard)를 다시 만든다."
+
+    def handle(self, *args, **options):
+        count = refresh_cards()
+        self.stdout.write(self.style.SUCCESS(f"BillCard 재생성 완료: {count}건"))
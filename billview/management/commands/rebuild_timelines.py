@@ -0,0 +1,17 @@
+# billview/management/commands/rebuild_timelines.py
+"""
+개정 이력 타임라인 전체 재생성 (초기 적재 · 복구용)
+
+    python manage.py rebuild_timelines
+"""
+from django.core.management.base import BaseCommand
+
+from billview.timeline import rebuild_timelines
+
+
+class Command(BaseCommand):
+    help = "라벨별 개정 이력 타임라인(BillRevisionTimeline)을 다시 만든다."
+
+    def handle(self, *args, **options):
+        count = rebuild_timelines()
+        self.stdout.write(self.style.SUCCESS(f"타임라인 재생성 완료: 라벨 {count}개"))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billview', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BillRevisionTimeline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.IntegerField(unique=True)),
+                ('entries', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billview', '0003_billrevisiontimeline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BillCard',
+            fields=[
+                ('bill', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='billview.bill')),
+                ('age_number', models.IntegerField(blank=True, null=True)),
+                ('title', models.CharField(max_length=255)),
+                ('title_custom', models.TextField(blank=True, default='')),
+                ('bill_number', models.CharField(max_length=100)),
+                ('label', models.IntegerField(blank=True, null=True)),
+                ('cluster', models.IntegerField(blank=True, null=True)),
+                ('cluster_keyword', models.TextField(blank=True, default='')),
+                ('color', models.CharField(default='#67e8f9', max_length=7)),
+                ('revision_count', models.PositiveIntegerField(default=1)),
+                ('is_latest', models.BooleanField(default=True)),
+                ('last_vote_date', models.DateField(blank=True, null=True)),
+                ('like_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['is_latest', '-revision_count'], name='billview_bi_is_late_512abb_idx'), models.Index(fields=['last_vote_date'], name='billview_bi_last_vo_6c1ad3_idx'), models.Index(fields=['cluster', '-bill_number'], name='billview_bi_cluster_bba155_idx')],
+            },
+        ),
+    ]
@@ -24,4 +24,46 @@ class Bill(models.Model):
         indexes = [
             models.Index(fields=['label', 'bill_number']),
             models.Index(fields=['cluster_keyword']),
-        ]
\ No newline at end of file
+        ]
+
+# 라벨(같은 법의 개정 이력)별 타임라인 – 적재 시 미리 정렬해 저장
+class BillRevisionTimeline(models.Model):
+    label = models.IntegerField(unique=True)
+    # [{id, bill_number, vote_date, title, summary, url, age_number}, ...] (최근 표결 순)
+    entries = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"라벨 {self.label} 타임라인 ({len(self.entries)}건)"
+
+
+# 목록 UI 공용 카드 데이터 (적재 · 좋아요 시 갱신되는 비정규화 읽기 모델)
+class BillCard(models.Model):
+    bill = models.OneToOneField(Bill, on_delete=models.CASCADE, primary_key=True, related_name='card')
+    age_number = models.IntegerField(null=True, blank=True)
+    title = models.CharField(max_length=255)
+    title_custom = models.TextField(blank=True, default='')    # 4어절 뒤 줄바꿈(<br>) 제목
+    bill_number = models.CharField(max_length=100)
+    label = models.IntegerField(null=True, blank=True)
+    cluster = models.IntegerField(null=True, blank=True)
+    cluster_keyword = models.TextField(blank=True, default='')
+    color = models.CharField(max_length=7, default='#67e8f9')  # 클러스터 색상
+    revision_count = models.PositiveIntegerField(default=1)    # 같은 라벨 의안 수
+    is_latest = models.BooleanField(default=True)               # 라벨 내 최신 의안 여부
+    last_vote_date = models.DateField(null=True, blank=True)
+    like_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_latest', '-revision_count']),
+            models.Index(fields=['last_vote_date']),
+            models.Index(fields=['cluster', '-bill_number']),
+        ]
+
+    @property
+    def id(self):
+        return self.bill_id
+
+    def __str__(self):
+        return self.title
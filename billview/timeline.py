@@ -0,0 +1,87 @@
+# billview/timeline.py
+"""
+개정 이력 타임라인
+────────────────────────────────────────────────────────
+같은 label 을 가진 의안들을 (첫 표결일 내림차순, 의안번호 내림차순)으로
+미리 정렬해 BillRevisionTimeline 한 행에 저장한다.
+상세 페이지는 상관 서브쿼리 정렬 대신 이 목록 하나만 읽는다.
+타임라인은 적재(run_pipeline · geovote import_db · rebuild_timelines)에서만 저장하고, 요청 중에는 쓰지 않는다.
+- rebuild_timelines(labels) : 지정 라벨(없으면 전체) 재생성
+- get_timeline(label)       : 저장된 목록 반환 (없으면 저장 없이 즉석 계산)
+"""
+from collections import defaultdict
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Min
+
+from .models import Bill, BillRevisionTimeline
+
+_CHUNK = 500
+
+
+def _build_entries(rows):
+    rows = sorted(
+        rows,
+        key=lambda r: (r["first_vote"] or date(1970, 1, 1), r["bill_number"]),
+        reverse=True,
+    )
+    return [
+        {
+            "id": r["id"],
+            "bill_number": r["bill_number"],
+            "vote_date": r["first_vote"].isoformat() if r["first_vote"] else None,
+            "title": r["title"],
+            "summary": r["summary"] or "",
+            "url": r["url"],
+            "age_number": r["age__number"],
+        }
+        for r in rows
+    ]
+
+
+def _grouped_rows(labels):
+    grouped = defaultdict(list)
+    for row in (
+        Bill.objects.filter(label__in=labels)
+        .values("id", "label", "bill_number", "title", "summary", "url", "age__number")
+        .annotate(first_vote=Min("vote__date"))
+    ):
+        grouped[row["label"]].append(row)
+    return grouped
+
+
+def _rebuild_chunk(labels) -> int:
+    grouped = _grouped_rows(labels)
+
+    with transaction.atomic():
+        BillRevisionTimeline.objects.filter(label__in=labels).delete()
+        BillRevisionTimeline.objects.bulk_create([
+            BillRevisionTimeline(label=label, entries=_build_entries(rows))
+            for label, rows in grouped.items()
+        ])
+    return len(grouped)
+
+
+def rebuild_timelines(labels=None) -> int:
+    """라벨별 타임라인 재생성 → 생성된 라벨 수"""
+    if labels is None:
+        labels = Bill.objects.filter(label__isnull=False).values_list("label", flat=True).distinct()
+    labels = sorted({l for l in labels if l is not None})
+
+    total = 0
+    for i in range(0, len(labels), _CHUNK):
+        total += _rebuild_chunk(labels[i:i + _CHUNK])
+    return total
+
+
+def get_timeline(label) -> list[dict]:
+    entries = (
+        BillRevisionTimeline.objects.filter(label=label)
+        .values_list("entries", flat=True)
+        .first()
+    )
+    if entries is None:
+        # 아직 적재되지 않은 라벨: GET 요청에서 쓰지 않고 같은 방식으로 계산만 한다
+        entries = _build_entries(_grouped_rows([label])[label])
+    return entries
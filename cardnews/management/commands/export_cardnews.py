@@ -0,0 +1,126 @@
+# cardnews/management/commands/export_cardnews.py
+"""
+카드뉴스 정적 내보내기
+────────────────────────────────────────────────────────
+/cardnews/cluster/<n>/ 페이지와 /cardnews/ (기본 · ?cluster=<n>) 화면을
+비로그인 상태로 렌더링해 HTML + .gz 파일로 저장한다.
+nginx 가 로그인 쿠키가 없는 요청에 한해 이 파일을 바로 내려주면 되고,
+좋아요 상태가 필요한 로그인 사용자는 기존 동적 뷰를 그대로 쓴다.
+좋아요로 바뀌는 관심 급상승 목록은 페이지가 /cardnews/api/trending/ 에서 따로 받아 그리므로 파일에 들어가지 않는다.
+클러스터 페이지는 변경된 것만, 메인 화면(home/*, index.html)은 변경이 있으면 전부 다시 렌더링한다.
+
+    python manage.py export_cardnews          # 변경분만
+    python manage.py export_cardnews --all    # 전체 다시 렌더링
+
+출력 구조 (CARDNEWS_EXPORT_ROOT 기준)
+    cardnews/index.html(.gz)                   ← /cardnews/
+    cardnews/home/cluster-<n>.html(.gz)        ← /cardnews/?cluster=<n>
+    cardnews/cluster/<n>/index.html(.gz)       ← /cardnews/cluster/<n>/
+    cardnews/manifest.json                     ← 클러스터별 시그니처
+
+nginx 예시 (로그인 쿠키가 있거나 검색(?keyword=) · 정렬(?sort=controversy)을 요청하면 @django 로 넘김)
+    map $arg_cluster $cardnews_home { "" /cardnews/index.html; default /cardnews/home/cluster-$arg_cluster.html; }
+    location /cardnews/ {
+        root <CARDNEWS_EXPORT_ROOT>;
+        gzip_static on;
+        error_page 418 = @django;
+        if ($http_cookie ~* "sessionid") { return 418; }
+        if ($arg_keyword) { return 418; }
+        if ($arg_sort) { return 418; }
+        location = /cardnews/ { try_files $cardnews_home @django; }
+        try_files $uri $uri/index.html @django;
+    }
+"""
+import gzip
+import json
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max
+from django.test import RequestFactory
+
+from billview.models import Bill
+from cardnews import views as cardnews_v
+
+_CSRF_META = re.compile(rb'[ \t]*<meta name="csrf-token" content="[^"]*">\r?\n?')
+
+
+class Command(BaseCommand):
+    help = "카드뉴스 페이지를 정적 HTML(.gz 포함)로 내보낸다. 기본은 변경된 클러스터만."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="모든 클러스터를 다시 렌더링")
+        parser.add_argument("--output", default=None, help="출력 디렉터리 (기본: CARDNEWS_EXPORT_ROOT)")
+
+    def handle(self, *args, **options):
+        root = Path(options["output"] or settings.CARDNEWS_EXPORT_ROOT) / "cardnews"
+        root.mkdir(parents=True, exist_ok=True)
+        self.factory = RequestFactory()
+
+        # 클러스터별 시그니처 (의안 수 · 최신 의안번호 · 최근 표결일) → 변경 감지
+        signatures = {
+            str(r["cluster"]): f'{r["cnt"]}:{r["last_bn"]}:{r["last_vote"]}'
+            for r in (
+                Bill.objects.filter(cluster__gt=0)
+                .values("cluster")
+                .annotate(cnt=Count("id", distinct=True), last_bn=Max("bill_number"), last_vote=Max("vote__date"))
+            )
+        }
+
+        manifest_path = root / "manifest.json"
+        previous = {}
+        if manifest_path.exists() and not options["all"]:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        changed = [cid for cid, sig in signatures.items() if previous.get(cid) != sig]
+
+        # 클러스터 페이지만 변경분 렌더링
+        for cid in changed:
+            n = int(cid)
+            self._write(root / "cluster" / cid / "index.html",
+                        cardnews_v.cardnews_index(self._request(f"/cardnews/cluster/{n}/"), n))
+
+        # 사라진 클러스터 정리
+        for cid in set(previous) - set(signatures):
+            for path in (root / "cluster" / cid / "index.html", root / "home" / f"cluster-{cid}.html"):
+                for p in (path, path.with_name(path.name + ".gz")):
+                    p.unlink(missing_ok=True)
+
+        # 메인 화면과 home/cluster-<n> 은 헤더 해시태그(상위 · 연관 클러스터)가 다른 클러스터의
+        # 변경에도 바뀌므로, 변경이 하나라도 있으면 전부 다시 렌더링
+        if changed or not (root / "index.html").exists():
+            for cid in signatures:
+                self._write(root / "home" / f"cluster-{cid}.html",
+                            cardnews_v.cardnews_home(self._request("/cardnews/", {"cluster": cid})))
+            self._write(root / "index.html", cardnews_v.cardnews_home(self._request("/cardnews/")))
+
+        self._atomic_write(manifest_path, json.dumps(signatures, ensure_ascii=False).encode("utf-8"))
+        self.stdout.write(self.style.SUCCESS(
+            f"카드뉴스 내보내기 완료: 클러스터 {len(changed)}/{len(signatures)}개 갱신 → {root}"
+        ))
+
+    # ---------- 내부 util ----------
+    def _request(self, path, data=None):
+        request = self.factory.get(path, data or {})
+        request.user = AnonymousUser()
+        return request
+
+    def _write(self, path: Path, response):
+        if response.status_code != 200:
+            self.stderr.write(f"건너뜀 ({response.status_code}): {path}")
+            return
+        # 파일은 여러 방문자가 공유하므로 렌더링 시점의 CSRF 토큰은 빼 둠 (좋아요는 로그인 사용자 = 동적 뷰)
+        body = _CSRF_META.sub(b"", response.content)
+        self._atomic_write(path, body)
+        self._atomic_write(path.with_name(path.name + ".gz"), gzip.compress(body, compresslevel=9))
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
@@ -7,6 +7,7 @@ app_name = 'cardnews'
 urlpatterns = [
     path('', views.cardnews_home, name='home'),
     path('cluster/<int:cluster_number>/', views.cardnews_index, name='card'),
+    path('api/trending/', views.trending_api, name='trending_api'),
     path('toggle_like/<int:bill_id>/', views.toggle_like, name='toggle_like'), # 좋아요 기능
     path('api/like/<int:bill_id>/', views.toggle_like, name='toggle_like_api'), # 미로그인 좋아요 버튼 차단
 ]
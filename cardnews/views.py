@@ -2,17 +2,21 @@
 from django.shortcuts import render, redirect
 from django.urls import reverse
 from django.core.cache import cache
-from django.db.models import Count, Max
+from django.db.models import Count, F
+from billview.cards import adjust_like_count, get_cards
 from billview.models import Bill
 from geovote.models import Vote
 
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.http import require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET, require_POST
 
 from accounts.models import BillLike
+from main.data_version import get_data_version
+from main import trending
 
-import random, logging, urllib.parse
+import logging, urllib.parse
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,7 @@ PALETTE = [
 
 _DICT_CACHE = 60 * 60           # 1시간
 _QS_CACHE   = 60 * 5            # 5분
+_CARD_CACHE = 60 * 60 * 24      # 1일 (카드 조각, 데이터 버전이 바뀌면 자동 무효화)
 
 # ─────────────────── helper ───────────────────
 def _cluster_kw_str()  -> dict[int, str]:
@@ -131,6 +136,8 @@ def cardnews_home(request):
         'cluster_keywords_dict' : kw_str_dict,
         'cluster_color_map'     : _color_map(),
         'total_cluster_count'   : len(kw_str_dict),
+        'data_version'          : get_data_version(),
+        'card_cache_timeout'    : _CARD_CACHE,
     }
 
     # ── 헤더 해시태그 결정 --------------------
@@ -148,13 +155,31 @@ def cardnews_home(request):
         ctx['top_clusters'] = matched
 
     else:                                               # 메인 화면
-        tc = _top_clusters().copy()
-        random.shuffle(tc)
-        ctx['top_clusters'] = tc
+        # 순서 섞기는 브라우저에서 (정적 내보내기 파일도 매번 같은 내용이 되도록)
+        ctx['top_clusters'] = _top_clusters()
+        ctx['shuffle_clusters'] = True
     # ------------------------------------------
 
     return render(request, 'cardnews_home.html', ctx)
 
+# ─────────────────── 관심 급상승 법안 (JSON) ───────────────────
+# /cardnews/ 는 정적 파일(export_cardnews)로도 나가므로, 좋아요로 바뀌는 목록은 페이지가 따로 받아 그린다
+TRENDING_COUNT = 8
+TRENDING_MAX_AGE = 60
+
+@require_GET
+@cache_control(public=True, max_age=TRENDING_MAX_AGE)
+def trending_api(request):
+    bills = [
+        {
+            'id': bill.id,
+            'title': bill.title,
+            'url': reverse('cardnews:card', args=[bill.cluster]) if bill.cluster else None,
+        }
+        for bill in trending.top_bills(TRENDING_COUNT)
+    ]
+    return JsonResponse({'bills': bills}, json_dumps_params={'ensure_ascii': False})
+
 # ─────────────────── 클러스터 해시태그용 리다이렉트 ───────────────────
 def card_index(request, cluster_number: int):
     """
@@ -187,7 +212,11 @@ def toggle_like(request, bill_id):
 
     if not created:
         liked.delete()
+        trending.record_unlike(bill, liked.created_at)
+        adjust_like_count(bill.id, -1)
         return JsonResponse({'liked': False})
+    trending.record_like(bill, liked.created_at)
+    adjust_like_count(bill.id, 1)
     return JsonResponse({'liked': True})
 
 # 카드 뉴스
@@ -203,10 +232,15 @@ def cardnews_index(request, cluster_number):
             'error': '유효하지 않은 클러스터 번호입니다.'
         })
     
-    bills = Bill.objects.filter(cluster=cluster_number).annotate(
-        latest_vote_date=Max('vote__date')  # Vote 모델에서 Bill FK 필드명은 vote__date
-    ).only('pk', 'card_news_content', 'cluster_keyword', 'label'
-    ).order_by('-bill_number')
+    # sort=controversy 면 저장된 논쟁 지수 순 (클러스터 · 점수 인덱스)
+    sort = request.GET.get('sort', '')
+    ordering = (
+        (F('controversy__score').desc(nulls_last=True), '-bill_number')
+        if sort == 'controversy' else ('-bill_number',)
+    )
+    bills = Bill.objects.filter(cluster=cluster_number).only(
+        'pk', 'title', 'bill_number', 'card_news_content', 'cluster_keyword', 'label'
+    ).order_by(*ordering)
     
     keyword_set = set()
     for kw_str in bills.values_list('cluster_keyword', flat=True):
@@ -239,6 +273,12 @@ def cardnews_index(request, cluster_number):
             unique_bills.append(bill)
             seen_contents.add(bill.card_news_content)
 
+    # 최근 표결일은 BillCard 에서 (카드 템플릿의 latest_vote_date)
+    cards = get_cards(bill.id for bill in unique_bills)
+    for bill in unique_bills:
+        card = cards.get(bill.id)
+        bill.latest_vote_date = card.last_vote_date if card else None
+
     # 중복 없는 라벨 목록 만들기
     labels = sorted({bill.label for bill in bills if bill.label})
 
@@ -258,7 +298,11 @@ def cardnews_index(request, cluster_number):
         'cluster_bills': unique_bills,
         'label_color_map': label_color_map,
         'cluster_bill_count': bills.count(),
+        'sort': sort,
         'google_news_url': google_news_url,
         'liked_ids': list(liked_ids),
+        # 카드 조각 캐시 (좋아요 상태는 liked_ids 로 클라이언트에서 덧입힘)
+        'data_version': get_data_version(),
+        'card_cache_timeout': _CARD_CACHE,
     }
     return render(request, 'cardnews.html', context)
\ No newline at end of file
@@ -0,0 +1,20 @@
+# dashboard/management/commands/refresh_dashboard_snapshots.py
+"""
+대시보드 스냅샷(DashboardSnapshot) 재생성
+
+    python manage.py refresh_dashboard_snapshots [--congress 22]
+"""
+from django.core.management.base import BaseCommand
+
+from dashboard.snapshot import refresh_snapshots
+
+
+class Command(BaseCommand):
+    help = "대수별 대시보드 컨텍스트를 다시 조립해 저장한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--congress", type=int, action="append", help="지정 대수만 (여러 번 사용 가능)")
+
+    def handle(self, *args, **options):
+        count = refresh_snapshots(options["congress"])
+        self.stdout.write(self.style.SUCCESS(f"대시보드 스냅샷 {count}건 갱신"))
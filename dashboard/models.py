@@ -1,3 +1,11 @@
 from django.db import models
 
-# Create your models here.
+
+# 대수별 대시보드 스냅샷 (main/import_db.run_all 이 조립된 컨텍스트를 JSON 으로 저장)
+class DashboardSnapshot(models.Model):
+    congress_num = models.PositiveSmallIntegerField(unique=True)
+    context = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.congress_num}대 대시보드 스냅샷"
@@ -0,0 +1,187 @@
+# dashboard/snapshot.py
+"""
+대시보드 스냅샷 · 섹션
+────────────────────────────────────────────────────────
+대시보드 통계는 main/import_db.run_all 이 돌 때만 바뀐다.
+화면은 빈 셸을 먼저 그리고 섹션별 JSON(정당 표결 · 권력 집중도 · 시계열 · 옵션 · 논쟁 지수)을
+병렬로 받아 채우므로, 데이터도 섹션 단위로 만들고 캐시한다.
+적재 직후에는 대수별로 모든 섹션을 DashboardSnapshot 한 행(JSON)에 저장해 두고,
+섹션 API 는 그 행에서 자기 몫만 잘라 쓴다. 스냅샷이 없으면 해당 섹션만 계산한다.
+표결 적재(run_pipeline)로 바뀌는 LIVE_SECTIONS 는 스냅샷에 넣지 않고 bills 데이터 버전으로 캐시한다.
+- SECTIONS                 : {섹션 이름: 빌더}
+- build_context(n)         : 스냅샷 섹션 조립 (통계 없으면 None)
+- refresh_snapshots(nums)  : 스냅샷 재생성 (None 이면 통계가 있는 모든 대수)
+- section_version(name)    : 섹션 캐시 · ETag 에 쓰는 데이터 버전
+- get_section(n, name)     : 섹션 JSON (데이터 버전 키로 캐시)
+"""
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.urls import reverse
+
+from main import controversy
+from main.data_version import BILLS, STATS, get_data_version
+from main.models import AgeStats, ClusterSummary
+from . import views as dashboard_v
+from .models import DashboardSnapshot
+
+CACHE_SEC = 60 * 60
+
+
+def _to_json(value):
+    """defaultdict · mark_safe 문자열 등을 DB(JSONField)에서 읽은 것과 같은 순수 JSON 값으로"""
+    return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+
+
+# ---------- 섹션 빌더 ----------
+def _party_section(congress_num):
+    """정당별 표결 비율 + 상단 통계 카드"""
+    data = dashboard_v.get_partyStats_data(congress_num)
+    return {
+        'party_names': data['party_names'],
+        'party_colors': data['party_colors'],
+        'series': json.loads(data['series']),
+        'categories': json.loads(data['categories']),
+        'total_votes': data['total_votes'],
+        'total_bills': data['total_bills'],
+        'total_parties': data['total_parties'],
+        'gender_ratio': data['gender_ratio'],
+    }
+
+
+def _concentration_section(congress_num):
+    """양당 점유율 · HHI · ENP"""
+    data = dashboard_v.get_partyConcentration_data(congress_num)
+    return {
+        'party_names': data.get('party_names', []),
+        'member_counts': data.get('member_counts', []),
+        'top2_seat_shares': data.get('top2_seat_shares', []),
+        'top2_ratio': data.get('top2_ratio'),
+        'top2_detail': data.get('top2_datail', []),
+        'hhi': data.get('hhi'),
+        'enp': data.get('enp'),
+    }
+
+
+def _timeseries_section(congress_num):
+    """대수별 권력 집중도 시계열 (전 대수 공통)"""
+    return dashboard_v.get_concentration_timeseries()
+
+
+def _options_section(congress_num):
+    """정당별 특이 클러스터 옵션 (반대 · 기권 모두) + 첫 옵션 차트"""
+    cluster_options = dashboard_v.get_cluster_options(congress_num)
+    default_cluster = cluster_options[0]['cluster_num'] if cluster_options else None
+    return {
+        'cluster_options': cluster_options,
+        'default_cluster_num': default_cluster,
+        'cluster_chart_data': dashboard_v.get_cluster_chart_data(congress_num, default_cluster),
+    }
+
+
+def _controversy_section(congress_num):
+    """논쟁 지수 상위 의안(해당 대수) · 클러스터"""
+    top_clusters = controversy.top_clusters(8)
+    keywords = dict(
+        ClusterSummary.objects.filter(cluster_num__in=[c.cluster_num for c in top_clusters])
+        .values_list('cluster_num', 'keyword')
+    )
+    return {
+        'bills': [
+            {
+                'bill_id': item.bill_id,
+                'title': item.bill.title,
+                'cluster': item.cluster,
+                'score': round(item.score, 3),
+                'split_ratio': round(item.split_ratio * 100, 1),
+                'party_divergence': round(item.party_divergence, 3),
+                'url': reverse('history:bill_detail', args=[item.bill_id]),
+            }
+            for item in controversy.top_bills(10, age_number=congress_num)
+        ],
+        'clusters': [
+            {
+                'cluster_num': c.cluster_num,
+                'keyword': (keywords.get(c.cluster_num) or '').split(',')[0].strip(),
+                'score': round(c.score, 3),
+                'bill_count': c.bill_count,
+                'url': reverse('cardnews:card', args=[c.cluster_num]) + '?sort=controversy',
+            }
+            for c in top_clusters
+        ],
+    }
+
+
+SECTIONS = {
+    'party': _party_section,
+    'concentration': _concentration_section,
+    'timeseries': _timeseries_section,
+    'options': _options_section,
+    'controversy': _controversy_section,
+}
+# 표결 파이프라인이 갱신하는 섹션 (스냅샷 제외, bills 버전으로 캐시)
+LIVE_SECTIONS = {'controversy'}
+SNAPSHOT_SECTIONS = {name: builder for name, builder in SECTIONS.items() if name not in LIVE_SECTIONS}
+
+
+def _has_stats(congress_num) -> bool:
+    return AgeStats.objects.filter(age__number=congress_num).exists()
+
+
+def build_context(congress_num: int):
+    """대수별 스냅샷 섹션 {'congress_num', 섹션 이름: 섹션 JSON, ...}, 통계가 없으면 None"""
+    if not _has_stats(congress_num):
+        return None
+    context = {name: builder(congress_num) for name, builder in SNAPSHOT_SECTIONS.items()}
+    return _to_json({'congress_num': congress_num, **context})
+
+
+# ---------- 스냅샷 ----------
+def refresh_snapshots(congress_nums=None) -> int:
+    """스냅샷 재생성 → 저장한 대수 수 (시계열은 전 대수를 담으므로 기본은 전체 갱신)"""
+    if congress_nums is None:
+        congress_nums = AgeStats.objects.values_list('age__number', flat=True)
+
+    saved = 0
+    for num in congress_nums:
+        context = build_context(num)
+        if context is None:
+            continue
+        DashboardSnapshot.objects.update_or_create(congress_num=num, defaults={'context': context})
+        saved += 1
+    return saved
+
+
+def section_version(section) -> int:
+    return get_data_version(BILLS if section in LIVE_SECTIONS else STATS)
+
+
+def _section_cache_key(congress_num, section) -> str:
+    # 섹션 캐시는 데이터 버전을 키에 포함 → 적재 스크립트가 버전을 올리면 자동 무효화
+    return f"dashboard_section:{section_version(section)}:{congress_num}:{section}"
+
+
+def _section_from_db(congress_num, section):
+    """스냅샷 행에서 섹션을 잘라 오고, 없으면 그 섹션만 계산 (통계 없으면 None)"""
+    context = (
+        DashboardSnapshot.objects.filter(congress_num=congress_num)
+        .values_list('context', flat=True).first()
+    )
+    if context and section in context:
+        return context[section]
+    if not _has_stats(congress_num):
+        return None
+    return _to_json(SECTIONS[section](congress_num))
+
+
+def get_section(congress_num: int, section: str):
+    key = _section_cache_key(congress_num, section)
+    data = cache.get(key)
+    if data is None:
+        data = _section_from_db(congress_num, section)
+        if data is None:
+            return None
+        cache.set(key, data, CACHE_SEC)
+    return data
+
@@ -7,5 +7,8 @@ app_name = "dashboard"   # 네임스페이스 ─ {% url 'dashboard:dashboard' 2
 urlpatterns = [
     path('<int:congress_num>/', dashboard_v.dashboard, name='dashboard'),
     path('power/<int:congress_num>/', dashboard_v.power, name='power'),
+    path('api/<int:congress_num>/section/<str:section>/', dashboard_v.section_api, name='section_api'),
+    path('api/<int:congress_num>/agreement/', dashboard_v.party_agreement_api, name='party_agreement_api'),
     path('api/cluster_chart/',  dashboard_v.cluster_chart_api, name='cluster_chart_api'),
+    path('api/cluster_chart/batch/', dashboard_v.cluster_chart_batch_api, name='cluster_chart_batch_api'),
 ]
@@ -1,12 +1,21 @@
 from django.shortcuts import render, get_object_or_404
 from django.utils.safestring import mark_safe
-from django.db.models import Count, Min, Sum, Max, Q, F, FloatField, ExpressionWrapper
+from django.db.models import Count, Sum, Max, Q, F, FloatField, ExpressionWrapper
 from collections import Counter, defaultdict
-from geovote.models import Vote, Member, Party, Age
-from billview.models import Bill
-from main.models import AgeStats, PartyClusterStats, ClusterKeyword, PartyConcentration
-from django.http import JsonResponse
+from geovote.models import Member, Party, Age
+from main.models import AgeStats, PartyStats, PartyClusterStats, ClusterKeyword, ClusterSummary, PartyConcentration, PartyDistinctCluster
+from main.vote_counts import party_vote_counts
+from main import concentration_timeseries, party_agreement
+from django.http import Http404, JsonResponse
+from django.core.cache import cache
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from main.data_version import BILLS, STATS, get_data_version
+import hashlib
 import json
+import math
+
+from . import snapshot as dashboard_snapshot
 
 
 result_types = ['찬성', '반대', '기권', '불참']
@@ -20,97 +29,58 @@ def get_partyStats_data(congress_num):
             'error': f'{congress_num}대에 해당하는 Age 객체가 없습니다'
             }
 
-    # 인스턴스
-    votes = Vote.objects.filter(age__number=congress_num).select_related('member__party')
     age_stats = AgeStats.objects.get(age=ages)
 
     # 저장할 리스트 생성
     result_types = ['찬성', '반대', '기권', '불참']
     categories = result_types
 
-    # series = []
-    # result_data = {r: [] for r in result_types}
-    # party_names = []
-    # party_colors = []
-
-    # 모든 대수 공통: 멤버 수 기준 상위 8개 정당만 필터링
-    top_parties = (
-        Member.objects
+    # 모든 대수 공통: 멤버 수 기준 상위 8개 정당만 (적재된 PartyStats 비율 사용)
+    party_stats = list(
+        PartyStats.objects
         .filter(age=ages)
-        .values('party', 'party__party', 'party__color')
-        .annotate(member_count=Count('id'))
+        .select_related('party')
         .order_by('-member_count')[:8]
     )
-
-    top_party_ids = [p['party'] for p in top_parties]
-    party_id_to_name_color = {
-        p['party']: (p['party__party'], p['party__color'])
-        for p in top_parties
-    }
-    # parties = Party.objects.filter(id__in=top_party_ids)  # 실제 정당 객체 리스트
-
-    # 딕셔너리 매핑
-    # party_id_to_name_color = {
-    #     p['party']: (p['party__party'], p['party__color'])
-    #     for p in top_parties
-    # }
-
-    # 표결별 집계
-    vote_counts = votes.filter(
-        member__party__id__in=top_party_ids
-        ).values(
-            'member__party', 'result'
-        ).annotate(
-            count=Count('id')
-        )
-    # 정당별 총 표결수
-    total_counts = votes.filter(
-        member__party__id__in=top_party_ids
-        ).values(
-            'member__party'
-        ).annotate(
-            total=Count('id')
+    if party_stats:
+        rows = [
+            (
+                ps.party.party,
+                ps.party.color,
+                [ps.support_ratio, ps.oppose_ratio, ps.abstain_ratio, ps.absent_ratio],
+                ps.total_votes,
+            )
+            for ps in party_stats
+        ]
+    else:
+        # PartyStats 적재 전: 조건부 집계 한 번으로 즉석 재집계
+        top_parties = (
+            Member.objects
+            .filter(age=ages)
+            .values('party', 'party__party', 'party__color')
+            .annotate(member_count=Count('id'))
+            .order_by('-member_count')[:8]
         )
-    # dict 변환
-    # party_total_dict = {entry['member__party']: entry['total'] for entry in total_counts}
-    # party_result_dict = defaultdict(dict)
-    # for entry in vote_counts:
-    #     party_id = entry['member__party']
-    #     result = entry['result']
-    #     count = entry['count']
-    #     party_result_dict[party_id][result] = count
-
-    # 정당별 총 표결 수
-    total_counts = defaultdict(int)
-    party_result_dict = defaultdict(lambda: defaultdict(int))
-    for entry in vote_counts:
-        party_id = entry['member__party']
-        result = entry['result']
-        count = entry['count']
-        total_counts[party_id] += count
-        party_result_dict[party_id][result] += count
-
-    # 결과 구성
+        counts_map = party_vote_counts(ages, [p['party'] for p in top_parties])
+        rows = []
+        for p in top_parties:
+            counts = counts_map.get(p['party'], {})
+            total = counts.get('total', 0)
+            rows.append((
+                p['party__party'],
+                p['party__color'],
+                [counts.get(r, 0) / total * 100 if total else 0 for r in result_types],
+                total,
+            ))
+
+    # 최종 정당별 시리즈 구성
     series = []
     party_names = []
     party_colors = []
-
-    # 최종 정당별 시리즈 구성
-    for party_id in top_party_ids:
-        party_name, color = party_id_to_name_color[party_id]
-        total = total_counts[party_id]
-        proportions = [
-            round(party_result_dict[party_id].get(r, 0) / total * 100, 1) if total else 0
-            for r in result_types
-        ]
-        # proportions = {
-        #     r: (party_result_dict[party_id].get(r, 0) / total * 100 if total else 0)
-        #     for r in result_types
-        # }
-
+    for party_name, color, ratios, _ in rows:
         series.append({
             'name': party_name,
-            'data': proportions
+            'data': [round(ratio, 1) for ratio in ratios]
         })
         party_names.append(party_name)
         party_colors.append(color)
@@ -128,7 +98,7 @@ def get_partyStats_data(congress_num):
         'series': mark_safe(json.dumps(series)),
         'categories': mark_safe(json.dumps(result_types)),
 
-        'total_votes': sum(total_counts.values()),
+        'total_votes': sum(total for *_, total in rows),
         'total_bills': age_stats.total_bills,
         'total_parties': age_stats.total_parties,
 
@@ -144,13 +114,7 @@ def get_partyClusterStats_data(congress_num, top_n_clusters=20):
     age = get_object_or_404(Age, number=congress_num)
 
     # 클러스터별 전체 요약 불러오기
-    top_parties = (
-        PartyClusterStats.objects
-        .filter(age=age)
-        .values('party', 'party__party', 'party__color')
-        .annotate(member_count=Count('id'))
-        .order_by('-member_count')[:8]
-    )
+    top_parties = get_top_parties(age)
     party_names = [p['party__party'] for p in top_parties]
     party_colors = [p['party__color'] for p in top_parties]
     top_party_ids = [p['party'] for p in top_parties]
@@ -229,7 +193,7 @@ def get_partyConcentration_data(congress_num):
             'error': f'{congress_num}대에 해당하는 Age 객체가 없습니다'
         }
     
-    data = PartyConcentration.objects.filter(age=ages).order_by('rank')
+    data = list(PartyConcentration.objects.filter(age=ages).select_related('party').order_by('rank'))
 
     party_names = [pc.party.party for pc in data]
     member_counts = [pc.member_count for pc in data]
@@ -237,8 +201,8 @@ def get_partyConcentration_data(congress_num):
     # 상위 2개 당
     top2_data = data[:2]
     top2_ratio = sum([pc.seat_share for pc in top2_data])
-    hhi = AgeStats.objects.get(age=ages).hhi
-    enp = AgeStats.objects.get(age=ages).enp
+    age_stats = AgeStats.objects.only('hhi', 'enp').get(age=ages)
+    hhi, enp = age_stats.hhi, age_stats.enp
 
     top2_datail = [
         {
@@ -260,40 +224,21 @@ def get_partyConcentration_data(congress_num):
         'age': ages,
     }
 
-# 시계열 차트
+# 시계열 차트 (적재 시 만든 전 대수 롤업 한 번 조회)
 def get_concentration_timeseries():
-    age_objs = Age.objects.all().order_by('number')
-    
-    ages = []
-    total_parties = []
-    hhi_values = [] # hhi 시계열
-    enp_values = [] # enp 시계열
-    top2_seat_shares_series = []  # 양당 점유율 시계열
+    return concentration_timeseries.get_timeseries()
 
-    for age in age_objs:
-        try:
-            stats = AgeStats.objects.get(age=age)
-        except AgeStats.DoesNotExist:
-            continue
-
-        top2 = PartyConcentration.objects.filter(age=age).order_by('rank')[:2]
-        top2_ratio = sum([pc.seat_share for pc in top2])
-
-        ages.append(f"{age.number}대")
-        total_parties.append(stats.total_parties)
-        hhi_values.append(round(stats.hhi, 4))
-        enp_values.append(round(stats.enp, 4))
-        top2_seat_shares_series.append(round(top2_ratio, 2))
-    
-    return {
-        'ages': ages,
-        'total_parties': total_parties,
-        'hhi_values': hhi_values,
-        'enp_values': enp_values,
-        'top2_seat_shares_series': top2_seat_shares_series,
-    }
+# 상위 8개 정당 (PartyClusterStats 행 수 기준 ─ 클러스터 차트 · 옵션 · 일치율이 모두 같은 정당 목록을 씀)
+def get_top_parties(age, limit=8):
+    return list(
+        PartyClusterStats.objects
+        .filter(age=age)
+        .values('party', 'party__party', 'party__color')
+        .annotate(member_count=Count('id'))
+        .order_by('-member_count')[:limit]
+    )
 
-# 정당별 특이 클러스트 차트 옵션 데이터 생성
+# 정당별 특이 클러스트 차트 옵션 데이터 생성 (import_partyClusterStats 가 채운 1위 클러스터)
 def get_cluster_options(age_num, stance_filter=None):
     age = get_object_or_404(Age, number=age_num)
 
@@ -302,87 +247,75 @@ def get_cluster_options(age_num, stance_filter=None):
     if stance_filter in stances:
         stances = [stance_filter]
 
-    field_map = {
-        'oppose': 'oppose_ratio',
-        'abstain': 'abstain_ratio',
-    }
-
     # 한글 표시용 매핑
     stance_display_map = {
         'oppose': '반대',
         'abstain': '기권',
     }
 
-    cluster_keyword_map = {}
-    keywords_raw = ClusterKeyword.objects.filter(age=age)
-    for ck in keywords_raw:
-        try:
-            keyword_list = json.loads(ck.keyword_json)
-            keyword_display = ', '.join(keyword_list)
-        except:
-            keyword_display = ck.keyword_json
-        cluster_keyword_map[ck.cluster_num] = keyword_display
+    # 상위 8개 정당 순서대로
+    party_order = {p['party']: i for i, p in enumerate(get_top_parties(age))}
 
-    # 상위 8개 정당명 집합
-    top_parties = (
-        PartyClusterStats.objects
-        .filter(age=age)
-        .values('party__party')
-        .annotate(member_count=Count('id'))
-        .order_by('-member_count')[:8]
+    rows = (
+        PartyDistinctCluster.objects
+        .filter(age=age, rank=1, stance__in=stances, party_id__in=list(party_order))
+        .select_related('party')
     )
-    top_party_names = {p['party__party'] for p in top_parties}
-
-    # stats 쿼리셋 필터링
-    stats = PartyClusterStats.objects.filter(age=age).select_related('party').only(
-        'cluster_num', 'oppose_ratio', 'abstain_ratio', 'party', 'party__party',
-        )
-
-    # 정당별, stance별로 가장 높은 하나의 클러스터만 선택
-    party_stance_clusters = defaultdict(dict)
-
-    for stat in stats:
-        party_name = stat.party.party
-        if party_name not in top_party_names:
-            continue
-        for stance in stances:
-            field_name = field_map[stance]
-            ratio = getattr(stat, field_name)
-
-            current_best = party_stance_clusters[party_name].get(stance)
-            if current_best is None or ratio > current_best['ratio']:
-                party_stance_clusters[party_name][stance] = {
-                    'cluster_num': stat.cluster_num,
-                    'ratio': ratio
-                }
+    rows = sorted(rows, key=lambda r: (party_order[r.party_id], stances.index(r.stance)))
 
     # 옵션 생성
     options = []
-    for party, stance_map in party_stance_clusters.items():
-        for stance, c in stance_map.items():
-            cluster_num = c['cluster_num']
-            keyword = cluster_keyword_map.get(cluster_num, '')
-            # 옵션 텍스트
-            text = f"{party} - {stance_display_map[stance]} - 클러스터 {cluster_num} ({keyword})"
-            # 옵션 value는 나중에 파싱하기 좋게
-            value = f"{party}--{stance}--{cluster_num}"
-            # 카드뉴스 URL
-            cardnews_url = f"/cardnews/cluster/{cluster_num}/"
-
-            options.append({
-                'value': value,
-                'text': text,
-                'keyword': keyword,
-                'cluster_num': cluster_num,
-                'party': party,
-                'stance': stance,
-                'stance_display': stance_display_map[stance],  # 한글 값
-                'cardnews_url': cardnews_url,
-                })
+    for row in rows:
+        party = row.party.party
+        stance = row.stance
+        cluster_num = row.cluster_num
+        keyword = row.keyword
+        # 옵션 텍스트
+        text = f"{party} - {stance_display_map[stance]} - 클러스터 {cluster_num} ({keyword})"
+        # 옵션 value는 나중에 파싱하기 좋게
+        value = f"{party}--{stance}--{cluster_num}"
+        # 카드뉴스 URL
+        cardnews_url = f"/cardnews/cluster/{cluster_num}/"
+
+        options.append({
+            'value': value,
+            'text': text,
+            'keyword': keyword,
+            'cluster_num': cluster_num,
+            'party': party,
+            'stance': stance,
+            'stance_display': stance_display_map[stance],  # 한글 값
+            'cardnews_url': cardnews_url,
+            })
 
     return options
 
+# 클러스터 차트 캐시 (stats 데이터 버전이 바뀌면 자동 무효화)
+CHART_CACHE_SEC = 60 * 60
+CHART_MAX_AGE = 60 * 5
+CHART_BATCH_LIMIT = 50
+
+def get_cached_cluster_chart(congress_num, cluster_num):
+    key = f"cluster_chart:{get_data_version(STATS)}:{congress_num}:{cluster_num}"
+    data = cache.get(key)
+    if data is None:
+        data = get_cluster_chart_data(congress_num, cluster_num)
+        cache.set(key, data, CHART_CACHE_SEC)
+    return data
+
+def _stats_etag(request, *args, **kwargs):
+    """stats 데이터 버전 + 요청 경로 · 파라미터 → ETag"""
+    raw = f"{get_data_version(STATS)}|{request.get_full_path()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def _section_etag(request, congress_num, section):
+    """섹션 데이터 버전(stats · bills) + 요청 경로 → ETag"""
+    raw = f"{dashboard_snapshot.section_version(section)}|{request.get_full_path()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
 # cluster_api
+@cache_control(public=True, max_age=CHART_MAX_AGE)
+@condition(etag_func=_stats_etag)
 def cluster_chart_api(request):
     value = request.GET.get('cluster_value')  # "당--입장--클러스터번호" 형식
     age_num = request.GET.get('age_num')
@@ -407,10 +340,88 @@ def cluster_chart_api(request):
         except (IndexError, ValueError):
             return JsonResponse({'error': 'Invalid number format'}, status=400)
 
-    chart_data = get_cluster_chart_data(age_num, cluster_num, party=party, stance=stance)
+    chart_data = get_cached_cluster_chart(age_num, cluster_num)
     return JsonResponse(chart_data)
 
 
+# cluster_api 묶음 요청: ?pairs=22:3,22:15 → {"charts": {"22:3": {...}, "22:15": {...}}}
+@cache_control(public=True, max_age=CHART_MAX_AGE)
+@condition(etag_func=_stats_etag)
+def cluster_chart_batch_api(request):
+    raw_pairs = [p for p in request.GET.get('pairs', '').split(',') if p]
+    if not raw_pairs or len(raw_pairs) > CHART_BATCH_LIMIT:
+        return JsonResponse({'error': 'Invalid parameters'}, status=400)
+
+    pairs = []
+    for raw in raw_pairs:
+        try:
+            age_num, cluster_num = (int(x) for x in raw.split(':'))
+        except ValueError:
+            return JsonResponse({'error': 'Invalid number format'}, status=400)
+        pairs.append((age_num, cluster_num))
+
+    valid_ages = set(Age.objects.filter(number__in={a for a, _ in pairs}).values_list('number', flat=True))
+    charts = {
+        f"{age_num}:{cluster_num}": (
+            get_cached_cluster_chart(age_num, cluster_num) if age_num in valid_ages else None
+        )
+        for age_num, cluster_num in pairs
+    }
+    return JsonResponse({'charts': charts})
+
+
+# 정당 × 정당 표결 일치율 히트맵 (main/party_agreement.py 가 저장한 행렬, 상위 8개 정당)
+def get_party_agreement_data(congress_num, cluster_num=None):
+    age = get_object_or_404(Age, number=congress_num)
+    top_parties = [p for p in get_top_parties(age) if p['party'] is not None]
+    matrix = party_agreement.get_matrix(age, cluster_num, party_ids=[p['party'] for p in top_parties])
+    rates = party_agreement.agreement_rate(matrix['agree'], matrix['common'])
+
+    cluster_rows = party_agreement.clusters(age)
+    keywords = dict(
+        ClusterSummary.objects.filter(cluster_num__in=[c for c, _ in cluster_rows])
+        .values_list('cluster_num', 'keyword')
+    )
+    return {
+        'cluster_num': cluster_num,
+        'bill_count': matrix['bill_count'],
+        'parties': [p['party__party'] for p in top_parties],
+        'party_colors': [p['party__color'] for p in top_parties],
+        'rates': [[None if math.isnan(v) else round(v * 100, 1) for v in row] for row in rates.tolist()],
+        'pairs': matrix['common'].tolist(),
+        'clusters': [
+            {
+                'cluster_num': c,
+                'bill_count': count,
+                'keyword': (keywords.get(c) or '').split(',')[0].strip(),
+            }
+            for c, count in cluster_rows
+        ],
+    }
+
+def _agreement_etag(request, congress_num):
+    """일치 행렬은 표결 적재(bills)와 통계 적재(stats) 모두에서 바뀐다"""
+    raw = f"{get_data_version(STATS)}:{get_data_version(BILLS)}|{request.get_full_path()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+# ?cluster=15 → 해당 클러스터, 없으면 대수 전체 (클러스터 행렬 합)
+@cache_control(public=True, max_age=CHART_MAX_AGE)
+@condition(etag_func=_agreement_etag)
+def party_agreement_api(request, congress_num):
+    cluster = request.GET.get('cluster')
+    try:
+        cluster_num = int(cluster) if cluster else None
+    except ValueError:
+        return JsonResponse({'error': 'Invalid number format'}, status=400)
+
+    key = f"party_agreement:{get_data_version(STATS)}:{get_data_version(BILLS)}:{congress_num}:{cluster_num}"
+    data = cache.get(key)
+    if data is None:
+        data = get_party_agreement_data(congress_num, cluster_num)
+        cache.set(key, data, CHART_CACHE_SEC)
+    return JsonResponse(data)
+
+
 # 당별 찬/반 가장 많은 클러스터 무엇인지 차트
 def get_cluster_chart_data(congress_num, cluster_num, party=None, stance=None):
     """
@@ -420,13 +431,7 @@ def get_cluster_chart_data(congress_num, cluster_num, party=None, stance=None):
     age = get_object_or_404(Age, number=congress_num)
 
     # 상위 8개 정당 추출 (클러스터 무관, 전체 통계 기준)
-    top_parties = (
-        PartyClusterStats.objects
-        .filter(age=age)
-        .values('party', 'party__party', 'party__color')
-        .annotate(member_count=Count('id'))
-        .order_by('-member_count')[:8]
-    )
+    top_parties = get_top_parties(age)
     top_party_ids = [p['party'] for p in top_parties]
     party_info_map = {p['party']: {'name': p['party__party'], 'color': p['party__color']} for p in top_parties}
 
@@ -485,149 +490,34 @@ def get_cluster_chart_data(congress_num, cluster_num, party=None, stance=None):
     }
 
 
-# dashboard.html로 보내는 함수
-def dashboard(request, congress_num):
-    # 대수 필터링
-    if congress_num not in [20, 21, 22]: # 유효하지 않은 링크 처리
-        raise Http404("Invalid congress num")
-
-    party_data = get_partyStats_data(congress_num)
-    cluster_vote_data = get_partyClusterStats_data(congress_num, top_n_clusters=10)
-    party_concentration_data = get_partyConcentration_data(congress_num)
-    timeseries_data = get_concentration_timeseries()
-
-    selected_stance = request.GET.get('stance')
-    selected_value = request.GET.get('cluster_value')  # 예: "더불어민주당--oppose--13"
-    cluster_options = get_cluster_options(congress_num, stance_filter=selected_stance)
+# 셸 페이지: 통계 유무만 확인하고 빈 컨테이너를 렌더링 → 섹션은 section_api 로 병렬 요청
+VALID_CONGRESS = [20, 21, 22]
 
-    # stance 필드 추가
-    for option in cluster_options:
-        try:
-            option['stance'] = option['value'].split('--')[1]
-        except IndexError:
-            option['stance'] = None  # 혹시 split 실패해도 안전하게
-
-    cluster_num = None
-    if selected_value:
-        try:
-            cluster_num = int(selected_value.split('--')[-1])
-        except (IndexError, ValueError):
-            cluster_num = None
-    if cluster_num is None and cluster_options:
-        first_value = cluster_options[0]['value']  # "당--찬성--22"
-        cluster_num = int(first_value.split('--')[-1])
-
-    # 4. 차트 데이터 생성
-    cluster_chart_data = get_cluster_chart_data(congress_num, cluster_num)
-
-    # AgeStats 정보
-    try:
-        age = Age.objects.get(number=congress_num)
-        age_stats = AgeStats.objects.get(age=age)
-    except (Age.DoesNotExist, AgeStats.DoesNotExist):
+def _shell_context(congress_num):
+    if congress_num not in VALID_CONGRESS: # 유효하지 않은 링크 처리
+        raise Http404("Invalid congress num")
+    if not AgeStats.objects.filter(age__number=congress_num).exists():
         raise Http404("해당 대수의 통계 정보가 없습니다")
+    return {'congress_num': congress_num}
 
-    # 클러스터 대표 키워드 가져오기
-    bills = Bill.objects.filter(age__number=congress_num)
-    cluster_keywords_qs = (
-        bills
-        .values('cluster')
-        .annotate(min_id=Min('id'))
-        .order_by('cluster')
-    )
-    # cluster -> 대표 cluster_keyword mapping 만들기
-    min_ids = [entry['min_id'] for entry in cluster_keywords_qs]
-    min_bills = Bill.objects.filter(id__in=min_ids).values('cluster', 'cluster_keyword')
-    
-    cluster_keywords = {}
-    for b in min_bills:
-        keyword_str = b['cluster_keyword']
-        try:
-            keyword_list = json.loads(keyword_str)
-            keyword_display = ', '.join(keyword_list)
-        except Exception:
-            keyword_display = str(keyword_str)
-        cluster_keywords[b['cluster']] = keyword_display
-
-    context = {
-        'congress_num': congress_num,
-        'party_names': party_data['party_names'],
-        'party_colors': party_data['party_colors'],
-        'series': party_data['series'],
-        'categories': party_data['categories'],
-
-        'total_votes': party_data['total_votes'],
-        'total_bills': party_data['total_bills'],
-        'total_parties': party_data['total_parties'],
-        'gender_ratio': party_data['gender_ratio'],
-
-        'cluster_vote_data': cluster_vote_data['cluster_data'],  # 핵심 차트 데이터
-        'cluster_categories': cluster_vote_data['result_types'],           # x축 범례 (찬성/반대/기권/불참)
-        'cluster_party_names': cluster_vote_data['party_names'],         # 정당 이름
-        'cluster_party_colors': cluster_vote_data['party_colors'],       # 정당 색상 hex
-        # 'cluster_keywords': cluster_vote_data['cluster_keywords'],
-        # 'cluster_nums': list(cluster_vote_data['cluster_keywords'].keys()),
-
-        # 정당 집중도 관련 데이터 추가
-        'party_concentration_names': party_concentration_data.get('party_names', []),
-        'party_concentration_member_counts': party_concentration_data.get('member_counts', []),
-        'party_concentration_vote_supports': party_concentration_data.get('vote_supports', []),
-        'party_concentration_top2_seat_shares': party_concentration_data.get('top2_seat_shares', []),
-        'party_concentration_top2_ratio': party_concentration_data.get('top2_ratio'),
-        'party_concentration_top2_datail': party_concentration_data.get('top2_datail'),
-        'party_concentration_hhi': party_concentration_data.get('hhi'),
-        'party_concentration_enp': party_concentration_data.get('enp'),
-        'party_concentration_age': party_concentration_data.get('age'),
-
-        # 시계열
-        'timeseries_data_age': timeseries_data['ages'],
-        'timeseries_data_total_parties': timeseries_data['total_parties'],
-        'timeseries_data_hhi': timeseries_data['hhi_values'],
-        'timeseries_data_enp': timeseries_data['enp_values'],
-        'timeseries_data_top2_ratio': timeseries_data['top2_seat_shares_series'],
-
-        # 정당별 반대/기권 탑 클러스터
-        'cluster_options': cluster_options,
-        'selected_stance': selected_stance,
-        'cluster_chart_data': cluster_chart_data,
-    }
-
-    return render(request, 'dashboard.html', context)
+# dashboard.html로 보내는 함수 (정당별 표결 · 집중 키워드 섹션)
+def dashboard(request, congress_num):
+    return render(request, 'dashboard.html', _shell_context(congress_num))
 
-# second board로 보내는 함수
+# second board로 보내는 함수 (권력 집중도 · 시계열 섹션)
 def power(request, congress_num):
-    # 대수 필터링
-    if congress_num not in [20, 21, 22]: # 유효하지 않은 링크 처리
-        raise Http404("Invalid congress num")
-
-    party_data = get_partyStats_data(congress_num)
-    party_concentration_data = get_partyConcentration_data(congress_num)
-    timeseries_data = get_concentration_timeseries()
-
-    context = {
-        'congress_num': congress_num,
-        'party_names': party_data['party_names'],
-        'party_colors': party_data['party_colors'],
-        'series': party_data['series'],
-        'categories': party_data['categories'],
-
-        # 정당 집중도 관련 데이터 추가
-        'party_concentration_names': party_concentration_data.get('party_names', []),
-        'party_concentration_member_counts': party_concentration_data.get('member_counts', []),
-        'party_concentration_vote_supports': party_concentration_data.get('vote_supports', []),
-        'party_concentration_top2_seat_shares': party_concentration_data.get('top2_seat_shares', []),
-        'party_concentration_top2_ratio': party_concentration_data.get('top2_ratio'),
-        'party_concentration_top2_datail': party_concentration_data.get('top2_datail'),
-        'party_concentration_hhi': party_concentration_data.get('hhi'),
-        'party_concentration_enp': party_concentration_data.get('enp'),
-        'party_concentration_age': party_concentration_data.get('age'),
-
-        # 시계열
-        'timeseries_data_age': timeseries_data['ages'],
-        'timeseries_data_total_parties': timeseries_data['total_parties'],
-        'timeseries_data_hhi': timeseries_data['hhi_values'],
-        'timeseries_data_enp': timeseries_data['enp_values'],
-        'timeseries_data_top2_ratio': timeseries_data['top2_seat_shares_series'],
-    }
-
-    return render(request, 'power.html', context)
\ No newline at end of file
+    return render(request, 'power.html', _shell_context(congress_num))
+
+# 섹션 JSON: /dashboard/api/22/section/party/ (섹션마다 따로 캐시 · ETag)
+def _check_section(congress_num, section):
+    if congress_num not in VALID_CONGRESS or section not in dashboard_snapshot.SECTIONS:
+        raise Http404("Invalid section")
+
+@cache_control(public=True, max_age=CHART_MAX_AGE)
+@condition(etag_func=_section_etag)
+def section_api(request, congress_num, section):
+    _check_section(congress_num, section)
+    data = dashboard_snapshot.get_section(congress_num, section)
+    if data is None:
+        raise Http404("해당 대수의 통계 정보가 없습니다")
+    return JsonResponse(data)
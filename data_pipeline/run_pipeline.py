@@ -9,6 +9,7 @@ import django
 django.setup()
 
 from django.conf import settings
+from django.core.management import call_command
 import pandas as pd
 
 # from data_pipeline.crawling._01_save_bill_ids import fetch_and_save_bill_ids
@@ -17,8 +18,14 @@ import pandas as pd
 # from data_pipeline.cluster._01_keyword_gemini import legal_specialized_processing_system
 
 from geovote.models import Age, Vote, Member
+from geovote import treemap
 from billview.models import Bill
 from data_pipeline.clustering.cluster_label import assign_existing_cluster_and_label
+from main import cluster_document, cluster_graph, cluster_summary, controversy, member_similarity, party_agreement, vote_matrix
+from main.data_version import bump_data_version
+from accounts.feed import fan_out
+from billview.cards import refresh_cards
+from billview.timeline import rebuild_timelines
 
 base_path = settings.BASE_DIR / 'data_pipeline'
 
@@ -62,6 +69,7 @@ def run_all(eraco: str):
         return
 
     created, skipped = 0, 0
+    new_bill_ids = []
     for _, row in df_for_bill.iterrows():
         try:
             bill_id = safe_str(row['bill_id'])
@@ -79,13 +87,14 @@ def run_all(eraco: str):
                 'card_news_content': safe_str(row.get('card_news_content')) or None,
             }
 
-            _, created_flag = Bill.objects.update_or_create(
+            bill_obj, created_flag = Bill.objects.update_or_create(
                 bill_id=bill_id,
                 defaults={**defaults, 'bill_number': bill_number}
             )
 
             if created_flag:
                 created += 1
+                new_bill_ids.append(bill_obj.pk)
             else:
                 skipped += 1
 
@@ -97,11 +106,12 @@ def run_all(eraco: str):
     # 3-2. vote
     # 필요 컬럼만 선택
     vote_columns = [
-    'age', 'member_id', 'bill_number', 'result', 'date'
+    'age', 'member_id', 'bill_id', 'bill_number', 'result', 'date'
     ]
     df_for_vote = df_new_cluster_label[vote_columns].copy()
 
-    created, skipped = 0, 0
+    created_count, skipped_count = 0, 0
+    voted_bill_ids = set()
 
     for _, row in df_for_vote.iterrows():
         try:
@@ -123,6 +133,7 @@ def run_all(eraco: str):
                     'result': row['result'],
                 }
             )
+            voted_bill_ids.add(bill_obj.pk)
             if created:
                 created_count += 1
             else:
@@ -134,6 +145,39 @@ def run_all(eraco: str):
 
     print(f"[VOTE] 신규 생성: {created_count}건, 업데이트/스킵: {skipped_count}건")
 
+    # 4. 신규 법안이 속한 라벨의 개정 이력 타임라인 재생성
+    new_labels = Bill.objects.filter(id__in=new_bill_ids).values_list('label', flat=True)
+    print(f"[TIMELINE] 라벨 {rebuild_timelines(new_labels)}개 갱신")
+
+    # 4-1. 목록 UI 공용 카드(BillCard) 갱신 – 신규 법안 + 표결이 추가된 법안
+    print(f"[CARD] BillCard {refresh_cards(set(new_bill_ids) | voted_bill_ids)}건 갱신")
+
+    # 4-2. 클러스터 요약 갱신 (홈 갤럭시 · 클러스터 목록)
+    print(f"[CLUSTER] 클러스터 요약 {cluster_summary.rebuild()}건 갱신")
+    print(f"[CLUSTER] 클러스터 간선 {cluster_graph.build()}개 갱신")
+    print(f"[CLUSTER] 클러스터 문서 {cluster_document.build()}건 생성")
+
+    # 4-3. 표결이 추가된 법안의 논쟁 지수 (+ 소속 클러스터 재집계)
+    print(f"[CONTROVERSY] 논쟁 지수 {controversy.rebuild(voted_bill_ids)}건 갱신")
+    print(f"[AGREEMENT] 정당 일치 행렬 {party_agreement.update(voted_bill_ids)}개 갱신")
+
+    # 4-4. 표결 행렬(.npy) – 표결이 적재된 의안 열만 추가 · 갱신
+    matrix = vote_matrix.append_bills(age_obj.number, voted_bill_ids)
+    print(f"[MATRIX] 표결 행렬 {matrix.shape[0]}명 × {matrix.shape[1]}건")
+    print(f"[SIMILAR] 유사 의원 {member_similarity.rebuild(age_obj.number)}건 갱신")
+
+    # 5. 관심 사용자 피드 팬아웃
+    fed = fan_out(new_bill_ids)
+    print(f"[FEED] 피드 항목: {fed}건")
+
+    # 6. 데이터 버전 갱신 (버전 키를 쓰는 카드 조각 캐시 무효화)
+    version = bump_data_version()
+    print(f"[VERSION] 데이터 버전: {version}")
+    print(f"[TREEMAP] 트리맵 페이로드 {treemap.warm()}개 대수 생성")
+
+    # 7. 카드뉴스 정적 페이지 갱신 (변경된 클러스터만)
+    call_command('export_cardnews')
+
     
 if __name__ == "__main__":
     if len(sys.argv) != 2:
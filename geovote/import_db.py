@@ -13,7 +13,12 @@ django.setup()
 from django.db import transaction
 from django.conf import settings
 from geovote.models import District, Member, Party, Age, Vote
+from geovote import treemap
+from main import cluster_summary, controversy, member_similarity, vote_matrix
+from main.data_version import bump_data_version
 from billview.models import Bill
+from billview.cards import refresh_cards
+from billview.timeline import rebuild_timelines
 from pathlib import Path
 
 import glob
@@ -295,6 +300,22 @@ def run_all():
             member_dict=member_dict,
             bill_dict=bill_dict,
         )
+
+    # 목록 · 상세 화면이 읽는 미리 계산된 테이블 전체 재계산 (의안 카드 · 개정 이력 · 클러스터 요약 · 논쟁 지수)
+    print(f"[CARD] 의안 카드 {refresh_cards()}건 갱신")
+    print(f"[TIMELINE] 개정 이력 라벨 {rebuild_timelines()}개 갱신")
+    print(f"[CLUSTER] 클러스터 요약 {cluster_summary.rebuild()}건 갱신")
+    print(f"[CONTROVERSY] 논쟁 지수 {controversy.rebuild()}건 갱신")
+
+    for age in Age.objects.order_by('number'):
+        matrix = vote_matrix.build(age.number)
+        print(f"[MATRIX] {age.number}대 표결 행렬 {matrix.shape[0]}명 × {matrix.shape[1]}건")
+        print(f"[SIMILAR] {age.number}대 유사 의원 {member_similarity.rebuild(age.number)}건 갱신")
+
+    # 의원 · 의안 · 표결과 파생 테이블이 모두 바뀐 뒤에 버전을 올리고 트리맵 페이로드를 미리 만들어 둠
+    # (run_pipeline 과 같은 순서 ─ 새 버전으로 캐시되는 응답이 옛 유사 의원 · 표결 행렬을 담지 않도록)
+    print(f"[VERSION] 데이터 버전: {bump_data_version()}")
+    print(f"[TREEMAP] 트리맵 페이로드 {treemap.warm()}개 대수 생성")
     print(f"✅ 데이터 임포트 완료")
 
 if __name__ == "__main__":
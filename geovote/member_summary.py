@@ -0,0 +1,137 @@
+# geovote/member_summary.py
+"""
+의원 표결 요약 묶음 (대수별, 의원 id 키)
+────────────────────────────────────────────────────────
+트리맵은 의원 카드를 누를 때마다 member-vote-summary · member-alignment 를 각각 이름으로 조회했다
+(이름은 대수 간에 겹치고, 표결 유형마다 Bill 조회 · 클러스터마다 PartyClusterStats 조회가 따로 나감).
+대수 하나의 VoteSummary · 클러스터 키워드 · MemberAlignment(main/member_alignment.py)를 각각 한 번씩 읽어
+모든 의원의 최다 클러스터 요약 + 정당 일치율 + 비슷하게 투표한 의원(MemberSimilarity 상위 PANEL_K 명)을
+의원 id 키로 만들고, 데이터 버전 키로 캐시한다.
+- cluster_keywords(clusters)        : 클러스터 → 대표 키워드
+- max_clusters(summaries, keywords) : 의원 한 명의 표결 유형별 최다 클러스터 (요약 dict 목록 입력)
+- build_summaries(age_id)  : {의원 id: 요약 + 일치율 + 유사 의원}
+- get_summaries(age_id)    : 캐시된 build_summaries
+"""
+from collections import defaultdict
+
+from django.core.cache import cache
+
+from billview.models import Bill
+from main.data_version import BILLS, STATS, get_data_version
+from main.models import MemberAlignment, MemberSimilarity, VoteSummary
+from .models import Member
+
+MIN_VOTE_COUNT = 3
+VOTE_TYPES = ['찬성', '반대', '기권', '불참']
+CACHE_SEC = 60 * 60
+PANEL_K = 5
+
+
+def get_ratio(summary, vote_type):
+    total = sum(summary[t] for t in VOTE_TYPES)
+    return summary[vote_type] / total if total else 0
+
+
+def get_confidence_level(vote_count):
+    if vote_count >= 30:
+        return "High"
+    elif vote_count >= MIN_VOTE_COUNT:
+        return "Medium"
+    else:
+        return "Low"
+
+
+def cluster_keywords(clusters) -> dict:
+    """클러스터 → 대표 키워드 (클러스터의 첫 의안 기준, 쿼리 1번)"""
+    keywords = {}
+    rows = (
+        Bill.objects.filter(cluster__in=[int(c) for c in clusters if str(c).lstrip('-').isdigit()])
+        .order_by('cluster', 'id')
+        .values_list('cluster', 'cluster_keyword')
+    )
+    for cluster, keyword in rows:
+        keywords.setdefault(str(cluster), keyword or "알 수 없음")
+    return keywords
+
+
+def max_clusters(summaries, keywords) -> dict:
+    """summaries: VoteSummary 값 dict 목록 (cluster, bill_count, 찬성 · 반대 · 기권 · 불참)"""
+    if not summaries:
+        return {}
+
+    result = {}
+    filtered = [
+        s for s in summaries
+        if sum(s[t] for t in VOTE_TYPES) >= MIN_VOTE_COUNT and s['bill_count'] > 0
+    ]
+    for vote_type in VOTE_TYPES:
+        if not filtered:
+            continue
+
+        top_summary = max(filtered, key=lambda s: get_ratio(s, vote_type))
+        counts = {t: top_summary[t] for t in VOTE_TYPES}
+        total_votes = sum(counts.values()) or 1
+        ratios = {k: round(counts[k] / total_votes * 100, 2) for k in counts}
+
+        result[vote_type] = {
+            'cluster_keyword': keywords.get(str(top_summary['cluster']), "알 수 없음"),
+            'cluster_id': top_summary['cluster'],
+            'counts': counts,
+            'ratios': ratios,
+            'bill_count': top_summary['bill_count'],
+            'confidence': get_confidence_level(total_votes),
+        }
+
+    result['total_vote_count'] = sum(
+        sum(v['counts'].values()) for v in result.values() if 'counts' in v
+    )
+    return result
+
+
+def build_summaries(age_id) -> dict:
+    members = list(Member.objects.filter(age_id=age_id).select_related('party'))
+    by_member = defaultdict(list)
+    for row in VoteSummary.objects.filter(member__age_id=age_id).values(
+        'member_id', 'cluster', 'bill_count', *VOTE_TYPES
+    ):
+        by_member[row['member_id']].append(row)
+
+    keywords = cluster_keywords({row['cluster'] for rows in by_member.values() for row in rows})
+    alignments = {
+        row.pop('member_id'): row
+        for row in MemberAlignment.objects.filter(age_id=age_id).values(
+            'member_id', 'alignment_count', 'total_clusters', 'alignment_rate', 'deviation_rate'
+        )
+    }
+    similar = dict(
+        MemberSimilarity.objects.filter(age_id=age_id, cluster_num__isnull=True)
+        .values_list('member_id', 'neighbors')
+    )
+
+    result = {}
+    for member in members:
+        summaries = by_member.get(member.id)
+        if not summaries:
+            continue
+        result[member.id] = {
+            'member_name': member.name,
+            **max_clusters(summaries, keywords),
+        }
+        if member.id in alignments:
+            result[member.id].update(party=member.party.party, **alignments[member.id])
+        if member.id in similar:
+            result[member.id]['similar'] = similar[member.id][:PANEL_K]
+    return result
+
+
+def _cache_key(age_id) -> str:
+    return f"member_summaries:{get_data_version(BILLS)}:{get_data_version(STATS)}:{age_id}"
+
+
+def get_summaries(age_id) -> dict:
+    key = _cache_key(age_id)
+    data = cache.get(key)
+    if data is None:
+        data = build_summaries(age_id)
+        cache.set(key, data, CACHE_SEC)
+    return data
@@ -0,0 +1,104 @@
+# geovote/treemap.py
+"""
+트리맵 페이로드 (대수별 사전 직렬화 · 사전 압축)
+────────────────────────────────────────────────────────
+SIDO → SIGUNGU → 지역구 → 의원 트리는 의원 · 지역구가 바뀔 때(적재)만 달라지는데
+요청마다 Member · District 를 모두 읽어 큰 dict 를 만들고 JsonResponse 로 직렬화하고 있었다.
+대수 · 데이터 버전마다 한 번만 트리를 만들어 JSON 바이트와 gzip 바이트, ETag 를 함께 캐시하고,
+뷰는 캐시에서 꺼낸 바이트를 그대로 내보낸다 (요청 중 Python 직렬화 · 압축 없음).
+- build_tree(age_id)   : 트리 dict
+- get_payload(age_id)  : {'json', 'gzip', 'etag'} (없는 대수면 None)
+- warm(age_ids=None)   : 현재 버전 페이로드 미리 생성 (적재 직후)
+"""
+import gzip
+import hashlib
+import json
+from collections import defaultdict
+
+from django.core.cache import cache
+
+from main.data_version import get_data_version
+from .models import Age, District, Member
+
+CACHE_SEC = 60 * 60 * 24
+
+
+def _cache_key(age_id) -> str:
+    return f"treemap:{get_data_version()}:{age_id}"
+
+
+def build_tree(age_id) -> dict:
+    # 1. 의원 여러 명 받아서
+    members = Member.objects.filter(age_id=age_id).select_related('party')
+    member_dict = defaultdict(list)
+    for m in members:
+        if m.district_id:
+            member_dict[m.district_id].append(m)
+
+    # 2. 의원이 있는 지역구만 필터링
+    districts = District.objects.filter(id__in=member_dict.keys())
+
+    # 3. SIDO - SIGUNGU - District 구조 만들기
+    tree = defaultdict(lambda: defaultdict(list))
+    for district in districts:
+        sido = district.SIDO or "기타"
+        sigungu = district.SIGUNGU or "기타"
+        tree[sido][sigungu].append(district)
+
+    result = {
+        "name": "대한민국",
+        "type": "ROOT",
+        "children": []
+    }
+
+    for sido_name, sigungu_map in tree.items():
+        sido_node = {"name": sido_name, "type": "SIDO", "children": []}
+        for sigungu_name, district_list in sigungu_map.items():
+            sigungu_node = {"name": sigungu_name, "type": "SIGUNGU", "children": []}
+            for district in district_list:
+                # 4. 의원 여러 명 있으면 각각 하나의 카드로 append
+                for member in member_dict[district.id]:
+                    sigungu_node["children"].append({
+                        "id": f"{district.id}_{member.id}",
+                        "member_id": member.id,
+                        "member_name": member.name,
+                        "image_url": member.image_url,
+                        "name": f"{district.SGG} ({member.name} - {member.party.party})",
+                        "type": "District",
+                        "value": 1,
+                        "color": member.party.color
+                    })
+            sido_node["children"].append(sigungu_node)
+        result["children"].append(sido_node)
+
+    return result
+
+
+def _serialize(tree) -> dict:
+    body = json.dumps(tree, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return {
+        'json': body,
+        'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        'etag': hashlib.sha1(body).hexdigest(),
+    }
+
+
+def get_payload(age_id):
+    key = _cache_key(age_id)
+    payload = cache.get(key)
+    if payload is None:
+        if not Age.objects.filter(id=age_id).exists():
+            return None
+        payload = _serialize(build_tree(age_id))
+        cache.set(key, payload, CACHE_SEC)
+    return payload
+
+
+def warm(age_ids=None) -> int:
+    if age_ids is None:
+        age_ids = Age.objects.values_list('id', flat=True)
+    count = 0
+    for age_id in age_ids:
+        cache.set(_cache_key(age_id), _serialize(build_tree(age_id)), CACHE_SEC)
+        count += 1
+    return count
@@ -6,5 +6,8 @@ urlpatterns = [
     path('treemap/', views.treemap_view, name='treemap'),
     path('api/treemap-data/', views.region_tree_data, name='api_treemap_data'),
     path('api/member-vote-summary/', views.member_vote_summary_api, name='api_member_vote_summary'),
+    path('api/member-summaries/', views.member_summaries_api, name='api_member_summaries'),
+    path('api/member-similar/', views.member_similar_api, name='api_member_similar'),
+    path('api/compare/', views.member_compare_api, name='api_member_compare'),
     path('api/member-alignment/', views.member_alignment_api, name='api_member_alignment'),
 ]
@@ -1,9 +1,16 @@
 from django.shortcuts import render
-from django.http import JsonResponse
-from .models import Age, Member, District
-from collections import defaultdict
-from billview.models import Bill
-from main.models import VoteSummary, PartyClusterStats
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from main.data_version import BILLS, STATS, get_data_version
+from .models import Age, Member
+from . import member_summary, treemap
+from main import member_similarity, vote_matrix
+import hashlib
+import re
+from main.models import MemberAlignment, VoteSummary
 from django.views.decorators.http import require_GET
 
 def treemap_view(request):
@@ -11,132 +18,47 @@ def treemap_view(request):
     return render(request, 'treemap.html', {'ages': ages})
 
 
+# 트리맵 데이터: 캐시된 JSON(gzip) 바이트를 그대로 응답 (geovote/treemap.py)
+TREEMAP_MAX_AGE = 60 * 5
+_accepts_gzip = re.compile(r"\bgzip\b")
+
+@require_GET
 def region_tree_data(request):
     age_id = request.GET.get('age')
     if not age_id:
         return JsonResponse({"error": "age parameter is required"}, status=400)
 
     try:
-        age_id = int(age_id)
-        age_obj = Age.objects.get(id=age_id)
-    except (ValueError, Age.DoesNotExist):
+        payload = treemap.get_payload(int(age_id))
+    except ValueError:
+        payload = None
+    if payload is None:
         return JsonResponse({"error": "Invalid age parameter"}, status=400)
 
-    # 1. 의원 여러 명 받아서
-    members = Member.objects.filter(age=age_obj).select_related('party', 'district')
-    member_dict = defaultdict(list)
-    for m in members:
-        if m.district_id:
-            member_dict[m.district_id].append(m)
-
-    # 2. 의원이 있는 지역구만 필터링
-    districts = District.objects.filter(id__in=member_dict.keys())
-
-    # 3. SIDO - SIGUNGU - District 구조 만들기
-    tree = defaultdict(lambda: defaultdict(list))
-    for district in districts:
-        sido = district.SIDO or "기타"
-        sigungu = district.SIGUNGU or "기타"
-        tree[sido][sigungu].append(district)
-
-    result = {
-        "name": "대한민국",
-        "type": "ROOT",
-        "children": []
-    }
+    # 압축 여부에 따라 표현이 달라지므로 ETag 도 구분
+    use_gzip = bool(_accepts_gzip.search(request.headers.get('Accept-Encoding', '')))
+    etag = quote_etag(payload['etag'] + ('-gz' if use_gzip else ''))
 
-    for sido_name, sigungu_map in tree.items():
-        sido_node = {"name": sido_name, "type": "SIDO", "children": []}
-        for sigungu_name, district_list in sigungu_map.items():
-            sigungu_node = {"name": sigungu_name, "type": "SIGUNGU", "children": []}
-            for district in district_list:
-                members_in_district = member_dict.get(district.id, [])
-
-                # 4. 의원 여러 명 있으면 각각 하나의 카드로 append
-                if not members_in_district:
-                    sigungu_node["children"].append({
-                        "id": district.id,
-                        "member_name": None,
-                        "image_url": None,
-                        "name": f"{district.SGG} (의원 없음)",
-                        "type": "District",
-                        "value": 1,
-                        "color": "#cccccc"
-                    })
-                else:
-                    for member in members_in_district:
-                        sigungu_node["children"].append({
-                            "id": f"{district.id}_{member.id}",
-                            "member_name": member.name,
-                            "image_url": member.image_url,
-                            "name": f"{district.SGG} ({member.name} - {member.party.party})",
-                            "type": "District",
-                            "value": 1,
-                            "color": member.party.color
-                        })
-            sido_node["children"].append(sigungu_node)
-        result["children"].append(sido_node)
-
-    return JsonResponse(result)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(payload['gzip'] if use_gzip else payload['json'], content_type='application/json')
+        if use_gzip:
+            response['Content-Encoding'] = 'gzip'
+    response['ETag'] = etag
+    patch_vary_headers(response, ['Accept-Encoding'])
+    patch_cache_control(response, public=True, max_age=TREEMAP_MAX_AGE)
+    return response
 
 #---------------------- 의원 - 의안 클러스터 - 표결 연결 ------------------
 from django.http import JsonResponse
 
-MIN_VOTE_COUNT = 3
-
-def get_ratio(summary, vote_type):
-    total = summary.찬성 + summary.반대 + summary.기권 + summary.불참
-    return getattr(summary, vote_type) / total if total else 0
-
-def get_confidence_level(vote_count):
-    if vote_count >= 30:
-        return "High"
-    elif vote_count >= MIN_VOTE_COUNT:
-        return "Medium"
-    else:
-        return "Low"
-
 def get_max_clusters_for_member(member_name):
-    summaries = VoteSummary.objects.filter(member__name=member_name)
-    if not summaries.exists():
-        return {}
-
-    max_clusters = {}
-    for vote_type in ['찬성', '반대', '기권', '불참']:
-        filtered = [
-            s for s in summaries
-            if (s.찬성 + s.반대 + s.기권 + s.불참) >= MIN_VOTE_COUNT and s.bill_count>0
-        ]
-        if not filtered:
-            continue
-
-        top_summary = max(filtered, key=lambda s: get_ratio(s, vote_type))
-        counts = {
-            '찬성': top_summary.찬성,
-            '반대': top_summary.반대,
-            '기권': top_summary.기권,
-            '불참': top_summary.불참,
-        }
-        total_votes = sum(counts.values()) or 1
-        ratios = {k: round(counts[k] / total_votes * 100, 2) for k in counts}
-
-        bill = Bill.objects.filter(cluster=top_summary.cluster).first()
-        cluster_keyword = bill.cluster_keyword if bill and bill.cluster_keyword else "알 수 없음"
-        confidence = get_confidence_level(total_votes)
-
-        max_clusters[vote_type] = {
-            'cluster_keyword': cluster_keyword,
-            'cluster_id': top_summary.cluster,
-            'counts': counts,
-            'ratios': ratios,
-            'bill_count': top_summary.bill_count,
-            'confidence': confidence,
-        }
-
-    max_clusters['total_vote_count'] = sum(
-        sum(v['counts'].values()) for v in max_clusters.values() if 'counts' in v
+    summaries = list(
+        VoteSummary.objects.filter(member__name=member_name)
+        .values('cluster', 'bill_count', *member_summary.VOTE_TYPES)
     )
-    return max_clusters
+    keywords = member_summary.cluster_keywords({s['cluster'] for s in summaries})
+    return member_summary.max_clusters(summaries, keywords)
 
 
 def member_vote_summary_api(request):
@@ -151,68 +73,106 @@ def member_vote_summary_api(request):
     return JsonResponse(max_clusters)
 
 
+# 대수 하나의 모든 의원 표결 요약 + 정당 일치율 (의원 id 키) – 트리맵이 대수마다 한 번 받아 클릭은 로컬 처리
+def _vote_data_etag(request):
+    raw = f"{get_data_version(BILLS)}:{get_data_version(STATS)}|{request.get_full_path()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+@require_GET
+@cache_control(public=True, max_age=TREEMAP_MAX_AGE)
+@condition(etag_func=_vote_data_etag)
+def member_summaries_api(request):
+    try:
+        age_id = int(request.GET.get('age', ''))
+    except ValueError:
+        return JsonResponse({"error": "Invalid age parameter"}, status=400)
+    if not Age.objects.filter(id=age_id).exists():
+        return JsonResponse({"error": "Invalid age parameter"}, status=400)
+
+    return JsonResponse({'members': member_summary.get_summaries(age_id)})
+
+
+
+# 비슷하게 투표한 의원 – main/member_similarity.py 가 적재 때 저장한 top-k 한 행만 읽음
+@require_GET
+@cache_control(public=True, max_age=TREEMAP_MAX_AGE)
+@condition(etag_func=_vote_data_etag)
+def member_similar_api(request):
+    try:
+        member_id = int(request.GET.get('member_id', ''))
+        cluster = request.GET.get('cluster')
+        cluster = int(cluster) if cluster not in (None, '') else None
+    except ValueError:
+        return JsonResponse({"error": "Invalid member_id or cluster parameter"}, status=400)
+
+    neighbors = member_similarity.neighbors(member_id, cluster)
+    if neighbors is None:
+        return JsonResponse({"error": "No similarity data found for member"}, status=404)
+    return JsonResponse({'member_id': member_id, 'cluster': cluster, 'neighbors': neighbors})
+
+
+# 두 의원 표결 비교 – 표결 행렬의 결과별 비트셋을 AND 해 popcount (Vote 자기 조인 없음)
+@require_GET
+@cache_control(public=True, max_age=TREEMAP_MAX_AGE)
+@condition(etag_func=_vote_data_etag)
+def member_compare_api(request):
+    try:
+        ids = [int(request.GET.get('a', '')), int(request.GET.get('b', ''))]
+    except ValueError:
+        return JsonResponse({"error": "Invalid a or b parameter"}, status=400)
+
+    members = {
+        m['id']: m for m in Member.objects.filter(id__in=ids).values('id', 'name', 'party__party', 'age__number')
+    }
+    if len(members) < len(set(ids)):
+        return JsonResponse({"error": "Member not found"}, status=404)
+    ages = {m['age__number'] for m in members.values()}
+    if len(ages) != 1:
+        return JsonResponse({"error": "Members must belong to the same congress"}, status=400)
+
+    congress = ages.pop()
+    matrix = vote_matrix.load(congress)
+    result = matrix.compare(*ids) if matrix is not None else None
+    if result is None:
+        return JsonResponse({"error": "No vote data found for members"}, status=404)
+
+    return JsonResponse({
+        'congress': congress,
+        'members': [
+            {'member_id': i, 'name': members[i]['name'], 'party': members[i]['party__party']} for i in ids
+        ],
+        'overall': result['overall'],
+        'clusters': [{'cluster_num': c, **stats} for c, stats in result['clusters'].items() if stats['common']],
+    })
+
 #--------------------------------정당과 의원의 표결 경향 분석--------------------------------
-import logging
-logger = logging.getLogger(__name__)
+# main/member_alignment.py 가 적재 때 계산해 둔 MemberAlignment 한 행만 읽음
 @require_GET
 def member_alignment_api(request):
+    member_id = request.GET.get("member_id")
     member_name = request.GET.get("member_name")
     congress_num = request.GET.get("congress_num")
 
-    if not member_name or not congress_num:
-        return JsonResponse({'error': 'member_name and congress are required'}, status=400)
-    
-    try:
-        age = Age.objects.get(id=congress_num)
-    except Age.DoesNotExist:
-        logger.error(f"Age ID {congress_num} not found")
-        return JsonResponse({'error': 'Invalid congress_num'}, status=404)
+    if member_id:
+        lookup = {'member_id': member_id}
+    elif member_name and congress_num:
+        lookup = {'age_id': congress_num, 'member__name': member_name}
+    else:
+        return JsonResponse({'error': 'member_id, or member_name and congress_num are required'}, status=400)
 
     try:
-        member = Member.objects.get(name=member_name, age=age)
-    except Member.DoesNotExist:
-        return JsonResponse({'error': 'Member not found'}, status=404)
-
-    party = member.party
-    summaries = VoteSummary.objects.filter(member=member)
-    if not summaries.exists():
-        return JsonResponse({'error': 'No vote summary found for member'}, status=404)
-
-    aligned = 0
-    total = 0
-
-    for s in summaries:
-        try:
-            party_stat = PartyClusterStats.objects.get(
-                age=age, cluster_num=s.cluster, party=party
-            )
-        except PartyClusterStats.DoesNotExist:
-            continue
-
-        party_stance = max([
-            ('찬성', party_stat.support_ratio),
-            ('반대', party_stat.oppose_ratio),
-            ('기권', party_stat.abstain_ratio)
-        ], key=lambda x: x[1])[0]
-
-        member_stance = max([
-            ('찬성', s.찬성),
-            ('반대', s.반대),
-            ('기권', s.기권)
-        ], key=lambda x: x[1])[0]
-
-        if party_stance == member_stance:
-            aligned += 1
-        total += 1
-    
-    alignment_rate = round(aligned / total * 100, 2) if total else 0
+        alignment = MemberAlignment.objects.select_related('member', 'party').get(**lookup)
+    except (MemberAlignment.DoesNotExist, ValueError):
+        return JsonResponse({'error': 'No alignment data found for member'}, status=404)
+    except MemberAlignment.MultipleObjectsReturned:
+        return JsonResponse({'error': 'Ambiguous member_name, use member_id'}, status=400)
 
     return JsonResponse({
-        'member_name': member.name,
-        'party': party.party,
-        'alignment_count': aligned,
-        'total_clusters': total,
-        'alignment_rate': alignment_rate,
-        'deviation_rate': round(100 - alignment_rate, 2),
+        'member_name': alignment.member.name,
+        'party': alignment.party.party,
+        'alignment_count': alignment.alignment_count,
+        'total_clusters': alignment.total_clusters,
+        'alignment_rate': alignment.alignment_rate,
+        'deviation_rate': alignment.deviation_rate,
+        'deviating_clusters': alignment.deviating_clusters,
     })
-
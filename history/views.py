@@ -6,29 +6,21 @@ from __future__ import annotations
 import logging
 import random
 from collections import defaultdict
+from datetime import date
 from typing import Dict, List
 
 from django.core.cache import cache
-from django.db import connection, models
-from django.db.models import (
-    Count,
-    DateField,
-    F,
-    Max,
-    OuterRef,
-    Q,
-    Subquery,
-    Value,
-)
-from django.db.models.functions import Coalesce, Random
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Random
 from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.views.decorators.http import require_GET
 from django.views.generic import DetailView, ListView
 
-from billview.models import Bill
-from geovote.models import Vote
+from billview.models import Bill, BillCard
+from billview.timeline import get_timeline
+from main import cluster_summary, controversy
 from main.models import PartyClusterStats
 from search import search_service as ss
 
@@ -61,19 +53,9 @@ DICT_CACHE_SEC = 60 * 60
 def index(request):
     clusters = cache.get("cluster_list")
     if clusters is None:
-        qs = (
-            Bill.objects.filter(cluster__isnull=False, cluster__gt=0)
-            .values("cluster", "cluster_keyword")
-            .distinct()
-            .order_by("cluster")
-        )
         clusters = [
-            {
-                "cluster": r["cluster"],
-                "keyword": (r["cluster_keyword"] or "").split(",")[0].strip()
-                or "키워드 없음",
-            }
-            for r in qs
+            {"cluster": c.cluster_num, "keyword": c.first_keyword or "키워드 없음"}
+            for c in cluster_summary.get_summaries()
         ]
         cache.set("cluster_list", clusters, DICT_CACHE_SEC)
     return render(request, "cluster_list.html", {"clusters": clusters})
@@ -123,8 +105,9 @@ class BillHistoryListView(ListView):
     def get_queryset(self):
         kw = self.request.GET.get("q", "").strip()
         cid = self.request.GET.get("cluster", "").strip()
+        sort = self.request.GET.get("sort", "").strip()
 
-        cache_key = f"hist_qs:{kw}:{cid}"
+        cache_key = f"hist_qs:{kw}:{cid}:{sort}"
         if cached := cache.get(cache_key):
             return cached
 
@@ -143,35 +126,26 @@ class BillHistoryListView(ListView):
                 | Q(cleaned__icontains=kw)
             )
 
-        # label별 최신안건 1건만
-        if connection.vendor == "postgresql":
-            qs = qs.order_by("label", "-bill_number").distinct("label")
-        else:
-            latest_sub = (
-                Bill.objects.filter(label=OuterRef("label"))
-                .order_by("-bill_number")
-                .values("bill_number")[:1]
-            )
-            qs = qs.annotate(latest_bn=Subquery(latest_sub)).filter(
-                bill_number=F("latest_bn")
-            )
-
-        # 관련 개수·최근 표결일
-        cnt_sub = (
+        # label별 최신안건 1건만 (카드에 미리 계산된 is_latest 사용)
+        # 카드가 아직 없는 의안은 기존 label 최신안 서브쿼리로 판단
+        latest_sub = (
             Bill.objects.filter(label=OuterRef("label"))
-            .values("label")
-            .annotate(total=Count("id"))
-            .values("total")[:1]
+            .order_by("-bill_number")
+            .values("bill_number")[:1]
+        )
+        # sort=controversy 면 저장된 논쟁 지수 인덱스 순
+        ordering = (
+            (F("controversy__score").desc(nulls_last=True), "-bill_number")
+            if sort == "controversy" else ("-bill_number",)
         )
-        vote_sub = (
-            Vote.objects.filter(bill=OuterRef("pk"))
-            .values("bill")
-            .annotate(last=Max("date"))
-            .values("last")[:1]
+        qs = (
+            qs.filter(
+                Q(card__is_latest=True)
+                | Q(card__isnull=True, bill_number=Subquery(latest_sub))
+            )
+            .select_related("card")
+            .order_by(*ordering)
         )
-        qs = qs.annotate(
-            related_count=Subquery(cnt_sub), last_vote_date=Subquery(vote_sub)
-        ).order_by("-bill_number")
 
         cache.set(cache_key, qs, QS_CACHE_SEC)
         return qs
@@ -200,58 +174,29 @@ class BillHistoryListView(ListView):
             e = min(s + 9, page.paginator.num_pages)
             ctx["page_range"] = range(s, e + 1)
 
-        # 공통 서브쿼리
-        vote_sq = (
-            Vote.objects.filter(bill=OuterRef("pk"))
-            .values("bill")
-            .annotate(last=Max("date"))
-            .values("last")[:1]
-        )
-        cnt_sq = (
-            Bill.objects.filter(label=OuterRef("label"))
-            .values("label")
-            .annotate(total=Count("id"))
-            .values("total")[:1]
-        )
-        base_qs = Bill.objects.annotate(
-            last_vote_date=Subquery(vote_sq),
-            related_count=Subquery(cnt_sq),
-        )
-
-        # 최근 개정
-        ctx["recent_bills"] = base_qs.order_by(
+        # 최근 개정 · 개정 최다 (BillCard 읽기 모델)
+        ctx["recent_bills"] = BillCard.objects.order_by(
             F("last_vote_date").desc(nulls_last=True), "-bill_number"
         )[:10]
-
-        # 개정 최다
-        if connection.vendor == "postgresql":
-            amended_qs = (
-                base_qs.order_by("label", "-bill_number")
-                .distinct("label")
-                .order_by("-related_count", "-bill_number")[:10]
-            )
-        else:
-            latest_sub = (
-                Bill.objects.filter(label=OuterRef("label"))
-                .order_by("-bill_number")
-                .values("bill_number")[:1]
-            )
-            amended_qs = (
-                base_qs.annotate(latest_bn=Subquery(latest_sub))
-                .filter(bill_number=F("latest_bn"))
-                .order_by("-related_count", "-bill_number")[:8]
-            )
-        ctx["amended_bills"] = amended_qs
+        ctx["amended_bills"] = BillCard.objects.filter(is_latest=True).order_by(
+            "-revision_count", "-bill_number"
+        )[:8]
+
+        # 논쟁 최다 (BillControversy 인덱스, cluster 파라미터가 있으면 해당 클러스터 안에서)
+        try:
+            contested_cluster = int(cid) if cid else None
+        except ValueError:
+            contested_cluster = None
+        ctx["contested_bills"] = controversy.top_bills(8, cluster=contested_cluster)
+        ctx["sort"] = self.request.GET.get("sort", "").strip()
 
         # 랜덤 법안 (기존 로직 유지)
         hot_clusters = PartyClusterStats.objects.values_list(
             "cluster_num", flat=True
         )
-        candidate_bills = (
-            Bill.objects.filter(cluster__in=hot_clusters)
-            .annotate(last_vote_date=Subquery(vote_sq))
-            .order_by(Random())[:100]
-        )
+        candidate_bills = BillCard.objects.filter(
+            cluster__in=hot_clusters
+        ).order_by(Random())[:100]
         cluster_groups = defaultdict(list)
         for bill in candidate_bills:
             if bill.cluster and len(cluster_groups[bill.cluster]) < 8:
@@ -319,43 +264,27 @@ class BillHistoryDetailView(DetailView):
     template_name = "bill_detail.html"
     context_object_name = "bill"
 
-    def get_queryset(self):
-        cnt_sub = (
-            Bill.objects.filter(label=OuterRef("label"))
-            .values("label")
-            .annotate(total=Count("id"))
-            .values("total")[:1]
-        )
-        return Bill.objects.annotate(related_count=Subquery(cnt_sub))
-
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         bill = self.object
         label = bill.label
 
-        vote_sq = (
-            Vote.objects.filter(bill=OuterRef("pk"))
-            .order_by("date")
-            .values("date")[:1]
-        )
-        related = (
-            Bill.objects.filter(label=label)
-            .annotate(
-                vote_date=Subquery(vote_sq),
-                sort_date=Coalesce(
-                    Subquery(vote_sq), Value("1970-01-01", output_field=DateField())
-                ),
-            )
-            .only("id", "title", "bill_number", "label", "summary", "url")
-            .order_by("-sort_date", "-bill_number")
-        )
+        # 적재 시 미리 정렬해 둔 개정 이력 (첫 표결일 ↓, 의안번호 ↓)
+        if label is not None:
+            related = [dict(e) for e in get_timeline(label)]
+        else:
+            related = []
+        for e in related:
+            e["vote_date"] = date.fromisoformat(e["vote_date"]) if e["vote_date"] else None
+        bill.related_count = len(related)
 
         # 좋아요 여부 확인
         liked_ids = set()
-        if self.request.user.is_authenticated:
+        if self.request.user.is_authenticated and related:
             liked_ids = set(
-                BillLike.objects.filter(user=self.request.user, bill__label=label)
-                .values_list("bill_id", flat=True)
+                BillLike.objects.filter(
+                    user=self.request.user, bill_id__in=[e["id"] for e in related]
+                ).values_list("bill_id", flat=True)
             )
 
         helper = BillHistoryListView()
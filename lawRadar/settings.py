@@ -31,6 +31,12 @@ STATICFILES_DIRS = [
 
 STATIC_ROOT = 'collectstatic'
 
+# 카드뉴스 정적 내보내기 경로 (python manage.py export_cardnews → nginx 직접 서빙)
+CARDNEWS_EXPORT_ROOT = BASE_DIR / 'static_export'
+
+# 대수별 의원 × 의안 표결 행렬(.npy) 저장 경로 (main/vote_matrix.py, 워커들이 읽기 전용 mmap 으로 공유)
+VOTE_MATRIX_ROOT = Path(os.getenv('LAWRADAR_VOTE_MATRIX_ROOT', BASE_DIR / 'vote_matrix'))
+
 AUTH_USER_MODEL = 'accounts.User'
 SOCIAL_AUTH_USER_MODEL = AUTH_USER_MODEL
 
@@ -169,6 +175,10 @@ DATABASES = {
     }
 }
 
+# 통계 테이블 계산 방식 ('python' | 'matview')
+# 'matview' 는 PostgreSQL 에서만 동작 – main/stats_matviews.py 의 구체화 뷰를 갱신해 통계 테이블로 옮긴다
+STATS_BACKEND = os.getenv('LAWRADAR_STATS_BACKEND', 'python')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -0,0 +1,146 @@
+# main/cluster_document.py
+"""
+클러스터 상세 문서
+────────────────────────────────────────────────────────
+카드뉴스 · 히스토리 · 대시보드에 흩어진 클러스터 정보를 클러스터당 JSON 문서 하나로 미리 만든다.
+  keywords / bill_count / latest_vote_date / size_rank   ← ClusterSummary
+  latest_bills                                           ← BillCard (라벨별 최신안)
+  party_stance {대수: [정당별 찬성·반대·기권·불참 %]}     ← PartyClusterStats
+  related [연관 클러스터]                                 ← ClusterEdge
+문서는 payload 해시를 ETag 로 함께 저장해, API 가 본문을 다시 만들지 않고 304 를 돌려줄 수 있다.
+- build(cluster_nums=None) : 문서 생성 (None 이면 전체, 집계 쿼리 4번, 요약이 비어 있으면 먼저 계산)
+- get_document(n)          : {'etag', 'payload'} (캐시 → DB 순, 요청 중에는 만들지 않음 · 없는 문서도 캐시)
+"""
+import hashlib
+import json
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.urls import reverse
+
+from billview.models import BillCard
+from . import cluster_summary
+from .models import ClusterDocument, ClusterEdge, ClusterSummary, PartyClusterStats
+
+LATEST_BILLS = 10
+RELATED = 5
+CACHE_SEC = 60 * 60
+_MISSING = {}   # 없는 문서 캐시값 (cache.get 의 None 과 구분)
+
+
+def _cache_key(cluster_num) -> str:
+    return f"cluster_doc:{cluster_num}"
+
+
+def _split_keywords(kw_str: str):
+    return [k.strip() for k in (kw_str or "").split(",") if k.strip()]
+
+
+def _serialize(payload: dict):
+    """JSON 직렬화 가능한 값으로 정리 + ETag 계산"""
+    text = json.dumps(payload, cls=DjangoJSONEncoder, ensure_ascii=False, sort_keys=True)
+    return json.loads(text), hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def build(cluster_nums=None) -> int:
+    """클러스터 문서 생성 → 생성한 문서 수"""
+    # 적재 직후 ClusterSummary 가 비어 있으면 문서가 0건이 되므로 요약부터 계산
+    if not ClusterSummary.objects.exists():
+        cluster_summary.rebuild()
+    summaries = ClusterSummary.objects.all()
+    if cluster_nums is not None:
+        summaries = summaries.filter(cluster_num__in=list(cluster_nums))
+    summaries = {s.cluster_num: s for s in summaries}
+    if not summaries:
+        return 0
+    ids = list(summaries)
+    first_keyword = {
+        cid: kw.split(",")[0].strip()
+        for cid, kw in ClusterSummary.objects.values_list("cluster_num", "keyword")
+    }
+
+    latest_bills = defaultdict(list)
+    for card in (
+        BillCard.objects.filter(cluster__in=ids, is_latest=True)
+        .order_by("cluster", "-bill_number")
+    ):
+        if len(latest_bills[card.cluster]) < LATEST_BILLS:
+            latest_bills[card.cluster].append({
+                "id": card.bill_id,
+                "title": card.title,
+                "bill_number": card.bill_number,
+                "last_vote_date": card.last_vote_date,
+                "revision_count": card.revision_count,
+                "url": reverse("history:bill_detail", args=[card.bill_id]),
+            })
+
+    party_stance = defaultdict(lambda: defaultdict(list))
+    for s in (
+        PartyClusterStats.objects.filter(cluster_num__in=ids, total_votes__gt=0)
+        .select_related("age", "party")
+        .order_by("age__number", "-total_votes")
+    ):
+        party_stance[s.cluster_num][str(s.age.number)].append({
+            "party": s.party.party,
+            "color": s.party.color,
+            "찬성": round(s.support_ratio, 2),
+            "반대": round(s.oppose_ratio, 2),
+            "기권": round(s.abstain_ratio, 2),
+            "불참": round(s.absent_ratio, 2),
+            "total_votes": s.total_votes,
+        })
+
+    related = defaultdict(list)
+    for e in ClusterEdge.objects.filter(source__in=ids).order_by("source", "-weight"):
+        if len(related[e.source]) < RELATED:
+            related[e.source].append({
+                "cluster": e.target,
+                "keyword": first_keyword.get(e.target, ""),
+                "weight": e.weight,
+                "url": reverse("cardnews:card", args=[e.target]),
+            })
+
+    docs = []
+    for cid, s in summaries.items():
+        payload, etag = _serialize({
+            "cluster": cid,
+            "keywords": _split_keywords(s.keyword),
+            "bill_count": s.bill_count,
+            "latest_vote_date": s.latest_vote_date,
+            "size_rank": s.size_rank,
+            "latest_bills": latest_bills[cid],
+            "party_stance": party_stance[cid],
+            "related": related[cid],
+        })
+        docs.append(ClusterDocument(cluster_num=cid, payload=payload, etag=etag))
+
+    stale = []
+    with transaction.atomic():
+        if cluster_nums is None:
+            gone = ClusterDocument.objects.exclude(cluster_num__in=ids)
+            stale = list(gone.values_list("cluster_num", flat=True))
+            gone.delete()
+        ClusterDocument.objects.bulk_create(
+            docs,
+            update_conflicts=True,
+            unique_fields=["cluster_num"],
+            update_fields=["payload", "etag"],
+        )
+    cache.delete_many([_cache_key(cid) for cid in ids + stale])
+    return len(docs)
+
+
+def get_document(cluster_num: int):
+    """{'etag': str, 'payload': dict} 또는 None (없는 클러스터)"""
+    key = _cache_key(cluster_num)
+    doc = cache.get(key)
+    if doc is not None:
+        return doc or None
+
+    # 문서는 적재(run_all · run_pipeline · build_cluster_documents)에서만 만든다.
+    # 없으면 ETag 함수와 뷰가 한 요청에서 두 번 조회하므로 없다는 결과도 캐시 (build 가 지움)
+    row = ClusterDocument.objects.filter(cluster_num=cluster_num).values("etag", "payload").first()
+    cache.set(key, row or _MISSING, CACHE_SEC)
+    return row
@@ -0,0 +1,127 @@
+# main/cluster_graph.py
+"""
+클러스터 연결 그래프
+────────────────────────────────────────────────────────
+갤럭시 화면에서 클러스터 사이를 선으로 잇기 위한 가중 그래프를 배치로 계산한다.
+- 키워드: 클러스터 × 키워드 0/1 행렬 K 에서 K·Kᵀ = 공유 키워드 수 → 자카드 유사도
+- 표결: 클러스터 × (대수, 정당) 찬성률 행렬 V 를 열 평균으로 중심화·정규화 → V·Vᵀ 코사인 유사도
+두 값을 섞은 가중치로 클러스터마다 상위 TOP_K 간선만 ClusterEdge 에 저장하고,
+요청 시에는 저장된 간선을 JSON 으로 내보내기만 한다.
+- build(top_k)  : 전체 재계산 (적재 스크립트에서 호출)
+- graph_json()  : {"nodes": [...], "links": [...]} (캐시)
+"""
+import numpy as np
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import ClusterEdge, ClusterSummary, PartyClusterStats
+
+TOP_K = 5
+KEYWORD_WEIGHT = 0.6
+VOTE_WEIGHT = 0.4
+MIN_WEIGHT = 0.05
+
+CACHE_KEY = "cluster_graph_json"
+CACHE_SEC = 60 * 60 * 24
+
+
+def _split_keywords(kw_str: str):
+    return {k.strip() for k in (kw_str or "").split(",") if k.strip()}
+
+
+def _keyword_similarity(keyword_sets):
+    """자카드 유사도 행렬 + 공유 키워드 수 행렬"""
+    vocab = {kw: j for j, kw in enumerate(sorted(set().union(*keyword_sets)))}
+    K = np.zeros((len(keyword_sets), max(len(vocab), 1)), dtype=np.float32)
+    for i, kws in enumerate(keyword_sets):
+        K[i, [vocab[k] for k in kws]] = 1.0
+
+    shared = K @ K.T
+    sizes = np.diag(shared)
+    union = sizes[:, None] + sizes[None, :] - shared
+    jaccard = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+    return jaccard, shared
+
+
+def _vote_similarity(cluster_ids):
+    """정당별 찬성률 벡터의 중심화 코사인 유사도 (음수는 0)"""
+    rows = list(
+        PartyClusterStats.objects.filter(cluster_num__in=cluster_ids, total_votes__gt=0)
+        .values_list("cluster_num", "age_id", "party_id", "support_ratio")
+    )
+    n = len(cluster_ids)
+    if not rows:
+        return np.zeros((n, n), dtype=np.float32)
+
+    row_idx = {cid: i for i, cid in enumerate(cluster_ids)}
+    col_idx = {key: j for j, key in enumerate(sorted({(a, p) for _, a, p, _ in rows}))}
+    V = np.full((n, len(col_idx)), np.nan, dtype=np.float32)
+    for cid, age_id, party_id, ratio in rows:
+        V[row_idx[cid], col_idx[(age_id, party_id)]] = ratio
+
+    # 결측(해당 정당 표결 없음)은 열 평균으로 채운 뒤 중심화 (열마다 값이 1개 이상 있음)
+    col_mean = np.nanmean(V, axis=0)
+    V = np.where(np.isnan(V), col_mean, V) - col_mean
+    norms = np.linalg.norm(V, axis=1, keepdims=True)
+    V = np.divide(V, norms, out=np.zeros_like(V), where=norms > 0)
+    return np.clip(V @ V.T, 0.0, 1.0)
+
+
+def build(top_k: int = TOP_K) -> int:
+    """클러스터 간선 재계산 → 저장한 간선 수"""
+    summaries = list(ClusterSummary.objects.order_by("cluster_num"))
+    cluster_ids = [s.cluster_num for s in summaries]
+    edges = []
+
+    if len(cluster_ids) > 1:
+        jaccard, shared = _keyword_similarity([_split_keywords(s.keyword) for s in summaries])
+        vote_sim = _vote_similarity(cluster_ids)
+        weight = KEYWORD_WEIGHT * jaccard + VOTE_WEIGHT * vote_sim
+        np.fill_diagonal(weight, -1.0)
+
+        k = min(top_k, len(cluster_ids) - 1)
+        top = np.argpartition(-weight, k - 1, axis=1)[:, :k]
+        for i, js in enumerate(top):
+            for j in js:
+                if weight[i, j] < MIN_WEIGHT:
+                    continue
+                edges.append(ClusterEdge(
+                    source=cluster_ids[i],
+                    target=cluster_ids[j],
+                    weight=round(float(weight[i, j]), 4),
+                    shared_keywords=int(shared[i, j]),
+                    vote_similarity=round(float(vote_sim[i, j]), 4),
+                ))
+
+    with transaction.atomic():
+        ClusterEdge.objects.all().delete()
+        ClusterEdge.objects.bulk_create(edges, batch_size=1000)
+    cache.delete(CACHE_KEY)
+    return len(edges)
+
+
+def graph_json() -> dict:
+    """노드(클러스터 요약) + 무방향 간선 목록"""
+    data = cache.get(CACHE_KEY)
+    if data is not None:
+        return data
+
+    nodes = [
+        {
+            "cluster_index": s.cluster_num,
+            "keyword": s.keyword,
+            "num_bills": s.bill_count,
+            "url": f"/cardnews/cluster/{s.cluster_num}/",
+        }
+        for s in ClusterSummary.objects.order_by("cluster_num")
+    ]
+    links = {}
+    for src, tgt, w in ClusterEdge.objects.values_list("source", "target", "weight"):
+        key = (min(src, tgt), max(src, tgt))
+        links[key] = max(w, links.get(key, 0.0))
+    data = {
+        "nodes": nodes,
+        "links": [{"source": s, "target": t, "weight": w} for (s, t), w in sorted(links.items())],
+    }
+    cache.set(CACHE_KEY, data, CACHE_SEC)
+    return data
@@ -0,0 +1,79 @@
+# main/cluster_summary.py
+"""
+클러스터 요약(ClusterSummary)
+────────────────────────────────────────────────────────
+홈 갤럭시 노드 · 클러스터 목록이 매 요청마다 Bill/Vote 전체를 집계하지 않도록
+클러스터당 한 행(대표 키워드, 의안 수, 최근 표결일, 규모 순위)을 적재 시 계산해 둔다.
+- rebuild() : 전체 재계산 (클러스터 수백 개 → 집계 쿼리 3번)
+- get_summaries() : 캐시된 요약 목록 (테이블이 비어 있으면 한 번 계산)
+"""
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+
+from billview.models import Bill
+from geovote.models import Vote
+from .models import ClusterSummary
+
+CACHE_KEY = "cluster_summary_list"
+# 요약을 가공해 캐시하는 뷰 키 (main.cluster_keywords_json, history.index)
+DERIVED_CACHE_KEYS = ("cluster_keywords_data", "cluster_list")
+CACHE_SEC = 60 * 60
+
+
+def rebuild() -> int:
+    """클러스터 요약 전체 재계산 → 클러스터 수"""
+    # 클러스터별 가장 많이 쓰인 키워드 문자열을 대표로
+    kw_counts = defaultdict(dict)
+    bill_counts = defaultdict(int)
+    for row in (
+        Bill.objects.filter(cluster__gt=0)
+        .values("cluster", "cluster_keyword")
+        .annotate(cnt=Count("id"))
+    ):
+        bill_counts[row["cluster"]] += row["cnt"]
+        if row["cluster_keyword"]:
+            kw_counts[row["cluster"]][row["cluster_keyword"]] = row["cnt"]
+
+    latest = dict(
+        Vote.objects.filter(bill__cluster__gt=0)
+        .values("bill__cluster")
+        .annotate(last=Max("date"))
+        .values_list("bill__cluster", "last")
+    )
+
+    ranked = sorted(bill_counts, key=lambda c: (-bill_counts[c], c))
+    rows = [
+        ClusterSummary(
+            cluster_num=cid,
+            keyword=max(kw_counts[cid], key=kw_counts[cid].get) if kw_counts[cid] else "",
+            bill_count=bill_counts[cid],
+            latest_vote_date=latest.get(cid),
+            size_rank=rank,
+        )
+        for rank, cid in enumerate(ranked, start=1)
+    ]
+
+    with transaction.atomic():
+        ClusterSummary.objects.exclude(cluster_num__in=ranked).delete()
+        ClusterSummary.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["cluster_num"],
+            update_fields=["keyword", "bill_count", "latest_vote_date", "size_rank"],
+        )
+    cache.delete_many([CACHE_KEY, *DERIVED_CACHE_KEYS])
+    return len(rows)
+
+
+def get_summaries() -> list:
+    summaries = cache.get(CACHE_KEY)
+    if summaries is None:
+        summaries = list(ClusterSummary.objects.all())
+        # 적재 직후 아직 요약이 없으면 여기서 계산 (빈 결과도 CACHE_SEC 동안 캐시됨)
+        if not summaries and rebuild():
+            summaries = list(ClusterSummary.objects.all())
+        cache.set(CACHE_KEY, summaries, CACHE_SEC)
+    return summaries
@@ -0,0 +1,74 @@
+# main/concentration_timeseries.py
+"""
+권력 집중도 시계열(ConcentrationTimeseries)
+────────────────────────────────────────────────────────
+대시보드 · 권력 집중도 페이지의 대수별 HHI · ENP · 상위 양당 점유율 · 정당 수 시계열을
+요청마다 대수별 AgeStats / PartyConcentration 조회(N+1)로 만들지 않도록
+통계 적재(import_db.run_all) 때 전 대수를 한 번에 계산해 저장하고, 화면에는 배열 하나로 내준다.
+- rebuild()        : 전체 재계산 (집계 쿼리 2번) → 대수 수
+- get_timeseries() : 차트용 배열 묶음 (stats 데이터 버전 키로 캐시)
+"""
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .data_version import STATS, get_data_version
+from .models import AgeStats, ConcentrationTimeseries, PartyConcentration
+
+CACHE_SEC = 60 * 60
+
+
+def _cache_key() -> str:
+    return f"concentration_timeseries:{get_data_version(STATS)}"
+
+
+def _compute() -> list:
+    """AgeStats + 상위 2개 정당 점유율 → 저장 전 ConcentrationTimeseries 목록 (대수 순)"""
+    top2 = defaultdict(float)
+    for age_id, seat_share in PartyConcentration.objects.filter(rank__lte=2).values_list('age_id', 'seat_share'):
+        top2[age_id] += seat_share
+
+    return [
+        ConcentrationTimeseries(
+            age_id=stats.age_id,
+            age_number=stats.age.number,
+            total_parties=stats.total_parties,
+            hhi=round(stats.hhi, 4),
+            enp=round(stats.enp, 4),
+            top2_ratio=round(top2[stats.age_id], 2),
+        )
+        for stats in AgeStats.objects.select_related('age').order_by('age__number')
+    ]
+
+
+def rebuild() -> int:
+    rows = _compute()
+    with transaction.atomic():
+        ConcentrationTimeseries.objects.exclude(age_id__in=[r.age_id for r in rows]).delete()
+        ConcentrationTimeseries.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['age'],
+            update_fields=['age_number', 'total_parties', 'hhi', 'enp', 'top2_ratio', 'updated_at'],
+        )
+    # run_all 은 버전을 올리기 전에 스냅샷을 다시 만들므로 현재 버전 키도 비운다
+    cache.delete(_cache_key())
+    return len(rows)
+
+
+def get_timeseries() -> dict:
+    key = _cache_key()
+    data = cache.get(key)
+    if data is None:
+        # 적재 전(마이그레이션 직후)에는 저장 없이 즉석 계산
+        rows = list(ConcentrationTimeseries.objects.all()) or _compute()
+        data = {
+            'ages': [f"{r.age_number}대" for r in rows],
+            'total_parties': [r.total_parties for r in rows],
+            'hhi_values': [r.hhi for r in rows],
+            'enp_values': [r.enp for r in rows],
+            'top2_seat_shares_series': [r.top2_ratio for r in rows],
+        }
+        cache.set(key, data, CACHE_SEC)
+    return data
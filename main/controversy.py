@@ -0,0 +1,187 @@
+# main/controversy.py
+"""
+논쟁 지수 (의안 · 클러스터)
+────────────────────────────────────────────────────────
+의안을 "얼마나 갈렸는지"로 정렬 · 필터하려면 매번 Vote 를 의안별로 집계해야 했다.
+표결 적재 후 Vote 한 번 조회 → pandas groupby 한 번으로 모든 의안의 지표를 계산해
+BillControversy / ClusterControversy 의 인덱스 컬럼에 저장하고, 조회는 ORDER BY score 로 끝낸다.
+
+지표 (출석 = 찬성 + 반대 + 기권)
+- split_ratio      : (반대 + 기권) / 출석
+- margin           : (찬성 - 반대 - 기권) / 출석 – 0 에 가까울수록 박빙
+- party_divergence : 정당별 찬성률의 출석 가중 표준편차 – 정당 간 입장이 갈릴수록 큼 (최대 0.5)
+- absence_rate     : 불참 / 전체
+- score            : 박빙도 · 정당 간 분열 · 불참의 가중합 (0~1)
+클러스터 지표는 소속 의안 지표의 표 수 가중 평균이다.
+
+- rebuild(bill_ids=None) : 지정 의안(None 이면 전체) 재계산 + 해당 클러스터 재집계 → 의안 수
+- top_bills(n, cluster=, age_number=) / top_clusters(n) : 인덱스 순서대로 n개
+"""
+import numpy as np
+import pandas as pd
+from django.db import transaction
+
+from billview.models import Bill
+from geovote.models import Vote
+from .models import BillControversy, ClusterControversy
+
+RESULT_COLUMNS = {'찬성': 'yes', '반대': 'no', '기권': 'abstain', '불참': 'absent'}
+METRICS = ['split_ratio', 'margin', 'party_divergence', 'absence_rate', 'score']
+
+MARGIN_WEIGHT = 0.5       # 1 - |margin| (박빙일수록 큼)
+DIVERGENCE_WEIGHT = 0.4   # 2 × party_divergence (0~1 로 맞춤)
+ABSENCE_WEIGHT = 0.1
+NO_PARTY = -1             # 무소속 · 정당 미상 의원은 한 그룹으로
+
+
+def _vote_frame(bill_ids=None) -> pd.DataFrame:
+    votes = Vote.objects.all()
+    if bill_ids is not None:
+        votes = votes.filter(bill_id__in=list(bill_ids))
+    return pd.DataFrame.from_records(
+        votes.values_list('bill_id', 'member__party_id', 'result'),
+        columns=['bill_id', 'party_id', 'result'],
+    )
+
+
+def compute_bill_metrics(votes: pd.DataFrame) -> pd.DataFrame:
+    """(bill_id, party_id, result) 표 → bill_id 인덱스의 vote_count + METRICS 표"""
+    counts = (
+        votes.assign(party_id=votes['party_id'].fillna(NO_PARTY))
+        .groupby(['bill_id', 'party_id', 'result']).size()
+        .unstack('result', fill_value=0)
+        .reindex(columns=list(RESULT_COLUMNS), fill_value=0)
+        .rename(columns=RESULT_COLUMNS)
+    )
+    counts['present'] = counts['yes'] + counts['no'] + counts['abstain']
+
+    bills = counts.groupby(level='bill_id').sum()
+    total = bills[['yes', 'no', 'abstain', 'absent']].sum(axis=1)
+    present = bills['present'].where(bills['present'] > 0)     # 출석 0 → NaN
+
+    out = pd.DataFrame(index=bills.index)
+    out['vote_count'] = total
+    out['split_ratio'] = ((bills['no'] + bills['abstain']) / present).fillna(0)
+    out['margin'] = ((bills['yes'] - bills['no'] - bills['abstain']) / present).fillna(0)
+    out['absence_rate'] = (bills['absent'] / total.where(total > 0)).fillna(0)
+
+    # 정당별 찬성률이 의안 전체 찬성률에서 얼마나 벗어나는지 (출석 가중 분산)
+    parties = counts[counts['present'] > 0]
+    party_rate = parties['yes'] / parties['present']
+    bill_rate = (bills['yes'] / present).reindex(parties.index.get_level_values('bill_id')).to_numpy()
+    variance = (
+        ((party_rate - bill_rate) ** 2 * parties['present']).groupby(level='bill_id').sum()
+        / bills['present'].where(bills['present'] > 0)
+    )
+    out['party_divergence'] = np.sqrt(variance).reindex(out.index).fillna(0)
+
+    closeness = (1 - out['margin'].abs()).where(bills['present'] > 0, 0)
+    out['score'] = (
+        MARGIN_WEIGHT * closeness
+        + DIVERGENCE_WEIGHT * np.minimum(2 * out['party_divergence'], 1)
+        + ABSENCE_WEIGHT * out['absence_rate']
+    )
+    return out
+
+
+def _rebuild_clusters(cluster_nums=None) -> int:
+    """저장된 의안 지표 → 클러스터별 표 수 가중 평균"""
+    rows = BillControversy.objects.filter(cluster__isnull=False)
+    if cluster_nums is not None:
+        rows = rows.filter(cluster__in=list(cluster_nums))
+    df = pd.DataFrame.from_records(
+        rows.values_list('cluster', 'vote_count', *METRICS),
+        columns=['cluster', 'vote_count', *METRICS],
+    )
+
+    clusters = []
+    if not df.empty:
+        weighted = df[METRICS].mul(df['vote_count'], axis=0).assign(cluster=df['cluster'])
+        grouped = weighted.groupby('cluster')
+        vote_sum = df.groupby('cluster')['vote_count'].sum()
+        means = grouped[METRICS].sum().div(vote_sum.where(vote_sum > 0), axis=0).fillna(0)
+        bill_count = df.groupby('cluster').size()
+        clusters = [
+            ClusterControversy(
+                cluster_num=int(cid),
+                bill_count=int(bill_count[cid]),
+                vote_count=int(vote_sum[cid]),
+                **{m: float(means.at[cid, m]) for m in METRICS},
+            )
+            for cid in means.index
+        ]
+
+    with transaction.atomic():
+        stale = ClusterControversy.objects.exclude(cluster_num__in=[c.cluster_num for c in clusters])
+        if cluster_nums is not None:
+            stale = stale.filter(cluster_num__in=list(cluster_nums))
+        stale.delete()
+        ClusterControversy.objects.bulk_create(
+            clusters,
+            update_conflicts=True,
+            unique_fields=['cluster_num'],
+            update_fields=['bill_count', 'vote_count', *METRICS, 'updated_at'],
+        )
+    return len(clusters)
+
+
+def rebuild(bill_ids=None) -> int:
+    """의안 논쟁 지수 재계산 (bill_ids=None 이면 전체) → 갱신한 의안 수"""
+    if bill_ids is not None:
+        bill_ids = set(bill_ids)
+        if not bill_ids:
+            return 0
+
+    votes = _vote_frame(bill_ids)
+    metrics = compute_bill_metrics(votes) if not votes.empty else pd.DataFrame(columns=['vote_count', *METRICS])
+    meta = {
+        pk: (cluster, age_number)
+        for pk, cluster, age_number in Bill.objects.filter(id__in=metrics.index.tolist())
+        .values_list('id', 'cluster', 'age__number')
+    }
+
+    rows = [
+        BillControversy(
+            bill_id=int(bill_id),
+            cluster=meta.get(bill_id, (None, None))[0],
+            age_number=meta.get(bill_id, (None, None))[1],
+            vote_count=int(row.vote_count),
+            **{m: float(getattr(row, m)) for m in METRICS},
+        )
+        for bill_id, row in zip(metrics.index, metrics.itertuples(index=False))
+    ]
+
+    # 재계산 전 클러스터도 포함 (의안의 클러스터가 바뀐 경우)
+    touched = None
+    if bill_ids is not None:
+        touched = {r.cluster for r in rows} | set(
+            BillControversy.objects.filter(bill_id__in=bill_ids).values_list('cluster', flat=True)
+        )
+        touched.discard(None)
+
+    with transaction.atomic():
+        stale = BillControversy.objects.exclude(bill_id__in=[r.bill_id for r in rows])
+        if bill_ids is not None:
+            stale = stale.filter(bill_id__in=bill_ids)
+        stale.delete()
+        BillControversy.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['bill'],
+            update_fields=['cluster', 'age_number', 'vote_count', *METRICS, 'updated_at'],
+        )
+    _rebuild_clusters(touched)
+    return len(rows)
+
+
+def top_bills(n=10, cluster=None, age_number=None):
+    qs = BillControversy.objects.select_related('bill')
+    if cluster is not None:
+        qs = qs.filter(cluster=cluster)
+    if age_number is not None:
+        qs = qs.filter(age_number=age_number)
+    return list(qs.order_by('-score')[:n])
+
+
+def top_clusters(n=10):
+    return list(ClusterControversy.objects.order_by('-score')[:n])
@@ -0,0 +1,43 @@
+# main/data_version.py
+"""
+데이터 버전 관리
+────────────────────────────────────────────────────────
+적재 스크립트(run_pipeline · import_db)가 끝날 때마다 버전을 올려,
+버전을 키에 포함한 캐시(템플릿 조각 · API 응답)가 자동으로 무효화되게 한다.
+버전은 DB(DataVersion)에 두어 적재 프로세스와 웹 워커가 같은 값을 본다.
+- get_data_version(scope)  : 현재 버전 (짧게 캐시)
+- bump_data_version(scope) : 버전 +1
+"""
+from django.core.cache import cache
+from django.db.models import F
+
+from .models import DataVersion
+
+BILLS = "bills"     # 의안 · 표결 적재 (run_pipeline)
+STATS = "stats"     # 통계 테이블 적재 (main/import_db)
+
+_VERSION_CACHE = 30  # 초
+
+
+def _cache_key(scope: str) -> str:
+    return f"data_version:{scope}"
+
+
+def get_data_version(scope: str = BILLS) -> int:
+    version = cache.get(_cache_key(scope))
+    if version is None:
+        version = (
+            DataVersion.objects.filter(scope=scope)
+            .values_list("version", flat=True)
+            .first()
+        ) or 1
+        cache.set(_cache_key(scope), version, _VERSION_CACHE)
+    return version
+
+
+def bump_data_version(scope: str = BILLS) -> int:
+    obj, _ = DataVersion.objects.get_or_create(scope=scope)
+    DataVersion.objects.filter(pk=obj.pk).update(version=F("version") + 1)
+    obj.refresh_from_db(fields=["version"])
+    cache.delete(_cache_key(scope))
+    return obj.version
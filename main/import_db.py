@@ -9,7 +9,12 @@ django.setup()
 
 from geovote.models import Age, Party, Member, Vote
 from billview.models import Bill
-from main.models import AgeStats, PartyStats, PartyClusterStats, ClusterKeyword, PartyConcentration, VoteSummary
+from main.models import AgeStats, PartyStats, PartyClusterStats, ClusterKeyword, PartyConcentration, VoteSummary, PartyDistinctCluster
+from main import cluster_document, cluster_graph, cluster_summary, concentration_timeseries, member_alignment, party_agreement, stats_matviews
+from main.data_version import STATS, bump_data_version
+from main.vote_counts import party_vote_counts
+from dashboard.snapshot import refresh_snapshots
+from django.db import transaction
 from django.db.models import Count, F, Avg, Q
 from collections import defaultdict
 
@@ -72,8 +77,6 @@ def import_partyStats(congress_num):
         print(f"{congress_num}대에 해당하는 Age 객체가 없습니다.")
         return
 
-    votes = Vote.objects.filter(age=age).select_related('member__party')
-
     # 정당별 멤버 수 집계
     top_parties = (
         Member.objects.filter(age=age)
@@ -87,24 +90,19 @@ def import_partyStats(congress_num):
     # party_id를 key로 멤버 수를 빠르게 조회하기 위한 딕셔너리
     member_count_map = {p['party']: p['member_count'] for p in top_parties}
 
-    # result_types = ['찬성', '반대', '기권', '불참']
+    # 정당별 찬성/반대/기권/불참 수 (조건부 집계 한 번)
+    counts_map = party_vote_counts(age, top_party_ids)
 
     for party in parties:
-        party_votes = votes.filter(member__party=party)
-        total_votes = party_votes.count()
-
-        support_count = party_votes.filter(result='찬성').count()
-        oppose_count = party_votes.filter(result='반대').count()
-        abstain_count = party_votes.filter(result='기권').count()
-        absent_count = party_votes.filter(result='불참').count()
-
+        counts = counts_map.get(party.id, {})
+        total_votes = counts.get('total', 0)
         member_count = member_count_map.get(party.id, 0)
 
         # 비율 계산
-        support_ratio = (support_count / total_votes * 100) if total_votes else 0
-        oppose_ratio = (oppose_count / total_votes * 100) if total_votes else 0
-        abstain_ratio = (abstain_count / total_votes * 100) if total_votes else 0
-        absent_ratio = (absent_count / total_votes * 100) if total_votes else 0
+        support_ratio = (counts.get('찬성', 0) / total_votes * 100) if total_votes else 0
+        oppose_ratio = (counts.get('반대', 0) / total_votes * 100) if total_votes else 0
+        abstain_ratio = (counts.get('기권', 0) / total_votes * 100) if total_votes else 0
+        absent_ratio = (counts.get('불참', 0) / total_votes * 100) if total_votes else 0
 
         pvs, created = PartyStats.objects.update_or_create(
             age=age,
@@ -208,6 +206,48 @@ def import_partyClusterStats(congress_num, top_n_clusters=20):
                     )
             print(f"PartyClusterStats 저장됨: {pcs}")
 
+    import_partyDistinctClusters(age)
+
+# 정당별 특이 클러스터 (반대/기권 비율 상위 k개) – 대시보드 옵션용
+def import_partyDistinctClusters(age, top_k=3):
+    field_map = {
+        'oppose': 'oppose_ratio',
+        'abstain': 'abstain_ratio',
+    }
+
+    # 클러스터 표시용 키워드
+    cluster_keyword_map = {}
+    for ck in ClusterKeyword.objects.filter(age=age):
+        try:
+            keyword_display = ', '.join(json.loads(ck.keyword_json))
+        except (TypeError, ValueError):
+            keyword_display = ck.keyword_json or ''
+        cluster_keyword_map[ck.cluster_num] = keyword_display
+
+    stats_by_party = defaultdict(list)
+    for stat in PartyClusterStats.objects.filter(age=age, total_votes__gt=0):
+        stats_by_party[stat.party_id].append(stat)
+
+    rows = []
+    for party_id, stats in stats_by_party.items():
+        for stance, field_name in field_map.items():
+            ranked = sorted(stats, key=lambda st: getattr(st, field_name), reverse=True)[:top_k]
+            for rank, stat in enumerate(ranked, start=1):
+                rows.append(PartyDistinctCluster(
+                    age=age,
+                    party_id=party_id,
+                    stance=stance,
+                    rank=rank,
+                    cluster_num=stat.cluster_num,
+                    ratio=getattr(stat, field_name),
+                    keyword=cluster_keyword_map.get(stat.cluster_num, ''),
+                ))
+
+    with transaction.atomic():
+        PartyDistinctCluster.objects.filter(age=age).delete()
+        PartyDistinctCluster.objects.bulk_create(rows)
+    print(f"PartyDistinctCluster 저장됨: {len(rows)}건")
+
 def import_partyConcentration(congress_num):
     try:
         age = Age.objects.get(number=congress_num)
@@ -250,6 +290,35 @@ def import_partyConcentration(congress_num):
         )
     print(f"PartyConcentration 저장 완료: {congress_num}대")
 
+# 클러스터 번호-키워드 매핑 (해당 대수에 표결된 의안의 클러스터만)
+def import_clusterKeywords(age):
+    rows = (
+        Bill.objects.filter(vote__age=age, cluster__isnull=False)
+        .values_list('cluster', 'cluster_keyword')
+        .distinct()
+    )
+    for cluster, keyword in rows:
+        ClusterKeyword.objects.update_or_create(
+            age=age,
+            cluster_num=cluster,
+            defaults={'keyword_json': str(keyword)}
+        )
+
+# PostgreSQL 구체화 뷰 갱신 → 통계 테이블 반영 (STATS_BACKEND = 'matview')
+def import_statsFromMatviews(congress_num):
+    try:
+        age = Age.objects.get(number=congress_num)
+    except Age.DoesNotExist:
+        print(f"{congress_num}대에 해당하는 Age 객체가 없습니다.")
+        return
+
+    stats_matviews.refresh()
+    for table, count in stats_matviews.sync_tables(age.id).items():
+        print(f"{table} 저장됨: {count}건")
+
+    import_clusterKeywords(age)
+    import_partyDistinctClusters(age)
+
 # 의원 표결 데이터 
 
 def import_votesummary(congress_num=None, member_name=None):
@@ -332,12 +401,42 @@ def import_votesummary(congress_num=None, member_name=None):
 
 def run_all(congress_num):
     print(f"{congress_num}대 데이터 임포트 시작")
-    import_partyStats(congress_num)
-    import_partyClusterStats(congress_num)
-    import_partyConcentration(congress_num)
-    import_agesStats(congress_num)
+    try:
+        age = Age.objects.get(number=congress_num)
+    except Age.DoesNotExist:
+        print(f"{congress_num}대에 해당하는 Age 객체가 없습니다.")
+        return
+
+    if stats_matviews.enabled():
+        import_statsFromMatviews(congress_num)
+    else:
+        import_partyStats(congress_num)
+        import_partyClusterStats(congress_num)
+        import_partyConcentration(congress_num)
+        import_agesStats(congress_num)
     import_votesummary(congress_num)
 
+    # 의원 - 정당 표결 일치율 (VoteSummary · PartyClusterStats 를 한 번에 비교)
+    print(f"의원 정당 일치율 {member_alignment.rebuild(age.id)}명 갱신")
+
+    # 전 대수 권력 집중도 시계열 롤업
+    print(f"집중도 시계열 {concentration_timeseries.rebuild()}개 대수 갱신")
+
+    # 정당 × 정당 표결 일치 행렬 (해당 대수 전체 재계산)
+    print(f"정당 일치 행렬 {party_agreement.rebuild(age.id)}개 갱신")
+
+    # 정당별 찬성률이 바뀌었으므로 클러스터 연결 그래프 · 상세 문서 재계산
+    # (둘 다 ClusterSummary 를 읽으므로 요약을 먼저 만든다)
+    print(f"클러스터 요약 {cluster_summary.rebuild()}건 갱신")
+    print(f"클러스터 간선 {cluster_graph.build()}개 갱신")
+    print(f"클러스터 문서 {cluster_document.build()}건 생성")
+
+    # 대시보드 스냅샷 (시계열이 전 대수를 담으므로 모든 대수 갱신)
+    print(f"대시보드 스냅샷 {refresh_snapshots()}건 갱신")
+
+    # stats 데이터 버전 갱신 (버전 키를 쓰는 차트 API 캐시 · ETag 무효화)
+    print(f"stats 데이터 버전: {bump_data_version(STATS)}")
+
 
     print(f"{congress_num}대 데이터 임포트 완료")
 
@@ -0,0 +1,20 @@
+# main/management/commands/build_cluster_documents.py
+"""
+클러스터 상세 문서(ClusterDocument) 생성
+
+    python manage.py build_cluster_documents [--cluster 3 --cluster 7]
+"""
+from django.core.management.base import BaseCommand
+
+from main import cluster_document
+
+
+class Command(BaseCommand):
+    help = "/api/cluster/<n>/ 가 내보낼 클러스터 상세 문서를 다시 만든다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cluster", type=int, action="append", help="지정 클러스터만 (여러 번 사용 가능)")
+
+    def handle(self, *args, **options):
+        count = cluster_document.build(options["cluster"])
+        self.stdout.write(self.style.SUCCESS(f"클러스터 문서 {count}건 생성"))
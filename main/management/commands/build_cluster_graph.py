@@ -0,0 +1,20 @@
+# main/management/commands/build_cluster_graph.py
+"""
+클러스터 연결 그래프(ClusterEdge) 재계산
+
+    python manage.py build_cluster_graph [--top-k 5]
+"""
+from django.core.management.base import BaseCommand
+
+from main import cluster_graph
+
+
+class Command(BaseCommand):
+    help = "공유 키워드 · 표결 패턴으로 클러스터 간 상위 k개 간선을 다시 계산한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=cluster_graph.TOP_K)
+
+    def handle(self, *args, **options):
+        count = cluster_graph.build(top_k=options["top_k"])
+        self.stdout.write(self.style.SUCCESS(f"클러스터 간선 {count}개 저장"))
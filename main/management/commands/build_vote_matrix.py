@@ -0,0 +1,29 @@
+# main/management/commands/build_vote_matrix.py
+"""
+대수별 의원 × 의안 표결 행렬(.npy) 재생성
+
+    python manage.py build_vote_matrix               # 전 대수
+    python manage.py build_vote_matrix --congress 22 # 22대만
+
+새 의안 적재 후 증분 갱신은 data_pipeline/run_pipeline.py 가 vote_matrix.append_bills 로 처리한다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from geovote.models import Age
+from main import vote_matrix
+
+
+class Command(BaseCommand):
+    help = "대수별 의원 × 의안 표결 행렬을 다시 만들어 VOTE_MATRIX_ROOT 에 저장한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--congress", type=int, action="append", help="생성할 대수 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        numbers = options["congress"] or list(Age.objects.order_by("number").values_list("number", flat=True))
+        for number in numbers:
+            if not Age.objects.filter(number=number).exists():
+                raise CommandError(f"{number}대에 해당하는 Age 객체가 없습니다.")
+            matrix = vote_matrix.build(number)
+            members, bills = matrix.shape
+            self.stdout.write(self.style.SUCCESS(f"{number}대 표결 행렬: 의원 {members}명 × 의안 {bills}건 → {matrix.path}"))
@@ -0,0 +1,17 @@
+# main/management/commands/rebuild_cluster_summary.py
+"""
+클러스터 요약(ClusterSummary) 재계산
+
+    python manage.py rebuild_cluster_summary
+"""
+from django.core.management.base import BaseCommand
+
+from main import cluster_summary
+
+
+class Command(BaseCommand):
+    help = "홈 갤럭시 · 클러스터 목록용 클러스터 요약을 다시 계산한다."
+
+    def handle(self, *args, **options):
+        count = cluster_summary.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"클러스터 요약 {count}건 갱신"))
@@ -0,0 +1,17 @@
+# main/management/commands/rebuild_controversy.py
+"""
+의안 · 클러스터 논쟁 지수(BillControversy / ClusterControversy) 재계산
+
+    python manage.py rebuild_controversy
+"""
+from django.core.management.base import BaseCommand
+
+from main import controversy
+
+
+class Command(BaseCommand):
+    help = "표결 결과로 의안 · 클러스터 논쟁 지수를 다시 계산한다."
+
+    def handle(self, *args, **options):
+        count = controversy.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"논쟁 지수 {count}건 갱신"))
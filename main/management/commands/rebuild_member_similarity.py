@@ -0,0 +1,29 @@
+# main/management/commands/rebuild_member_similarity.py
+"""
+비슷하게 투표한 의원(MemberSimilarity) 재계산
+
+    python manage.py rebuild_member_similarity               # 전 대수
+    python manage.py rebuild_member_similarity --congress 22 # 22대만
+
+표결 행렬이 없으면 먼저 만든다 (main/vote_matrix.py).
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from geovote.models import Age
+from main import member_similarity
+
+
+class Command(BaseCommand):
+    help = "대수 전체 · 클러스터별로 의원마다 표결이 비슷한 의원 top-k 를 다시 계산한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--congress", type=int, action="append", help="재계산할 대수 (여러 번 지정 가능)")
+        parser.add_argument("--top-k", type=int, default=member_similarity.TOP_K, help="의원당 저장할 이웃 수")
+
+    def handle(self, *args, **options):
+        numbers = options["congress"] or list(Age.objects.order_by("number").values_list("number", flat=True))
+        for number in numbers:
+            if not Age.objects.filter(number=number).exists():
+                raise CommandError(f"{number}대에 해당하는 Age 객체가 없습니다.")
+            count = member_similarity.rebuild(number, k=options["top_k"])
+            self.stdout.write(self.style.SUCCESS(f"{number}대 유사 의원 {count}건 갱신"))
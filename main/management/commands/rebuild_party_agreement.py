@@ -0,0 +1,28 @@
+# main/management/commands/rebuild_party_agreement.py
+"""
+정당 × 정당 표결 일치 행렬(PartyAgreement) 재계산
+
+    python manage.py rebuild_party_agreement               # 전 대수
+    python manage.py rebuild_party_agreement --congress 22 # 22대만
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from geovote.models import Age
+from main import party_agreement
+
+
+class Command(BaseCommand):
+    help = "대수 · 클러스터별 정당 간 표결 일치 행렬을 다시 계산한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--congress", type=int, help="재계산할 대수 (없으면 전체)")
+
+    def handle(self, *args, **options):
+        age_id = None
+        if options["congress"] is not None:
+            try:
+                age_id = Age.objects.get(number=options["congress"]).id
+            except Age.DoesNotExist:
+                raise CommandError(f"{options['congress']}대에 해당하는 Age 객체가 없습니다.")
+        count = party_agreement.rebuild(age_id)
+        self.stdout.write(self.style.SUCCESS(f"정당 일치 행렬 {count}개 갱신"))
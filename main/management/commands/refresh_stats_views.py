@@ -0,0 +1,36 @@
+# main/management/commands/refresh_stats_views.py
+"""
+통계 구체화 뷰 갱신 (PostgreSQL)
+
+    python manage.py refresh_stats_views               # 뷰만 갱신
+    python manage.py refresh_stats_views --congress 22 # 갱신 후 22대 통계 테이블 반영
+
+전체 적재는 main/import_db.py 가 STATS_BACKEND = 'matview' 일 때 같은 경로로 처리한다.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from geovote.models import Age
+from main import stats_matviews
+
+
+class Command(BaseCommand):
+    help = "통계 구체화 뷰를 CONCURRENTLY 갱신하고, 선택한 대수의 통계 테이블에 반영한다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--congress", type=int, action="append", help="테이블에 반영할 대수 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        if not stats_matviews.is_supported():
+            raise CommandError("통계 구체화 뷰는 PostgreSQL 에서만 사용할 수 있습니다.")
+
+        stats_matviews.refresh()
+        self.stdout.write(self.style.SUCCESS(f"구체화 뷰 {len(stats_matviews.VIEWS)}개 갱신"))
+
+        for number in options["congress"] or []:
+            try:
+                age = Age.objects.get(number=number)
+            except Age.DoesNotExist:
+                raise CommandError(f"{number}대에 해당하는 Age 객체가 없습니다.")
+            counts = stats_matviews.sync_tables(age.id)
+            summary = ", ".join(f"{table} {count}건" for table, count in counts.items())
+            self.stdout.write(self.style.SUCCESS(f"{number}대 통계 테이블 반영: {summary}"))
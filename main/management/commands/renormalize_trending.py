@@ -0,0 +1,25 @@
+# main/management/commands/renormalize_trending.py
+"""
+급상승 점수 정리 (cron 등으로 주기 실행)
+
+    python manage.py renormalize_trending            # 감쇠된 행 정리 + 클러스터 점수 재계산
+    python manage.py renormalize_trending --rebuild  # BillLike 전체로 재계산
+"""
+from django.core.management.base import BaseCommand
+
+from main import trending
+
+
+class Command(BaseCommand):
+    help = "급상승(trending) 점수 테이블을 정리하거나 BillLike 로 다시 만든다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true", help="BillLike 전체로 재계산")
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            trending.rebuild()
+            self.stdout.write(self.style.SUCCESS("급상승 점수 재계산 완료"))
+            return
+        deleted = trending.renormalize()
+        self.stdout.write(self.style.SUCCESS(f"급상승 점수 정리 완료 (삭제 {deleted}건)"))
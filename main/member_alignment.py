@@ -0,0 +1,106 @@
+# main/member_alignment.py
+"""
+의원 - 소속 정당 표결 일치율 (MemberAlignment)
+────────────────────────────────────────────────────────
+member_alignment_api 는 의원의 VoteSummary 를 돌며 클러스터마다 PartyClusterStats 를 조회했다.
+통계 적재(import_db.run_all) 때 대수 하나의 VoteSummary · PartyClusterStats 를 한 번씩 읽어
+(정당, 클러스터)로 합친 뒤, 정당 다수 입장 · 의원 다수 입장을 idxmax 로 한꺼번에 구해 비교하고
+의원별 일치율과 이탈 클러스터를 저장한다. API 는 의원 한 행만 읽는다.
+- 입장 = 찬성 · 반대 · 기권 중 가장 큰 값 (동률이면 앞쪽), 정당 통계가 없는 클러스터는 비교하지 않음
+- compute(summaries, party_stats) : 의원별 일치 집계 표
+- rebuild(age_id)                : 대수 하나 재계산 → 의원 수
+"""
+from collections import defaultdict
+
+import pandas as pd
+from django.db import transaction
+
+from .models import MemberAlignment, PartyClusterStats, VoteSummary
+
+STANCES = ['찬성', '반대', '기권']
+PARTY_RATIOS = {'support_ratio': '찬성', 'oppose_ratio': '반대', 'abstain_ratio': '기권'}
+
+
+def compute(summaries: pd.DataFrame, party_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    summaries   : member_id, party_id, cluster_num, 찬성, 반대, 기권
+    party_stats : party_id, cluster_num, support_ratio, oppose_ratio, abstain_ratio
+    → member_id 인덱스의 alignment_count, total_clusters, deviating_clusters
+    """
+    party = party_stats.rename(columns=PARTY_RATIOS)
+    party['party_stance'] = party[STANCES].idxmax(axis=1)
+    merged = summaries.assign(member_stance=summaries[STANCES].idxmax(axis=1)).merge(
+        party[['party_id', 'cluster_num', 'party_stance']], on=['party_id', 'cluster_num'], how='inner'
+    )
+    merged['aligned'] = merged['member_stance'] == merged['party_stance']
+
+    grouped = merged.groupby('member_id')
+    out = pd.DataFrame({
+        'alignment_count': grouped['aligned'].sum().astype(int),
+        'total_clusters': grouped.size(),
+    })
+    deviating = defaultdict(list)
+    for row in merged[~merged['aligned']].sort_values(['member_id', 'cluster_num']).itertuples(index=False):
+        deviating[row.member_id].append({
+            'cluster_num': int(row.cluster_num),
+            'member_stance': row.member_stance,
+            'party_stance': row.party_stance,
+        })
+    out['deviating_clusters'] = [deviating[m] for m in out.index]
+    return out
+
+
+def _summary_frame(age_id) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(
+        VoteSummary.objects.filter(member__age_id=age_id)
+        .values_list('member_id', 'member__party_id', 'cluster', *STANCES),
+        columns=['member_id', 'party_id', 'cluster_num', *STANCES],
+    )
+    # VoteSummary.cluster 는 문자열로 저장됨
+    df['cluster_num'] = pd.to_numeric(df['cluster_num'], errors='coerce')
+    return df.dropna(subset=['cluster_num']).astype({'cluster_num': int})
+
+
+def _party_frame(age_id) -> pd.DataFrame:
+    return pd.DataFrame.from_records(
+        PartyClusterStats.objects.filter(age_id=age_id)
+        .values_list('party_id', 'cluster_num', *PARTY_RATIOS),
+        columns=['party_id', 'cluster_num', *PARTY_RATIOS],
+    )
+
+
+def rebuild(age_id) -> int:
+    summaries = _summary_frame(age_id)
+    party_stats = _party_frame(age_id)
+    result = compute(summaries, party_stats) if not summaries.empty else pd.DataFrame()
+
+    # VoteSummary 가 있는 의원은 비교할 클러스터가 없어도 0/0 행을 둔다 (기존 API 와 같은 응답)
+    rows = []
+    for member_id, party_id in summaries.groupby('member_id')['party_id'].first().items():
+        member_id, party_id = int(member_id), int(party_id)
+        aligned = int(result.at[member_id, 'alignment_count']) if member_id in result.index else 0
+        total = int(result.at[member_id, 'total_clusters']) if member_id in result.index else 0
+        rate = round(aligned / total * 100, 2) if total else 0
+        rows.append(MemberAlignment(
+            member_id=member_id,
+            age_id=age_id,
+            party_id=party_id,
+            alignment_count=aligned,
+            total_clusters=total,
+            alignment_rate=rate,
+            deviation_rate=round(100 - rate, 2),
+            deviating_clusters=result.at[member_id, 'deviating_clusters'] if member_id in result.index else [],
+        ))
+
+    with transaction.atomic():
+        MemberAlignment.objects.filter(age_id=age_id).exclude(member_id__in=[r.member_id for r in rows]).delete()
+        MemberAlignment.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['member'],
+            update_fields=[
+                'age', 'party', 'alignment_count', 'total_clusters',
+                'alignment_rate', 'deviation_rate', 'deviating_clusters', 'updated_at',
+            ],
+        )
+    return len(rows)
@@ -0,0 +1,92 @@
+# main/member_similarity.py
+"""
+비슷하게 투표한 의원 (top-k 이웃)
+────────────────────────────────────────────────────────
+표결 행렬(main/vote_matrix.py)에서 의원 쌍의 표결 일치율을 행렬곱 한 번으로 모두 구하고,
+대수 전체 · 클러스터별로 의원마다 상위 TOP_K 명을 MemberSimilarity 에 저장한다 (조회는 한 행 = O(k)).
+- 일치율 = 둘 다 출석(찬성 · 반대 · 기권)한 의안 중 같은 결과를 낸 비율
+  agree = Σ_r O_r @ O_r.T (O_r = 결과 r 의 0/1 행렬), common = 출석 @ 출석.T
+- 함께 출석한 의안이 MIN_COMMON 건 미만인 쌍은 이웃 후보에서 뺀다
+- agreement(votes)                : (agree, common) 의원 × 의원 행렬
+- top_k(agree, common, k)         : 의원별 상위 k 열 번호 + 일치율 행렬
+- rebuild(age_number)             : 대수 하나 재계산 → 저장 행 수
+- neighbors(member_id, cluster=None) : 저장된 이웃 목록
+"""
+import numpy as np
+from django.db import transaction
+
+from geovote.models import Age, Member
+from . import vote_matrix
+from .models import MemberSimilarity
+
+TOP_K = 10
+MIN_COMMON = 3
+STANCE_CODES = vote_matrix.STANCE_CODES
+
+
+def agreement(votes):
+    votes = np.asarray(votes)
+    # float32 행렬곱 (BLAS) – 의안 수 < 2^24 이면 쌍 수가 정확히 표현된다
+    agree = sum(O @ O.T for O in ((votes == code).astype(np.float32) for code in STANCE_CODES))
+    present = np.isin(votes, STANCE_CODES).astype(np.float32)
+    return agree, present @ present.T
+
+
+def top_k(agree, common, k=TOP_K, min_common=MIN_COMMON):
+    """→ (idx [의원, k'], rate) – rate 가 음수인 칸은 후보가 아님 (자기 자신 · 공통 출석 부족)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rate = np.where(common >= min_common, agree / common, -1.0)
+    np.fill_diagonal(rate, -1.0)
+
+    k = min(k, len(rate) - 1)
+    if k <= 0:
+        return np.zeros((len(rate), 0), dtype=np.int64), rate
+    idx = np.argpartition(-rate, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(rate, idx, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(idx, order, axis=1), rate
+
+
+def rebuild(age_number, k=TOP_K) -> int:
+    matrix = vote_matrix.load(age_number) or vote_matrix.build(age_number)
+    age = Age.objects.get(number=age_number)
+    info = {
+        m['id']: m for m in Member.objects.filter(id__in=matrix.members.tolist())
+        .values('id', 'name', 'party__party', 'party__color')
+    }
+
+    groups = [(None, slice(None))] + [
+        (int(c), matrix.cluster_cols(c))
+        for c in np.unique(matrix.clusters) if c != vote_matrix.NO_CLUSTER
+    ]
+    member_ids = matrix.members.tolist()
+    rows = []
+    for cluster_num, cols in groups:
+        agree, common = agreement(matrix.votes[:, cols])
+        idx, rate = top_k(agree, common, k)
+        for i, member_id in enumerate(member_ids):
+            neighbors = [
+                {
+                    'member_id': member_ids[j],
+                    'name': info[member_ids[j]]['name'],
+                    'party': info[member_ids[j]]['party__party'],
+                    'color': info[member_ids[j]]['party__color'],
+                    'rate': round(float(rate[i, j]) * 100, 1),
+                    'common': int(common[i, j]),
+                }
+                for j in idx[i] if rate[i, j] >= 0 and member_ids[j] in info
+            ]
+            if neighbors and member_id in info:
+                rows.append(MemberSimilarity(
+                    member_id=member_id, age=age, cluster_num=cluster_num, neighbors=neighbors,
+                ))
+
+    with transaction.atomic():
+        MemberSimilarity.objects.filter(age=age).delete()
+        MemberSimilarity.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+def neighbors(member_id, cluster=None):
+    rows = MemberSimilarity.objects.filter(member_id=member_id)
+    rows = rows.filter(cluster_num__isnull=True) if cluster is None else rows.filter(cluster_num=cluster)
+    return rows.values_list('neighbors', flat=True).first()
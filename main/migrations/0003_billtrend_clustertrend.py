@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billview', '0002_initial'),
+        ('main', '0002_dataversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusterTrend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField(unique=True)),
+                ('log_score', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-log_score'], name='main_cluste_log_sco_a6461f_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='BillTrend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster', models.IntegerField(blank=True, null=True)),
+                ('log_score', models.FloatField(default=0.0)),
+                ('like_events', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('bill', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='trend', to='billview.bill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-log_score'], name='main_billtr_log_sco_198351_idx'), models.Index(fields=['cluster', '-log_score'], name='main_billtr_cluster_f56efb_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_billtrend_clustertrend'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusterSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField(unique=True)),
+                ('keyword', models.TextField(blank=True, default='')),
+                ('bill_count', models.PositiveIntegerField(default=0)),
+                ('latest_vote_date', models.DateField(blank=True, null=True)),
+                ('size_rank', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['cluster_num'],
+                'indexes': [models.Index(fields=['size_rank'], name='main_cluste_size_ra_7a1e71_idx')],
+            },
+        ),
+    ]
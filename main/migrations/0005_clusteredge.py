@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_clustersummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusterEdge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.IntegerField()),
+                ('target', models.IntegerField()),
+                ('weight', models.FloatField(default=0.0)),
+                ('shared_keywords', models.PositiveIntegerField(default=0)),
+                ('vote_similarity', models.FloatField(default=0.0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['source', '-weight'], name='main_cluste_source_1dae2b_idx')],
+                'unique_together': {('source', 'target')},
+            },
+        ),
+    ]
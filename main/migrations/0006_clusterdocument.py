@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_clusteredge'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClusterDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField(unique=True)),
+                ('payload', models.JSONField(default=dict)),
+                ('etag', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geovote', '0001_initial'),
+        ('main', '0006_clusterdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartyDistinctCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stance', models.CharField(choices=[('oppose', '반대'), ('abstain', '기권')], max_length=10)),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('cluster_num', models.IntegerField()),
+                ('ratio', models.FloatField(default=0)),
+                ('keyword', models.TextField(blank=True, default='')),
+                ('age', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geovote.age')),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geovote.party')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['age', 'stance', 'rank'], name='main_partyd_age_id_1014d8_idx')],
+                'unique_together': {('age', 'party', 'stance', 'rank')},
+            },
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:21
+
+from django.db import migrations, models
+
+
+def create_matviews(apps, schema_editor):
+    from main import stats_matviews
+    if stats_matviews.is_supported(schema_editor.connection):
+        stats_matviews.create(schema_editor.connection)
+
+
+def drop_matviews(apps, schema_editor):
+    from main import stats_matviews
+    if stats_matviews.is_supported(schema_editor.connection):
+        stats_matviews.drop(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billview', '0004_billcard'),
+        ('geovote', '0001_initial'),
+        ('main', '0007_partydistinctcluster'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgeStatsView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_bills', models.PositiveIntegerField()),
+                ('total_parties', models.PositiveIntegerField()),
+                ('male_count', models.PositiveIntegerField()),
+                ('female_count', models.PositiveIntegerField()),
+                ('female_percent', models.FloatField()),
+                ('hhi', models.FloatField()),
+                ('enp', models.FloatField()),
+            ],
+            options={
+                'db_table': 'main_mv_agestats',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PartyClusterStatsView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField()),
+                ('cluster_keyword', models.JSONField(null=True)),
+                ('support_ratio', models.FloatField()),
+                ('oppose_ratio', models.FloatField()),
+                ('abstain_ratio', models.FloatField()),
+                ('absent_ratio', models.FloatField()),
+                ('total_votes', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'main_mv_partyclusterstats',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PartyConcentrationView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('member_count', models.PositiveIntegerField()),
+                ('vote_support_ratio', models.FloatField()),
+                ('seat_share', models.FloatField()),
+            ],
+            options={
+                'db_table': 'main_mv_partyconcentration',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PartyStatsView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('member_count', models.PositiveIntegerField()),
+                ('support_ratio', models.FloatField()),
+                ('oppose_ratio', models.FloatField()),
+                ('abstain_ratio', models.FloatField()),
+                ('absent_ratio', models.FloatField()),
+                ('total_votes', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'main_mv_partystats',
+                'managed': False,
+            },
+        ),
+        # PostgreSQL 에서만 구체화 뷰 생성 (그 외 DB 는 통계 테이블을 Python 으로 채움)
+        migrations.RunPython(create_matviews, drop_matviews),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geovote', '0001_initial'),
+        ('main', '0008_stats_matviews'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConcentrationTimeseries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('age_number', models.PositiveSmallIntegerField()),
+                ('total_parties', models.PositiveIntegerField(default=0)),
+                ('hhi', models.FloatField(default=0.0)),
+                ('enp', models.FloatField(default=0.0)),
+                ('top2_ratio', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('age', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='geovote.age')),
+            ],
+            options={
+                'ordering': ['age_number'],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billview', '0004_billcard'),
+        ('main', '0009_concentrationtimeseries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BillControversy',
+            fields=[
+                ('bill', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='controversy', serialize=False, to='billview.bill')),
+                ('cluster', models.IntegerField(blank=True, null=True)),
+                ('age_number', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('vote_count', models.PositiveIntegerField(default=0)),
+                ('split_ratio', models.FloatField(default=0.0)),
+                ('margin', models.FloatField(default=0.0)),
+                ('party_divergence', models.FloatField(default=0.0)),
+                ('absence_rate', models.FloatField(default=0.0)),
+                ('score', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-score'], name='main_billco_score_114fbf_idx'), models.Index(fields=['cluster', '-score'], name='main_billco_cluster_121349_idx'), models.Index(fields=['age_number', '-score'], name='main_billco_age_num_eea066_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ClusterControversy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField(unique=True)),
+                ('bill_count', models.PositiveIntegerField(default=0)),
+                ('vote_count', models.PositiveIntegerField(default=0)),
+                ('split_ratio', models.FloatField(default=0.0)),
+                ('margin', models.FloatField(default=0.0)),
+                ('party_divergence', models.FloatField(default=0.0)),
+                ('absence_rate', models.FloatField(default=0.0)),
+                ('score', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-score'], name='main_cluste_score_d1e11c_idx')],
+            },
+        ),
+    ]
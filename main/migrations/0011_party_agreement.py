@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geovote', '0001_initial'),
+        ('main', '0010_controversy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartyAgreement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField()),
+                ('party_ids', models.JSONField(default=list)),
+                ('bill_count', models.PositiveIntegerField(default=0)),
+                ('agree', models.BinaryField()),
+                ('common', models.BinaryField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('age', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='party_agreements', to='geovote.age')),
+            ],
+            options={
+                'unique_together': {('age', 'cluster_num')},
+            },
+        ),
+    ]
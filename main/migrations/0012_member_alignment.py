@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geovote', '0001_initial'),
+        ('main', '0011_party_agreement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberAlignment',
+            fields=[
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='alignment', serialize=False, to='geovote.member')),
+                ('alignment_count', models.PositiveIntegerField(default=0)),
+                ('total_clusters', models.PositiveIntegerField(default=0)),
+                ('alignment_rate', models.FloatField(default=0.0)),
+                ('deviation_rate', models.FloatField(default=0.0)),
+                ('deviating_clusters', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('age', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geovote.age')),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geovote.party')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['age', '-deviation_rate'], name='main_member_age_id_0585f7_idx')],
+            },
+        ),
+    ]
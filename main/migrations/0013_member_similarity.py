@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-19 16:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geovote', '0001_initial'),
+        ('main', '0012_member_alignment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_num', models.IntegerField(blank=True, null=True)),
+                ('neighbors', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('age', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='geovote.age')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='geovote.member')),
+            ],
+            options={
+                'unique_together': {('member', 'cluster_num')},
+            },
+        ),
+    ]
@@ -121,3 +121,295 @@ class VoteSummary(models.Model):
 
     def __str__(self):
         return f"{self.member_name} - {self.cluster}"
+
+
+# 의원 - 소속 정당 표결 일치율 (main/member_alignment.py 가 import_db.run_all 때 계산)
+class MemberAlignment(models.Model):
+    member = models.OneToOneField(Member, on_delete=models.CASCADE, primary_key=True, related_name='alignment')
+    age = models.ForeignKey(Age, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    alignment_count = models.PositiveIntegerField(default=0)     # 정당 다수 입장과 같은 클러스터 수
+    total_clusters = models.PositiveIntegerField(default=0)      # 비교한 클러스터 수
+    alignment_rate = models.FloatField(default=0.0)              # %
+    deviation_rate = models.FloatField(default=0.0)              # 100 - alignment_rate
+    deviating_clusters = models.JSONField(default=list)          # [{cluster_num, member_stance, party_stance}]
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['age', '-deviation_rate']),
+        ]
+
+    def __str__(self):
+        return f"{self.member_id} 정당 일치율 {self.alignment_rate}%"
+
+
+# 비슷하게 투표한 의원 top-k (main/member_similarity.py 가 대수 · 클러스터별로 미리 계산)
+class MemberSimilarity(models.Model):
+    member = models.ForeignKey(Member, on_delete=models.CASCADE, related_name='similarities')
+    age = models.ForeignKey(Age, on_delete=models.CASCADE)
+    cluster_num = models.IntegerField(null=True, blank=True)     # None = 대수 전체
+    neighbors = models.JSONField(default=list)                   # [{member_id, name, party, color, rate, common}] 일치율 순
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('member', 'cluster_num')
+
+    def __str__(self):
+        return f"{self.member_id} 유사 의원 (클러스터 {self.cluster_num})"
+
+
+# 데이터 버전 (적재 시마다 증가 → 버전 키를 쓰는 캐시 무효화)
+class DataVersion(models.Model):
+    scope = models.CharField(max_length=30, unique=True)   # 'bills', 'stats' 등
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.scope} v{self.version}"
+
+
+# 급상승 의안/클러스터 점수 (지수 감쇠, 로그 스케일 저장)
+class BillTrend(models.Model):
+    bill = models.OneToOneField('billview.Bill', on_delete=models.CASCADE, related_name='trend')
+    cluster = models.IntegerField(null=True, blank=True)
+    log_score = models.FloatField(default=0.0)   # log(Σ exp((좋아요 시각 - EPOCH) / τ))
+    like_events = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-log_score']),
+            models.Index(fields=['cluster', '-log_score']),
+        ]
+
+    def __str__(self):
+        return f"{self.bill_id} trend {self.log_score:.3f}"
+
+
+class ClusterTrend(models.Model):
+    cluster_num = models.IntegerField(unique=True)
+    log_score = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-log_score']),
+        ]
+
+    def __str__(self):
+        return f"클러스터 {self.cluster_num} trend {self.log_score:.3f}"
+
+
+# 클러스터 요약 (홈 갤럭시 · 클러스터 목록용, 적재 시 갱신)
+class ClusterSummary(models.Model):
+    cluster_num = models.IntegerField(unique=True)
+    keyword = models.TextField(blank=True, default='')            # 대표 키워드 문자열 ('a, b, c')
+    bill_count = models.PositiveIntegerField(default=0)
+    latest_vote_date = models.DateField(null=True, blank=True)
+    size_rank = models.PositiveIntegerField(default=0)            # 의안 수 기준 순위 (1 = 최대)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['cluster_num']
+        indexes = [
+            models.Index(fields=['size_rank']),
+        ]
+
+    @property
+    def first_keyword(self):
+        return self.keyword.split(',')[0].strip()
+
+    def __str__(self):
+        return f"클러스터 {self.cluster_num} ({self.bill_count}건)"
+
+
+# 클러스터 연결 그래프 (공유 키워드 + 표결 패턴 유사도, 클러스터당 상위 k개 간선)
+class ClusterEdge(models.Model):
+    source = models.IntegerField()                        # 클러스터 번호
+    target = models.IntegerField()
+    weight = models.FloatField(default=0.0)               # 종합 가중치 (0~1)
+    shared_keywords = models.PositiveIntegerField(default=0)
+    vote_similarity = models.FloatField(default=0.0)      # 정당별 찬성률 벡터 코사인 유사도
+
+    class Meta:
+        unique_together = ('source', 'target')
+        indexes = [
+            models.Index(fields=['source', '-weight']),
+        ]
+
+    def __str__(self):
+        return f"{self.source} → {self.target} ({self.weight:.2f})"
+
+
+# 클러스터 상세 문서 (키워드 · 의안 · 정당별 입장 · 연관 클러스터를 한 JSON 으로, 적재 시 생성)
+class ClusterDocument(models.Model):
+    cluster_num = models.IntegerField(unique=True)
+    payload = models.JSONField(default=dict)
+    etag = models.CharField(max_length=64)                 # payload 해시
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"클러스터 {self.cluster_num} 문서"
+
+
+# 정당별 특이 클러스터 (대수 · 정당 · 입장별 비율 상위 k개, import_partyClusterStats 가 채움)
+class PartyDistinctCluster(models.Model):
+    STANCE_CHOICES = [('oppose', '반대'), ('abstain', '기권')]
+
+    age = models.ForeignKey(Age, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    stance = models.CharField(max_length=10, choices=STANCE_CHOICES)
+    rank = models.PositiveSmallIntegerField()             # 1 = 비율 최고
+    cluster_num = models.IntegerField()
+    ratio = models.FloatField(default=0)
+    keyword = models.TextField(blank=True, default='')    # 표시용 키워드 ('a, b, c')
+
+    class Meta:
+        unique_together = ('age', 'party', 'stance', 'rank')
+        indexes = [
+            models.Index(fields=['age', 'stance', 'rank']),
+        ]
+
+    def __str__(self):
+        return f"{self.age} {self.party.party} {self.get_stance_display()} {self.rank}위 - 클러스터 {self.cluster_num}"
+
+
+# 대수별 권력 집중도 시계열 (전 대수 한 묶음, import_db.run_all 이 갱신)
+class ConcentrationTimeseries(models.Model):
+    age = models.OneToOneField(Age, on_delete=models.CASCADE)
+    age_number = models.PositiveSmallIntegerField()              # 정렬 · 표시용 대수
+    total_parties = models.PositiveIntegerField(default=0)
+    hhi = models.FloatField(default=0.0)
+    enp = models.FloatField(default=0.0)
+    top2_ratio = models.FloatField(default=0.0)                  # 상위 양당 의석 점유율(%)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['age_number']
+
+    def __str__(self):
+        return f"{self.age_number}대 집중도 (HHI {self.hhi})"
+
+
+# 논쟁 지수 (표결 분포 기반, main/controversy.py 가 적재 시 계산)
+class BillControversy(models.Model):
+    bill = models.OneToOneField('billview.Bill', on_delete=models.CASCADE, primary_key=True, related_name='controversy')
+    cluster = models.IntegerField(null=True, blank=True)
+    age_number = models.PositiveSmallIntegerField(null=True, blank=True)
+    vote_count = models.PositiveIntegerField(default=0)
+    split_ratio = models.FloatField(default=0.0)          # 출석 의원 중 찬성 외(반대 · 기권) 비율
+    margin = models.FloatField(default=0.0)               # (찬성 - 반대 - 기권) / 출석, 작을수록 박빙
+    party_divergence = models.FloatField(default=0.0)     # 정당별 찬성률의 가중 표준편차 (0~0.5)
+    absence_rate = models.FloatField(default=0.0)         # 불참 비율
+    score = models.FloatField(default=0.0)                # 종합 논쟁 지수 (0~1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-score']),
+            models.Index(fields=['cluster', '-score']),
+            models.Index(fields=['age_number', '-score']),
+        ]
+
+    def __str__(self):
+        return f"{self.bill_id} 논쟁 지수 {self.score:.3f}"
+
+
+class ClusterControversy(models.Model):
+    cluster_num = models.IntegerField(unique=True)
+    bill_count = models.PositiveIntegerField(default=0)
+    vote_count = models.PositiveIntegerField(default=0)
+    split_ratio = models.FloatField(default=0.0)          # 이하 의안 지표의 표 수 가중 평균
+    margin = models.FloatField(default=0.0)
+    party_divergence = models.FloatField(default=0.0)
+    absence_rate = models.FloatField(default=0.0)
+    score = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-score']),
+        ]
+
+    def __str__(self):
+        return f"클러스터 {self.cluster_num} 논쟁 지수 {self.score:.3f}"
+
+
+# 정당 × 정당 표결 일치 행렬 (대수 · 클러스터별, main/party_agreement.py 가 계산)
+# agree / common 은 party_ids 순서의 int64 정방 행렬을 그대로 담은 바이트 (np.frombuffer 로 복원)
+class PartyAgreement(models.Model):
+    age = models.ForeignKey(Age, on_delete=models.CASCADE, related_name='party_agreements')
+    cluster_num = models.IntegerField()
+    party_ids = models.JSONField(default=list)            # 행렬 행 · 열 순서
+    bill_count = models.PositiveIntegerField(default=0)
+    agree = models.BinaryField()                          # 같은 결과(찬성 · 반대 · 기권)를 낸 의원 쌍 수
+    common = models.BinaryField()                         # 둘 다 출석한 의원 쌍 수
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('age', 'cluster_num')
+
+    def __str__(self):
+        return f"{self.age} 클러스터 {self.cluster_num} 정당 일치 행렬"
+
+
+# ───────────────────────── 통계 구체화 뷰 (PostgreSQL, managed=False) ─────────────────────────
+# main/stats_matviews.py 가 정의 · 갱신하는 뷰를 읽기 전용으로 매핑 (필드는 같은 이름의 통계 테이블과 동일)
+class AgeStatsView(models.Model):
+    age = models.OneToOneField(Age, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    total_bills = models.PositiveIntegerField()
+    total_parties = models.PositiveIntegerField()
+    male_count = models.PositiveIntegerField()
+    female_count = models.PositiveIntegerField()
+    female_percent = models.FloatField()
+    hhi = models.FloatField()
+    enp = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'main_mv_agestats'
+
+
+class PartyStatsView(models.Model):
+    age = models.ForeignKey(Age, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    party = models.ForeignKey(Party, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    member_count = models.PositiveIntegerField()
+    support_ratio = models.FloatField()
+    oppose_ratio = models.FloatField()
+    abstain_ratio = models.FloatField()
+    absent_ratio = models.FloatField()
+    total_votes = models.PositiveIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'main_mv_partystats'
+
+
+class PartyClusterStatsView(models.Model):
+    age = models.ForeignKey(Age, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    cluster_num = models.IntegerField()
+    cluster_keyword = models.JSONField(null=True)
+    party = models.ForeignKey(Party, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    support_ratio = models.FloatField()
+    oppose_ratio = models.FloatField()
+    abstain_ratio = models.FloatField()
+    absent_ratio = models.FloatField()
+    total_votes = models.PositiveIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'main_mv_partyclusterstats'
+
+
+class PartyConcentrationView(models.Model):
+    age = models.ForeignKey(Age, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    party = models.ForeignKey(Party, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    member_count = models.PositiveIntegerField()
+    vote_support_ratio = models.FloatField()
+    seat_share = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'main_mv_partyconcentration'
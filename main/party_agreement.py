@@ -0,0 +1,169 @@
+# main/party_agreement.py
+"""
+정당 × 정당 표결 일치 행렬
+────────────────────────────────────────────────────────
+"클러스터 X 에서 A당과 B당이 얼마나 같은 쪽에 표를 던졌나"를 Vote 쌍 비교 없이 답하려고
+(대수, 클러스터)마다 의원 × 의안 표결 행렬 V 를 만들고 행렬곱으로 정당 쌍 집계를 구한다.
+- P   : 정당 × 의원 소속 행렬 (0/1)
+- C_r : P @ (V == r)  → 정당 × 의안별 결과 r(찬성 · 반대 · 기권) 표 수
+- agree  = Σ_r C_r @ C_r.T : 두 정당 의원 쌍 중 같은 결과를 낸 쌍 수
+- common = S @ S.T (S = P @ 출석) : 둘 다 출석한 의원 쌍 수
+대각선은 자기 자신과의 쌍을 빼서 같은 당 의원끼리의 일치(결속도)가 되게 한다. 일치율 = agree / common.
+쌍 수는 의안마다 더해지므로 대수 전체 행렬은 클러스터 행렬의 합이다.
+- rebuild(age_id=None) : 대수(None 이면 전체)의 모든 클러스터 재계산 → 행렬 수
+- update(bill_ids)     : 의안이 속한 (대수, 클러스터)만 재계산 (run_pipeline 표결 적재 후)
+- get_matrix(age, cluster_num=None, party_ids=None) : 쌍 수 행렬 (cluster_num=None 이면 클러스터 합)
+- clusters(age)  : 행렬이 있는 클러스터 목록
+- agreement_rate(agree, common) : 일치율 행렬 (쌍이 없으면 NaN)
+"""
+from functools import reduce
+from operator import or_
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from django.db.models import Q
+
+from geovote.models import Vote
+from .models import PartyAgreement
+
+RESULT_CODES = {'찬성': 1, '반대': 2, '기권': 3}    # 그 외(불참) = 0
+COLUMNS = ['age_id', 'cluster_num', 'bill_id', 'member_id', 'party_id', 'result']
+
+
+def _to_bytes(matrix) -> bytes:
+    return np.ascontiguousarray(matrix, dtype=np.int64).tobytes()
+
+
+def _from_bytes(raw, n) -> np.ndarray:
+    return np.frombuffer(bytes(raw), dtype=np.int64).reshape(n, n)
+
+
+def _vote_frame(groups=None, age_id=None) -> pd.DataFrame:
+    votes = Vote.objects.filter(bill__cluster__isnull=False, member__party__isnull=False)
+    if age_id is not None:
+        votes = votes.filter(age_id=age_id)
+    if groups is not None:
+        votes = votes.filter(reduce(or_, (Q(age_id=a, bill__cluster=c) for a, c in groups)))
+    return pd.DataFrame.from_records(
+        votes.values_list('age_id', 'bill__cluster', 'bill_id', 'member_id', 'member__party_id', 'result'),
+        columns=COLUMNS,
+    )
+
+
+def compute_matrices(votes: pd.DataFrame):
+    """한 (대수, 클러스터)의 표결 → (party_ids, agree, common, 의안 수)"""
+    member_idx, _ = pd.factorize(votes['member_id'])
+    bill_idx, bill_ids = pd.factorize(votes['bill_id'])
+    member_party = votes['party_id'].groupby(member_idx).first().to_numpy()
+    party_ids, party_idx = np.unique(member_party, return_inverse=True)
+
+    V = np.zeros((len(member_party), len(bill_ids)), dtype=np.int8)
+    V[member_idx, bill_idx] = votes['result'].map(RESULT_CODES).fillna(0).to_numpy(dtype=np.int8)
+
+    P = np.zeros((len(party_ids), len(member_party)))
+    P[party_idx, np.arange(len(member_party))] = 1
+
+    # 정수 행렬곱은 BLAS 를 못 타므로 float64 로 곱한다 (쌍 수 < 2^53 이라 정확)
+    agree = sum((C @ C.T) for C in (P @ (V == code) for code in RESULT_CODES.values()))
+    S = P @ (V > 0)
+    common = S @ S.T
+    self_pairs = S.sum(axis=1)
+    agree[np.diag_indices_from(agree)] -= self_pairs
+    common[np.diag_indices_from(common)] -= self_pairs
+
+    return [int(p) for p in party_ids], np.rint(agree).astype(np.int64), np.rint(common).astype(np.int64), len(bill_ids)
+
+
+def _save(frame: pd.DataFrame, stale) -> int:
+    """frame 의 (대수, 클러스터)별 행렬 저장, stale 중 다시 만들지 않은 행은 삭제"""
+    rows = []
+    if not frame.empty:
+        for (age_id, cluster_num), votes in frame.groupby(['age_id', 'cluster_num']):
+            party_ids, agree, common, bill_count = compute_matrices(votes)
+            rows.append(PartyAgreement(
+                age_id=int(age_id),
+                cluster_num=int(cluster_num),
+                party_ids=party_ids,
+                bill_count=bill_count,
+                agree=_to_bytes(agree),
+                common=_to_bytes(common),
+            ))
+
+    kept = {(r.age_id, r.cluster_num) for r in rows}
+    with transaction.atomic():
+        stale_ids = [
+            pk for pk, age_id, cluster_num in stale.values_list('id', 'age_id', 'cluster_num')
+            if (age_id, cluster_num) not in kept
+        ]
+        PartyAgreement.objects.filter(id__in=stale_ids).delete()
+        PartyAgreement.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['age', 'cluster_num'],
+            update_fields=['party_ids', 'bill_count', 'agree', 'common', 'updated_at'],
+        )
+    return len(rows)
+
+
+def rebuild(age_id=None) -> int:
+    stale = PartyAgreement.objects.all()
+    if age_id is not None:
+        stale = stale.filter(age_id=age_id)
+    return _save(_vote_frame(age_id=age_id), stale)
+
+
+def update(bill_ids) -> int:
+    """의안이 속한 (대수, 클러스터) 행렬만 다시 계산 → 갱신한 행렬 수"""
+    bill_ids = set(bill_ids)
+    if not bill_ids:
+        return 0
+    groups = set(
+        Vote.objects.filter(bill_id__in=bill_ids, bill__cluster__isnull=False)
+        .values_list('age_id', 'bill__cluster').distinct()
+    )
+    if not groups:
+        return 0
+    stale = PartyAgreement.objects.filter(reduce(or_, (Q(age_id=a, cluster_num=c) for a, c in groups)))
+    return _save(_vote_frame(groups=groups), stale)
+
+
+def get_matrix(age, cluster_num=None, party_ids=None) -> dict:
+    """저장된 행렬을 party_ids 순서로 맞춰 합산 (party_ids=None 이면 등장한 모든 정당, id 순)"""
+    rows = PartyAgreement.objects.filter(age=age)
+    if cluster_num is not None:
+        rows = rows.filter(cluster_num=cluster_num)
+    rows = list(rows)
+    if party_ids is None:
+        party_ids = sorted({pid for r in rows for pid in r.party_ids})
+
+    index = {pid: i for i, pid in enumerate(party_ids)}
+    agree = np.zeros((len(party_ids), len(party_ids)), dtype=np.int64)
+    common = np.zeros_like(agree)
+    for r in rows:
+        src = [i for i, pid in enumerate(r.party_ids) if pid in index]
+        dst = [index[r.party_ids[i]] for i in src]
+        n = len(r.party_ids)
+        agree[np.ix_(dst, dst)] += _from_bytes(r.agree, n)[np.ix_(src, src)]
+        common[np.ix_(dst, dst)] += _from_bytes(r.common, n)[np.ix_(src, src)]
+
+    return {
+        'party_ids': list(party_ids),
+        'agree': agree,
+        'common': common,
+        'bill_count': sum(r.bill_count for r in rows),
+    }
+
+
+def clusters(age) -> list:
+    """행렬이 있는 클러스터 [(cluster_num, bill_count)] – 의안 많은 순"""
+    return list(
+        PartyAgreement.objects.filter(age=age)
+        .order_by('-bill_count', 'cluster_num')
+        .values_list('cluster_num', 'bill_count')
+    )
+
+
+def agreement_rate(agree, common) -> np.ndarray:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(common > 0, agree / common, np.nan)
@@ -0,0 +1,221 @@
+# main/stats_matviews.py
+"""
+통계 구체화 뷰 (PostgreSQL 전용 통계 백엔드)
+────────────────────────────────────────────────────────
+AgeStats · PartyStats · PartyClusterStats · PartyConcentration 을 Python 루프의 행 단위
+update_or_create 대신 Vote · Member · Bill 위의 구체화 뷰로 정의하고, 적재 후
+REFRESH MATERIALIZED VIEW CONCURRENTLY 로 DB 안에서 재계산한다 (갱신 중에도 읽기는 막히지 않음).
+기존 화면 · API 는 통계 테이블을 그대로 읽으므로, 갱신된 뷰는 집합 연산 한 번(INSERT … SELECT
+… ON CONFLICT)으로 테이블에 옮긴다. 뷰 자체는 main.models 의 *View (managed=False) 로 조회할 수 있다.
+settings.STATS_BACKEND = 'matview' 이고 DB 가 PostgreSQL 일 때만 import_db.run_all 이 이 경로를 쓴다.
+- enabled()          : 이 백엔드를 쓸 수 있는지
+- create(connection) : 뷰 · 고유 인덱스 생성 (마이그레이션 0008)
+- drop(connection)   : 뷰 삭제
+- refresh()          : 모든 뷰를 의존 순서대로 CONCURRENTLY 갱신
+- sync_tables(age_id): 대수 하나의 뷰 내용을 통계 테이블로 반영
+"""
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import (
+    AgeStats, AgeStatsView, PartyClusterStats, PartyClusterStatsView,
+    PartyConcentration, PartyConcentrationView, PartyStats, PartyStatsView,
+)
+
+# 정당별 의석 수 (정당 없는 의원 제외)
+_SEATS = """
+    SELECT age_id, party_id, COUNT(*) AS member_count
+    FROM geovote_member
+    WHERE party_id IS NOT NULL
+    GROUP BY age_id, party_id
+"""
+
+# 결과별 표 수 → 비율(%) 컬럼
+_RATIOS = """
+    COALESCE(c.support * 100.0 / NULLIF(c.total_votes, 0), 0)::float8 AS support_ratio,
+    COALESCE(c.oppose * 100.0 / NULLIF(c.total_votes, 0), 0)::float8 AS oppose_ratio,
+    COALESCE(c.abstain * 100.0 / NULLIF(c.total_votes, 0), 0)::float8 AS abstain_ratio,
+    COALESCE(c.absent * 100.0 / NULLIF(c.total_votes, 0), 0)::float8 AS absent_ratio,
+    COALESCE(c.total_votes, 0) AS total_votes
+"""
+
+_COUNTS = """
+    COUNT(*) AS total_votes,
+    COUNT(*) FILTER (WHERE v.result = '찬성') AS support,
+    COUNT(*) FILTER (WHERE v.result = '반대') AS oppose,
+    COUNT(*) FILTER (WHERE v.result = '기권') AS abstain,
+    COUNT(*) FILTER (WHERE v.result = '불참') AS absent
+"""
+
+# (뷰 모델, 통계 테이블 모델, 고유 키, 정의) – 의존 순서 (PartyConcentration 은 PartyClusterStats 뷰를 읽음)
+VIEWS = [
+    (AgeStatsView, AgeStats, ('age_id',), f"""
+        WITH seats AS ({_SEATS}),
+        shares AS (
+            SELECT age_id, member_count::float8 / SUM(member_count) OVER (PARTITION BY age_id) AS share
+            FROM seats
+        ),
+        concentration AS (
+            SELECT age_id, SUM(share * share) AS hhi FROM shares GROUP BY age_id
+        ),
+        members AS (
+            SELECT age_id,
+                   COUNT(DISTINCT party_id) AS total_parties,
+                   COUNT(*) FILTER (WHERE gender = '남') AS male_count,
+                   COUNT(*) FILTER (WHERE gender = '여') AS female_count
+            FROM geovote_member
+            GROUP BY age_id
+        ),
+        bills AS (
+            SELECT age_id, COUNT(*) AS total_bills FROM billview_bill GROUP BY age_id
+        )
+        SELECT m.age_id AS id,
+               m.age_id,
+               COALESCE(b.total_bills, 0) AS total_bills,
+               m.total_parties,
+               m.male_count,
+               m.female_count,
+               COALESCE(ROUND(m.female_count * 100.0 / NULLIF(m.male_count + m.female_count, 0), 1), 0)::float8
+                   AS female_percent,
+               ROUND(COALESCE(c.hhi, 0)::numeric, 4)::float8 AS hhi,
+               COALESCE(ROUND((1 / NULLIF(c.hhi, 0))::numeric, 4), 0)::float8 AS enp
+        FROM members m
+        LEFT JOIN bills b ON b.age_id = m.age_id
+        LEFT JOIN concentration c ON c.age_id = m.age_id
+    """),
+    (PartyStatsView, PartyStats, ('age_id', 'party_id'), f"""
+        WITH seats AS ({_SEATS}),
+        counts AS (
+            SELECT v.age_id, m.party_id, {_COUNTS}
+            FROM geovote_vote v
+            JOIN geovote_member m ON m.id = v.member_id
+            GROUP BY v.age_id, m.party_id
+        )
+        SELECT ROW_NUMBER() OVER (ORDER BY s.age_id, s.party_id) AS id,
+               s.age_id,
+               s.party_id,
+               s.member_count,
+               {_RATIOS}
+        FROM seats s
+        LEFT JOIN counts c ON c.age_id = s.age_id AND c.party_id = s.party_id
+    """),
+    (PartyClusterStatsView, PartyClusterStats, ('age_id', 'cluster_num', 'party_id'), f"""
+        WITH counts AS (
+            SELECT v.age_id, b.cluster AS cluster_num, m.party_id, {_COUNTS}
+            FROM geovote_vote v
+            JOIN billview_bill b ON b.id = v.bill_id
+            JOIN geovote_member m ON m.id = v.member_id
+            WHERE b.cluster IS NOT NULL
+            GROUP BY v.age_id, b.cluster, m.party_id
+        ),
+        clusters AS (
+            SELECT DISTINCT age_id, cluster_num FROM counts
+        ),
+        parties AS (
+            SELECT DISTINCT age_id, party_id FROM geovote_member WHERE party_id IS NOT NULL
+        )
+        SELECT ROW_NUMBER() OVER (ORDER BY cl.age_id, cl.cluster_num, p.party_id) AS id,
+               cl.age_id,
+               cl.cluster_num,
+               p.party_id,
+               -- import_partyClusterStats 와 같이 결과별 표 수 JSON 을 문자열로 저장
+               to_jsonb(CASE WHEN c.total_votes IS NULL THEN '{{}}'
+                             ELSE json_build_object('찬성', c.support, '반대', c.oppose,
+                                                    '기권', c.abstain, '불참', c.absent)::text
+                        END) AS cluster_keyword,
+               {_RATIOS}
+        FROM clusters cl
+        JOIN parties p ON p.age_id = cl.age_id
+        LEFT JOIN counts c
+               ON c.age_id = cl.age_id AND c.cluster_num = cl.cluster_num AND c.party_id = p.party_id
+    """),
+    (PartyConcentrationView, PartyConcentration, ('age_id', 'party_id', 'rank'), f"""
+        WITH seats AS ({_SEATS}),
+        supports AS (
+            SELECT age_id, party_id, AVG(support_ratio) AS vote_support_ratio
+            FROM main_mv_partyclusterstats
+            GROUP BY age_id, party_id
+        )
+        SELECT ROW_NUMBER() OVER (ORDER BY s.age_id, s.member_count DESC, s.party_id) AS id,
+               s.age_id,
+               s.party_id,
+               ROW_NUMBER() OVER (PARTITION BY s.age_id ORDER BY s.member_count DESC, s.party_id) AS rank,
+               s.member_count,
+               COALESCE(sp.vote_support_ratio, 0)::float8 AS vote_support_ratio,
+               (s.member_count * 100.0 / SUM(s.member_count) OVER (PARTITION BY s.age_id))::float8 AS seat_share
+        FROM seats s
+        LEFT JOIN supports sp ON sp.age_id = s.age_id AND sp.party_id = s.party_id
+    """),
+]
+
+
+def is_supported(conn=connection) -> bool:
+    return conn.vendor == 'postgresql'
+
+
+def enabled() -> bool:
+    return getattr(settings, 'STATS_BACKEND', 'python') == 'matview' and is_supported()
+
+
+def _q(conn, name):
+    return conn.ops.quote_name(name)
+
+
+def create(conn=connection):
+    """뷰 + CONCURRENTLY 갱신에 필요한 고유 인덱스 생성 (비어 있어도 WITH DATA 로 채운 상태로 만든다)"""
+    with conn.cursor() as cursor:
+        for view_model, _, key, definition in VIEWS:
+            view = view_model._meta.db_table
+            cursor.execute(f"CREATE MATERIALIZED VIEW {_q(conn, view)} AS {definition} WITH DATA")
+            cursor.execute(
+                f"CREATE UNIQUE INDEX {_q(conn, view + '_key')} ON {_q(conn, view)} "
+                f"({', '.join(_q(conn, col) for col in key)})"
+            )
+
+
+def drop(conn=connection):
+    with conn.cursor() as cursor:
+        for view_model, *_ in reversed(VIEWS):
+            cursor.execute(f"DROP MATERIALIZED VIEW IF EXISTS {_q(conn, view_model._meta.db_table)}")
+
+
+def refresh(conn=connection):
+    """모든 뷰 재계산 – CONCURRENTLY 라 갱신 중에도 이전 내용을 계속 읽을 수 있다"""
+    with conn.cursor() as cursor:
+        for view_model, *_ in VIEWS:
+            cursor.execute(
+                f"REFRESH MATERIALIZED VIEW CONCURRENTLY {_q(conn, view_model._meta.db_table)}"
+            )
+
+
+def _sync_sql(conn, view_model, table_model, key):
+    """대수 하나에 대해 (사라진 행 삭제 SQL, upsert SQL)"""
+    view = _q(conn, view_model._meta.db_table)
+    table = _q(conn, table_model._meta.db_table)
+    columns = [f.column for f in table_model._meta.concrete_fields if not f.primary_key]
+    updates = [col for col in columns if col not in key]
+
+    col_list = ', '.join(_q(conn, col) for col in columns)
+    key_match = ' AND '.join(f"v.{_q(conn, col)} = t.{_q(conn, col)}" for col in key)
+    delete_sql = (
+        f"DELETE FROM {table} t WHERE t.age_id = %s "
+        f"AND NOT EXISTS (SELECT 1 FROM {view} v WHERE {key_match})"
+    )
+    upsert_sql = (
+        f"INSERT INTO {table} ({col_list}) SELECT {col_list} FROM {view} WHERE age_id = %s "
+        f"ON CONFLICT ({', '.join(_q(conn, col) for col in key)}) DO UPDATE SET "
+        + ', '.join(f"{_q(conn, col)} = EXCLUDED.{_q(conn, col)}" for col in updates)
+    )
+    return delete_sql, upsert_sql
+
+
+def sync_tables(age_id, conn=connection) -> dict:
+    """갱신된 뷰에서 대수 하나의 통계를 테이블로 반영 → {테이블: 반영 행 수}"""
+    counts = {}
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        for view_model, table_model, key, _ in VIEWS:
+            delete_sql, upsert_sql = _sync_sql(conn, view_model, table_model, key)
+            cursor.execute(delete_sql, [age_id])
+            cursor.execute(upsert_sql, [age_id])
+            counts[table_model.__name__] = cursor.rowcount
+    return counts
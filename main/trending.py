@@ -0,0 +1,157 @@
+# main/trending.py
+"""
+급상승(trending) 의안 · 클러스터 점수
+────────────────────────────────────────────────────────
+좋아요 1건의 기여도는 시간이 지날수록 exp(-Δt/τ) 로 줄어든다.
+고정 기준 시각 EPOCH 를 두고 각 좋아요를 exp((t - EPOCH)/τ) 로 더해 두면
+모든 행이 같은 비율로 감쇠하므로 저장값만으로 순위를 매길 수 있다.
+값이 무한히 커지지 않도록 로그 스케일(log_score)로 저장한다.
+
+- record_like(bill)            : 좋아요 발생 시 점수 증가 (증분 갱신)
+- record_unlike(bill, liked_at): 좋아요 취소 시 당시 기여분 차감
+- top_bills(n) / top_clusters(n): 인덱스 순서대로 n개만 읽음
+- renormalize()                : 감쇠된 행 정리 + 클러스터 점수 재계산 (주기 실행)
+- rebuild()                    : BillLike 전체로 처음부터 다시 계산
+"""
+import math
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from django.db import transaction
+from django.utils import timezone as dj_tz
+
+from accounts.models import BillLike
+from .models import BillTrend, ClusterTrend
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+HALF_LIFE_HOURS = 48
+TAU = HALF_LIFE_HOURS * 3600 / math.log(2)   # 초 단위 시간 상수
+MIN_SCORE = 0.01                             # 현재 점수가 이보다 작으면 정리 대상
+
+
+# ---------- 로그 스케일 연산 ----------
+def _log_weight(ts: datetime) -> float:
+    return (ts - EPOCH).total_seconds() / TAU
+
+
+def _logaddexp(a: float, b: float) -> float:
+    hi, lo = max(a, b), min(a, b)
+    return hi + math.log1p(math.exp(lo - hi))
+
+
+def _logsubexp(a: float, b: float):
+    """log(exp(a) - exp(b)), 결과가 0 이하이면 None"""
+    if b >= a:
+        return None
+    return a + math.log1p(-math.exp(b - a))
+
+
+def current_score(log_score: float, now: datetime = None) -> float:
+    """저장된 log_score 를 현재 시각 기준 감쇠 점수로 변환"""
+    now = now or dj_tz.now()
+    return math.exp(log_score - _log_weight(now))
+
+
+# ---------- 증분 갱신 ----------
+def _apply(model, lookup: dict, weight: float, sign: int, defaults: dict):
+    if sign > 0:
+        # 첫 좋아요가 동시에 들어와도 유니크 제약 위에서 한쪽만 생성, 나머지는 잠근 행에 더함
+        obj, created = model.objects.select_for_update().get_or_create(
+            **lookup, defaults={**defaults, 'log_score': weight},
+        )
+        if created:
+            return
+        obj.log_score = _logaddexp(obj.log_score, weight)
+    else:
+        obj = model.objects.select_for_update().filter(**lookup).first()
+        if obj is None:
+            return
+        new_score = _logsubexp(obj.log_score, weight)
+        if new_score is None:
+            obj.delete()
+            return
+        obj.log_score = new_score
+
+    if hasattr(obj, 'like_events'):
+        obj.like_events = max(obj.like_events + sign, 0)
+    obj.save()
+
+
+@transaction.atomic
+def record_like(bill, liked_at: datetime = None):
+    weight = _log_weight(liked_at or dj_tz.now())
+    _apply(BillTrend, {'bill': bill}, weight, +1, {'cluster': bill.cluster, 'like_events': 1})
+    if bill.cluster:
+        _apply(ClusterTrend, {'cluster_num': bill.cluster}, weight, +1, {})
+
+
+@transaction.atomic
+def record_unlike(bill, liked_at: datetime):
+    weight = _log_weight(liked_at)
+    _apply(BillTrend, {'bill': bill}, weight, -1, {})
+    if bill.cluster:
+        _apply(ClusterTrend, {'cluster_num': bill.cluster}, weight, -1, {})
+
+
+# ---------- 조회 ----------
+def top_bills(n: int = 10, cluster: int = None):
+    qs = BillTrend.objects.select_related('bill')
+    if cluster is not None:
+        qs = qs.filter(cluster=cluster)
+    return [t.bill for t in qs.order_by('-log_score')[:n]]
+
+
+def top_clusters(n: int = 10) -> list[int]:
+    return list(
+        ClusterTrend.objects.order_by('-log_score').values_list('cluster_num', flat=True)[:n]
+    )
+
+
+# ---------- 주기 작업 ----------
+@transaction.atomic
+def renormalize(now: datetime = None) -> int:
+    """
+    현재 점수가 MIN_SCORE 미만인 행을 지우고 클러스터 점수를 의안 점수로 다시 맞춘다.
+    (개별 증분 갱신에서 생긴 오차 정리) → 삭제된 의안 행 수 반환
+    """
+    threshold = math.log(MIN_SCORE) + _log_weight(now or dj_tz.now())
+    deleted, _ = BillTrend.objects.filter(log_score__lt=threshold).delete()
+
+    cluster_scores = {}
+    for cluster, log_score in BillTrend.objects.exclude(cluster__isnull=True).values_list('cluster', 'log_score'):
+        prev = cluster_scores.get(cluster)
+        cluster_scores[cluster] = log_score if prev is None else _logaddexp(prev, log_score)
+
+    ClusterTrend.objects.exclude(cluster_num__in=list(cluster_scores)).delete()
+    existing = {ct.cluster_num: ct for ct in ClusterTrend.objects.all()}
+    to_update, to_create = [], []
+    for cluster, log_score in cluster_scores.items():
+        if cluster in existing:
+            existing[cluster].log_score = log_score
+            to_update.append(existing[cluster])
+        else:
+            to_create.append(ClusterTrend(cluster_num=cluster, log_score=log_score))
+    ClusterTrend.objects.bulk_update(to_update, ['log_score'])
+    ClusterTrend.objects.bulk_create(to_create)
+    return deleted
+
+
+@transaction.atomic
+def rebuild():
+    """BillLike 전체로 점수 재계산 (초기 적재 · 복구용)"""
+    bill_scores = {}
+    bill_counts = defaultdict(int)
+    bill_clusters = {}
+    for bill_id, cluster, created_at in BillLike.objects.values_list('bill_id', 'bill__cluster', 'created_at'):
+        w = _log_weight(created_at)
+        prev = bill_scores.get(bill_id)
+        bill_scores[bill_id] = w if prev is None else _logaddexp(prev, w)
+        bill_counts[bill_id] += 1
+        bill_clusters[bill_id] = cluster
+
+    BillTrend.objects.all().delete()
+    BillTrend.objects.bulk_create([
+        BillTrend(bill_id=bid, cluster=bill_clusters[bid], log_score=s, like_events=bill_counts[bid])
+        for bid, s in bill_scores.items()
+    ], batch_size=1000)
+    renormalize()
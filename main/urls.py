@@ -13,5 +13,7 @@ urlpatterns = [
     path("search/",                     main_v.search,                name="search"),
     path("galaxy/",                     main_v.cluster_galaxy_view,   name="cluster_galaxy"),
     path("api/cluster_keywords/",       main_v.cluster_keywords_json, name="cluster_keywords_json"),
+    path("api/cluster_graph/",          main_v.cluster_graph_json,    name="cluster_graph_json"),
+    path("api/cluster/<int:cluster_num>/", main_v.cluster_document_json, name="cluster_document_json"),
     path("api/autocomplete/",           main_v.autocomplete,          name="autocomplete"),
 ]
@@ -7,28 +7,30 @@ main · history 앱이 동일한 기준을 사용하도록 통합했다.
 """
 from __future__ import annotations
 
-import logging, random, re
+import hashlib, logging, random, re
 from collections import Counter, defaultdict
 
 from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db.models import (
     Count,
-    Max,
     OuterRef,
     Q,
     Subquery,
 )
-from django.db.models.functions import Random
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
-from django.views.decorators.http import require_GET
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
 
+from billview.cards import get_cards
 from billview.models import Bill
 from geovote.models import Vote, Age, Member
 from search import search_service as ss           # ★ 공통 검색 모듈
+from .data_version import BILLS, STATS, get_data_version
 from .models import VoteSummary
+from . import cluster_document, cluster_graph, cluster_summary, trending
 import random, logging, urllib.parse
 
 
@@ -60,57 +62,65 @@ def cluster_keywords_json(request):
     if cached:
         return JsonResponse(cached, safe=False)
 
-    qs = (
-        Bill.objects
-            .exclude(cluster_keyword__isnull=True)
-            .exclude(cluster_keyword__exact="")
-            .values("cluster", "cluster_keyword")
-            .annotate(
-                num_bills=Count("id", distinct=True),
-                latest_passed_date=Max("vote__date"),
-            )
-            .filter(num_bills__gt=1)
-            .order_by(Random())
-    )
-    qs_list   = list(qs[:300])
-    sampled   = random.sample(qs_list, min(len(qs_list), 100))
+    candidates = [
+        c for c in cluster_summary.get_summaries()
+        if c.keyword and c.bill_count > 1
+    ]
+    sampled   = random.sample(candidates, min(len(candidates), 100))
     result    = [
         {
-            "cluster_index": row["cluster"],
-            "keyword"      : row["cluster_keyword"],
-            "num_bills"    : row["num_bills"],
+            "cluster_index": c.cluster_num,
+            "keyword"      : c.keyword,
+            "num_bills"    : c.bill_count,
             "latest_passed_date": (
-                row["latest_passed_date"].isoformat()
-                if row["latest_passed_date"] else None
+                c.latest_vote_date.isoformat()
+                if c.latest_vote_date else None
             ),
-            "url": f"/cardnews/cluster/{row['cluster']}/",
+            "url": f"/cardnews/cluster/{c.cluster_num}/",
         }
-        for row in sampled
+        for c in sampled
     ]
     cache.set("cluster_keywords_data", result, 600)
     return JsonResponse(result, safe=False)
 
+# 클러스터 연결 그래프 (배치로 계산된 간선만 내보냄 · 간선은 두 적재 경로 모두에서 다시 계산되므로 두 버전으로 재검증)
+def _cluster_graph_etag(request):
+    raw = f"{get_data_version(BILLS)}:{get_data_version(STATS)}|{request.get_full_path()}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+@require_GET
+@cache_control(public=True, max_age=300)
+@condition(etag_func=_cluster_graph_etag)
+def cluster_graph_json(request):
+    return JsonResponse(cluster_graph.graph_json())
+
+# 클러스터 상세 문서 (적재 시 생성 · ETag 로 재검증)
+def _cluster_document_etag(request, cluster_num):
+    doc = cluster_document.get_document(cluster_num)
+    return doc["etag"] if doc else None
+
+@require_GET
+@cache_control(public=True, max_age=300)
+@condition(etag_func=_cluster_document_etag)
+def cluster_document_json(request, cluster_num):
+    doc = cluster_document.get_document(cluster_num)
+    if doc is None:
+        raise Http404("존재하지 않는 클러스터입니다.")
+    return JsonResponse(doc["payload"], json_dumps_params={"ensure_ascii": False})
+
 # ───────────────────────── 3. 홈(갤럭시) 뷰 ───────────────────────────────
 def cluster_galaxy_view(request):
     return render(request, "home.html")
 
 def home(request):
-    clusters_raw = (
-        Bill.objects
-            .filter(cluster__isnull=False, cluster__gt=0)
-            .values("cluster", "cluster_keyword")
-            .distinct()
-            .order_by("cluster")
-    )
     clusters = [
-        {
-            "cluster": row["cluster"],
-            "keyword": row["cluster_keyword"] or "키워드 없음",
-        }
-        for row in clusters_raw
-        if isinstance(row["cluster"], int) and row["cluster"] > 0
+        {"cluster": c.cluster_num, "keyword": c.keyword or "키워드 없음"}
+        for c in cluster_summary.get_summaries()
     ]
-    return render(request, "home.html", {"clusters": clusters})
+    return render(request, "home.html", {
+        "clusters": clusters,
+        "trending_bills": trending.top_bills(5),
+    })
 
 def aboutUs(request):
     return render(request, "aboutUs.html")
@@ -141,21 +151,13 @@ def search(request):
                         .values("id")[:1]
                 )
             )
-            .annotate(last_vote_date=Max("vote__date"))
             .order_by("-bill_number")
         )
-        total_results_count = results.count()
-
-        # 라벨별 개정 횟수
-        label_counts = {
-            r["label"]: r["count"]
-            for r in (
-                Bill.objects
-                    .filter(label__in=[b.label for b in results if b.label])
-                    .values("label")
-                    .annotate(count=Count("id"))
-            )
-        }
+        results = list(results)
+        total_results_count = len(results)
+
+        # 개정 횟수 · 가공 제목 · 최근 표결일은 BillCard 에서 한 번에
+        cards = get_cards(b.id for b in results)
 
         # 클러스터 키워드 정리 (results 기준으로 바꿈!)
         cluster_to_keywords = defaultdict(set)
@@ -195,16 +197,15 @@ def search(request):
 
         # 라벨 개정 횟수, 제목 가공
         for bill in results:
-            bill.label_count = label_counts.get(bill.label, "-")
-            words = bill.title.split()
-            bill.title_custom = (
-                " ".join(words[:4]) + "<br>" + " ".join(words[4:])
-            ) if len(words) > 4 else bill.title
+            card = cards.get(bill.id)
+            bill.label_count = card.revision_count if card else "-"
+            bill.title_custom = card.title_custom if card else bill.title
+            bill.last_vote_date = card.last_vote_date if card else None
 
         # 정렬 (개정 횟수 많은 순)
         results = sorted(
             results,
-            key=lambda b: label_counts.get(b.label, 0),
+            key=lambda b: b.label_count if b.label else 0,
             reverse=True,
         )
 
@@ -0,0 +1,36 @@
+# main/vote_counts.py
+"""
+정당별 표결 결과 집계 (조건부 집계 한 번)
+────────────────────────────────────────────────────────
+결과별로 filter().count() 를 반복하거나 (정당, 결과) 로 그룹핑해 다시 모으는 대신
+Count(filter=Q(result=…)) 로 정당당 한 행에 찬성 · 반대 · 기권 · 불참 · 합계를 함께 센다.
+통계 적재(import_db)와 PartyStats 가 없을 때의 대시보드 즉석 재집계가 같이 쓴다.
+"""
+from django.db.models import Count, Q
+
+from geovote.models import Vote
+
+RESULT_TYPES = ['찬성', '반대', '기권', '불참']
+_RESULT_KEYS = {'찬성': 'support', '반대': 'oppose', '기권': 'abstain', '불참': 'absent'}
+
+
+def party_vote_counts(age, party_ids=None) -> dict:
+    """{party_id: {'찬성': n, '반대': n, '기권': n, '불참': n, 'total': n}}"""
+    votes = Vote.objects.filter(age=age)
+    if party_ids is not None:
+        votes = votes.filter(member__party_id__in=list(party_ids))
+
+    rows = (
+        votes.values('member__party')
+        .annotate(
+            total=Count('id'),
+            **{key: Count('id', filter=Q(result=r)) for r, key in _RESULT_KEYS.items()},
+        )
+    )
+    return {
+        row['member__party']: {
+            **{r: row[key] for r, key in _RESULT_KEYS.items()},
+            'total': row['total'],
+        }
+        for row in rows
+    }
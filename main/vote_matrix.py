@@ -0,0 +1,300 @@
+# main/vote_matrix.py
+"""
+의원 × 의안 표결 행렬 (열 기반 분석 엔진)
+────────────────────────────────────────────────────────
+일치율 · 결속도 · 히트맵 · 유사도 같은 분석이 매번 Vote 를 ORM → Python dict 로 다시 읽지 않도록
+대수마다 표결 전체를 int8 밀집 행렬(의원 × 의안, 결과 코드) 하나와 id 인덱스 배열로 만들어 .npy 로 저장한다.
+읽기는 np.load(mmap_mode='r') 라 여러 워커 프로세스가 같은 페이지 캐시를 읽기 전용으로 공유한다.
+
+파일 ({VOTE_MATRIX_ROOT}/{대수}/)
+- CURRENT              : 현재 세대 디렉터리 이름 (os.replace 로 원자 교체, 이전 세대는 KEEP_GENERATIONS 개까지 보존)
+- g{세대}/votes.npy    : int8 [의원, 의안] 결과 코드 (RESULT_CODES, 0 = 기록 없음)
+- g{세대}/members.npy  : int64 행 → Member.id (오름차순)
+- g{세대}/parties.npy  : int64 행 → Party.id
+- g{세대}/bills.npy    : int64 열 → Bill.id (적재 순, 새 의안은 뒤에 붙음)
+- g{세대}/clusters.npy : int64 열 → Bill.cluster (NO_CLUSTER = 클러스터 없음)
+- g{세대}/bits.npy     : uint8 [결과, 의원, ⌈의안/8⌉] 결과별 비트셋 (np.packbits, 열 순서는 bills.npy 와 같음)
+
+- build(n)                  : 대수 전체 재생성
+- append_bills(n, bill_ids) : 해당 의안 열만 다시 읽어 추가 · 갱신 (새 의원은 행 추가), 행렬이 없으면 build
+- load(n)                   : VoteMatrix (없으면 None), 세대가 바뀌면 다시 매핑
+- pack(votes)               : 결과별 비트셋 (bits.npy 내용)
+- VoteMatrix                : rows / cols / member_votes / bill_votes / cluster_cols / submatrix
+                              result_counts / party_result_counts / compare
+"""
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from billview.models import Bill
+from geovote.models import Age, Member, Vote
+
+NO_VOTE = 0
+RESULT_CODES = {'찬성': 1, '반대': 2, '기권': 3, '불참': 4}
+RESULTS = list(RESULT_CODES)          # RESULTS[코드 - 1] → 결과 이름
+NO_CLUSTER = -1
+KEEP_GENERATIONS = 2                  # 이전 세대를 mmap 중인 워커가 있을 수 있으므로 한 세대는 남김
+
+ARRAYS = ('votes', 'members', 'parties', 'bills', 'clusters')
+STANCE_CODES = [RESULT_CODES[r] for r in ('찬성', '반대', '기권')]   # 출석 = 불참이 아닌 표결
+
+
+def _age_dir(age_number) -> Path:
+    return Path(settings.VOTE_MATRIX_ROOT) / str(age_number)
+
+
+def _current_dir(age_number):
+    try:
+        name = (_age_dir(age_number) / 'CURRENT').read_text().strip()
+    except FileNotFoundError:
+        return None
+    return _age_dir(age_number) / name
+
+
+def pack(votes):
+    """int8 [의원, 의안] → uint8 [결과, 의원, ⌈의안/8⌉] (RESULTS 순서, 비트 i = 열 i)"""
+    votes = np.asarray(votes)
+    return np.stack([np.packbits(votes == code, axis=1) for code in RESULT_CODES.values()])
+
+
+def _lookup(ids, keys, sorter=None):
+    """ids 배열에서 keys 의 위치 → (위치, 찾았는지) – ids 가 정렬돼 있지 않으면 sorter(argsort) 필요"""
+    keys = np.asarray(keys, dtype=np.int64)
+    if len(ids) == 0:
+        return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=bool)
+    pos = np.searchsorted(ids, keys, sorter=sorter).clip(max=len(ids) - 1)
+    if sorter is not None:
+        pos = sorter[pos]
+    return pos, ids[pos] == keys
+
+
+class VoteMatrix:
+    """한 대수의 표결 행렬 (읽기 전용 mmap)"""
+
+    def __init__(self, age_number, path):
+        self.age_number = age_number
+        self.path = Path(path)
+        for name in ARRAYS:
+            setattr(self, name, np.load(self.path / f"{name}.npy", mmap_mode='r'))
+        self._bill_sorter = np.argsort(self.bills, kind='stable')
+        bits_path = self.path / 'bits.npy'
+        self.bits = np.load(bits_path, mmap_mode='r') if bits_path.exists() else pack(self.votes)
+        # 클러스터별 열 마스크 (비트셋) – compare 가 AND 한 번으로 클러스터별로 나눠 센다
+        self.cluster_ids = np.unique(self.clusters[self.clusters != NO_CLUSTER])
+        self._cluster_masks = np.packbits(self.clusters[None, :] == self.cluster_ids[:, None], axis=1)
+
+    @property
+    def shape(self):
+        return self.votes.shape
+
+    # ---------- 인덱스 ----------
+    def rows(self, member_ids):
+        """Member.id 목록 → 행 번호 (없는 의원은 -1)"""
+        pos, found = _lookup(self.members, member_ids)
+        return np.where(found, pos, -1)
+
+    def cols(self, bill_ids):
+        """Bill.id 목록 → 열 번호 (없는 의안은 -1)"""
+        pos, found = _lookup(self.bills, bill_ids, sorter=self._bill_sorter)
+        return np.where(found, pos, -1)
+
+    def cluster_cols(self, cluster):
+        return np.flatnonzero(self.clusters == cluster)
+
+    # ---------- 슬라이스 ----------
+    def member_votes(self, member_id):
+        """의원 한 명의 (Bill.id 배열, 결과 코드 배열) – 없으면 None"""
+        row = self.rows([member_id])[0]
+        return None if row < 0 else (self.bills, self.votes[row])
+
+    def bill_votes(self, bill_id):
+        """의안 하나의 (Member.id 배열, 결과 코드 배열) – 없으면 None"""
+        col = self.cols([bill_id])[0]
+        return None if col < 0 else (self.members, self.votes[:, col])
+
+    def submatrix(self, member_ids=None, bill_ids=None, cluster=None):
+        """조건에 맞는 (행 번호, 열 번호, 부분 행렬) – 없는 id 는 빠진다"""
+        rows = np.arange(len(self.members)) if member_ids is None else self.rows(member_ids)
+        cols = np.arange(len(self.bills)) if bill_ids is None else self.cols(bill_ids)
+        rows, cols = rows[rows >= 0], cols[cols >= 0]
+        if cluster is not None:
+            cols = cols[self.clusters[cols] == cluster]
+        return rows, cols, self.votes[np.ix_(rows, cols)]
+
+    # ---------- 집계 ----------
+    def result_counts(self, axis=1, cluster=None):
+        """axis=1: 의원별, axis=0: 의안별 결과 코드 수 → [n, 4] (RESULTS 순서)"""
+        votes = self.votes if cluster is None else self.votes[:, self.cluster_cols(cluster)]
+        return np.stack([(votes == code).sum(axis=axis) for code in RESULT_CODES.values()], axis=-1)
+
+    def party_result_counts(self, cluster=None):
+        """정당별 결과 코드 수 → (Party.id 배열, [정당, 4])"""
+        party_ids, party_idx = np.unique(self.parties, return_inverse=True)
+        member_counts = self.result_counts(axis=1, cluster=cluster)
+        counts = np.zeros((len(party_ids), len(RESULT_CODES)), dtype=np.int64)
+        np.add.at(counts, party_idx, member_counts)
+        return party_ids, counts
+
+    def compare(self, member_a, member_b):
+        """
+        두 의원의 표결 비교 (비트셋 AND + popcount, Vote 자기 조인 없음) – 행렬에 없는 의원이면 None
+        → {'overall': 집계, 'clusters': {클러스터: 집계}}
+          집계 = {'common': 둘 다 출석, 'agree': 같은 결과, 'rate': 일치율(%) | None, 'same': {결과: 수}}
+          (same 의 불참 = 둘 다 불참, common · agree 에는 들어가지 않음)
+        """
+        rows = self.rows([member_a, member_b])
+        if (rows < 0).any():
+            return None
+        a, b = self.bits[:, rows[0]], self.bits[:, rows[1]]
+        stance = [code - 1 for code in STANCE_CODES]
+        same = a & b                                                                       # [결과, 바이트]
+        common = np.bitwise_or.reduce(a[stance], axis=0) & np.bitwise_or.reduce(b[stance], axis=0)
+        masks = self._cluster_masks                                                        # [클러스터, 바이트]
+        same_by_cluster = np.bitwise_count(same[:, None, :] & masks).sum(axis=-1, dtype=np.int64)
+        common_by_cluster = np.bitwise_count(common & masks).sum(axis=-1, dtype=np.int64)
+
+        def summary(same, common):
+            agree = int(same[stance].sum())
+            return {
+                'common': int(common),
+                'agree': agree,
+                'rate': round(agree / common * 100, 1) if common else None,
+                'same': {result: int(n) for result, n in zip(RESULTS, same)},
+            }
+
+        return {
+            'overall': summary(
+                np.bitwise_count(same).sum(axis=-1, dtype=np.int64),
+                np.bitwise_count(common).sum(dtype=np.int64),
+            ),
+            'clusters': {
+                int(c): summary(same_by_cluster[:, i], common_by_cluster[i])
+                for i, c in enumerate(self.cluster_ids)
+            },
+        }
+
+
+_loaded = {}
+
+
+def load(age_number):
+    path = _current_dir(age_number)
+    if path is None or not (path / 'votes.npy').exists():
+        return None
+    matrix = _loaded.get(age_number)
+    if matrix is None or matrix.path != path:
+        matrix = _loaded[age_number] = VoteMatrix(age_number, path)
+    return matrix
+
+
+# ---------- 생성 ----------
+def _write(age_number, arrays) -> Path:
+    age_dir = _age_dir(age_number)
+    age_dir.mkdir(parents=True, exist_ok=True)
+    current = _current_dir(age_number)
+    generation = int(current.name[1:]) + 1 if current else 1
+
+    gen_dir = age_dir / f"g{generation}"
+    if gen_dir.exists():                   # 중단된 이전 작업의 잔여물
+        shutil.rmtree(gen_dir)
+    gen_dir.mkdir()
+    for name in ARRAYS:
+        np.save(gen_dir / f"{name}.npy", arrays[name])
+    np.save(gen_dir / 'bits.npy', pack(arrays['votes']))
+
+    pointer = age_dir / 'CURRENT.tmp'
+    pointer.write_text(gen_dir.name)
+    os.replace(pointer, age_dir / 'CURRENT')
+
+    for old in age_dir.glob('g*'):
+        if old.is_dir() and old.name[1:].isdigit() and int(old.name[1:]) <= generation - KEEP_GENERATIONS:
+            shutil.rmtree(old, ignore_errors=True)
+    return gen_dir
+
+
+def _members(age):
+    rows = list(Member.objects.filter(age=age).order_by('id').values_list('id', 'party_id'))
+    return (
+        np.array([m for m, _ in rows], dtype=np.int64),
+        np.array([p if p is not None else -1 for _, p in rows], dtype=np.int64),
+    )
+
+
+def _fill(votes, members, bills, vote_qs):
+    """vote_qs 의 결과 코드를 votes[행, 열]에 기록 (행렬에 없는 의원 · 의안 표결은 무시)
+
+    같은 의원 · 의안에 표결 행이 여럿이면(재표결) 의결 날짜가 가장 늦은 표결을 쓴다.
+    날짜가 같으면 나중에 적재된(id 가 큰) 행. 팬시 인덱싱의 중복 대입 순서에 기대지 않도록
+    (date, id) 순으로 읽은 뒤 칸마다 마지막 행만 남겨 대입한다.
+    """
+    records = list(vote_qs.order_by('date', 'id').values_list('member_id', 'bill_id', 'result'))
+    if not records:
+        return
+    member_ids, bill_ids, results = zip(*records)
+    rows, row_found = _lookup(members, member_ids)
+    cols, col_found = _lookup(bills, bill_ids, sorter=np.argsort(bills, kind='stable'))
+    codes = np.array([RESULT_CODES.get(r, NO_VOTE) for r in results], dtype=np.int8)
+    ok = row_found & col_found
+    rows, cols, codes = rows[ok], cols[ok], codes[ok]
+    # 칸(행 × 열)별 마지막 표결 위치: 뒤집은 배열에서 첫 등장 = 원래 배열에서 마지막 등장
+    cells = rows * votes.shape[1] + cols
+    _, first_in_reversed = np.unique(cells[::-1], return_index=True)
+    last = len(cells) - 1 - first_in_reversed
+    votes[rows[last], cols[last]] = codes[last]
+
+
+def build(age_number):
+    age = Age.objects.get(number=age_number)
+    members, parties = _members(age)
+    bill_rows = list(
+        Bill.objects.filter(id__in=Vote.objects.filter(age=age).values('bill_id'))
+        .order_by('id').values_list('id', 'cluster')
+    )
+    bills = np.array([b for b, _ in bill_rows], dtype=np.int64)
+    clusters = np.array([NO_CLUSTER if c is None else c for _, c in bill_rows], dtype=np.int64)
+
+    votes = np.zeros((len(members), len(bills)), dtype=np.int8)
+    _fill(votes, members, bills, Vote.objects.filter(age=age))
+    _write(age_number, {
+        'votes': votes, 'members': members, 'parties': parties, 'bills': bills, 'clusters': clusters,
+    })
+    return load(age_number)
+
+
+def append_bills(age_number, bill_ids):
+    """새로 표결이 적재된 의안의 열만 다시 읽어 새 세대로 저장 → VoteMatrix"""
+    current = load(age_number)
+    if current is None:
+        return build(age_number)
+
+    age = Age.objects.get(number=age_number)
+    vote_qs = Vote.objects.filter(age=age, bill_id__in=set(bill_ids))
+    touched = dict(
+        Bill.objects.filter(id__in=vote_qs.values('bill_id')).values_list('id', 'cluster')
+    )
+    if not touched:
+        return current
+
+    # 행: 현재 의원 목록 기준으로 다시 맞춤 (새 의원은 빈 행으로 추가)
+    members, parties = _members(age)
+    old_rows, found = _lookup(members, current.members)
+
+    # 열: 기존 의안 뒤에 새 의안을 붙이고, 기존 의안 중 다시 적재된 열은 비운 뒤 새로 채움
+    new_bills = np.array(sorted(set(touched) - set(current.bills.tolist())), dtype=np.int64)
+    bills = np.concatenate([current.bills, new_bills])
+    clusters = np.concatenate([current.clusters, np.zeros(len(new_bills), dtype=np.int64)])
+    touched_cols = _lookup(bills, list(touched), sorter=np.argsort(bills, kind='stable'))[0]
+    clusters[touched_cols] = [NO_CLUSTER if c is None else c for c in touched.values()]
+
+    votes = np.zeros((len(members), len(bills)), dtype=np.int8)
+    votes[old_rows[found], :len(current.bills)] = current.votes[found]
+    votes[:, touched_cols] = NO_VOTE
+    _fill(votes, members, bills, vote_qs)
+
+    _write(age_number, {
+        'votes': votes, 'members': members, 'parties': parties, 'bills': bills, 'clusters': clusters,
+    })
+    return load(age_number)
@@ -0,0 +1,393 @@
+// --- 대시보드 섹션 로더 ---
+// 셸(dashboard.html / power.html)은 빈 컨테이너만 그리고,
+// #dashboard-root 의 data-sections 에 적힌 섹션 JSON 을 병렬로 받아 각자 채운다.
+// 한 섹션이 늦거나 실패해도 나머지 섹션은 먼저 그려진다.
+const root = document.getElementById("dashboard-root");
+const ageNum = Number(root.dataset.congress);
+const sectionNames = (root.dataset.sections || "").split(/\s+/).filter(Boolean);
+const urlParams = new URLSearchParams(window.location.search);
+
+function fetchSection(name) {
+  return fetch(root.dataset.sectionUrl.replace("__section__", name))
+    .then(res => {
+      if (!res.ok) throw new Error(`${name} 섹션 응답 오류`);
+      return res.json();
+    });
+}
+
+function setText(id, value) {
+  const el = document.getElementById(id);
+  if (el) el.textContent = value ?? "-";
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 정당별 표결 현황 + 상단 통계 카드 ---
+function renderParty(data) {
+  setText("stat-total-bills", data.total_bills);
+  setText("stat-total-parties", data.total_parties);
+  setText("stat-female-percent", `${data.gender_ratio.female_percent}%`);
+
+  const container = document.querySelector("#voteChart");
+  if (!container) return;
+  new ApexCharts(container, {
+    chart: { type: 'bar', stacked: true, stackType: '100%', height: 400 },
+    plotOptions: { bar: { horizontal: true, columnWidth: '60%' } },
+    dataLabels: {
+      enabled: true,
+      formatter: val => val > 0 ? val.toFixed(1) + '%' : '',
+    },
+    stroke: { show: true, width: 1, colors: ['transparent'] },
+    series: data.series,
+    xaxis: {
+      categories: data.categories,
+      title: { text: '비율 (%)' },
+      labels: { formatter: val => val.toFixed(0) + '%' },
+    },
+    yaxis: { title: { text: '정당' }, categories: data.categories },
+    colors: data.party_colors,
+    legend: { position: 'top' },
+    fill: { opacity: 1 },
+    tooltip: { y: { formatter: value => value + '%' } },
+  }).render();
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 양당 점유율 · HHI · ENP 카드 ---
+function renderConcentration(data) {
+  setText("top2-ratio", data.top2_ratio != null ? `${data.top2_ratio}%` : "-");
+  setText("hhi-value", data.hhi);
+  setText("enp-value", data.enp);
+
+  const detail = document.getElementById("top2-detail");
+  if (!detail) return;
+  detail.innerHTML = "";
+  data.top2_detail.forEach(item => {
+    const li = document.createElement("li");
+    const party = document.createElement("span");
+    party.className = "font-medium";
+    party.textContent = item.party;
+    const share = document.createElement("span");
+    share.className = "font-semibold";
+    share.style.color = item.color;
+    share.textContent = ` ${item.seat_share}`;
+    li.append(party, share);
+    detail.appendChild(li);
+  });
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 권력 집중도 시계열 + ENP 프로그레스 바 ---
+function renderTimeseries(data) {
+  const chartEl = document.querySelector("#hhi-top2-chart");
+  if (chartEl) {
+    new ApexCharts(chartEl, {
+      chart: { type: 'line', height: 350 },
+      xaxis: { categories: data.ages, title: { text: '국회 대수' } },
+      yaxis: [
+        { seriesName: 'HHI 지수', title: { text: 'HHI 지수' }, min: 0, max: 1, opposite: false },
+        { seriesName: '점유율 (%)', title: { text: '점유율 (%)' }, min: 0, max: 100, opposite: true },
+      ],
+      series: [
+        { name: 'HHI 지수', type: 'line', data: data.hhi_values, yAxisIndex: 0 },
+        { name: '점유율 (%)', type: 'line', data: data.top2_seat_shares_series, yAxisIndex: 1 },
+      ],
+      tooltip: { shared: true, intersect: false },
+    }).render();
+  }
+
+  const container = document.getElementById("enp-progress-bars");
+  if (!container) return;
+  data.ages.forEach((age, i) => {
+    const enp = data.enp_values[i];
+    const totalParties = data.total_parties[i];
+    const ratio = ((enp / totalParties) * 100).toFixed(1);
+
+    const barWrapper = document.createElement("div");
+    barWrapper.style.marginBottom = "12px";
+    barWrapper.innerHTML = `
+      <div class="mb-5">
+        <div class="flex justify-between items-center mb-1">
+          <div class="flex items-center gap-2">
+            <svg class="w-4 h-4 text-pink-500" fill="currentColor" viewBox="0 0 20 20">
+              <path d="M2 10a8 8 0 1116 0A8 8 0 012 10z" />
+            </svg>
+            <span class="font-semibold text-gray-800">${age}</span>
+          </div>
+          <span class="text-sm text-gray-500">총 ${totalParties}개 정당 중 ${enp}개 (${ratio}%)</span>
+        </div>
+        <div class="w-full bg-gray-100 rounded-full h-4">
+          <div class="bg-gradient-to-r from-pink-400 to-pink-600 h-4 rounded-full text-xs text-white text-right pr-2 font-medium"
+               style="width: ${ratio}%; min-width: 2rem;">
+            ${ratio}%
+          </div>
+        </div>
+      </div>
+    `;
+    container.appendChild(barWrapper);
+  });
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 정당별 탑 클러스터 차트 (옵션 목록 + 반대/기권 필터 + 카드뉴스 이동) ---
+function renderOptions(data) {
+  const stanceSelect = document.getElementById("stanceSelect");
+  const topSelect = document.getElementById("topSelect");
+  const chartContainer = document.getElementById("topClusterChart");
+  const cardnewsBtn = document.getElementById("goToCardnewsBtn");
+  if (!stanceSelect || !topSelect || !chartContainer) return;
+
+  data.cluster_options.forEach(opt => {
+    const option = document.createElement("option");
+    option.value = opt.value;
+    option.dataset.stance = opt.stance;
+    option.dataset.url = opt.cardnews_url;
+    option.textContent = `${opt.party} ${opt.stance_display}⬆ - ${opt.keyword}`;
+    topSelect.appendChild(option);
+  });
+
+  // 기본 차트는 섹션에 포함, 나머지 옵션 차트는 한 번의 묶음 요청으로 받아 둠
+  const charts = {};
+  if (data.default_cluster_num != null) {
+    charts[`${ageNum}:${data.default_cluster_num}`] = data.cluster_chart_data;
+  }
+  const clusterNums = [...new Set(data.cluster_options.map(opt => opt.cluster_num))]
+    .filter(num => !(`${ageNum}:${num}` in charts));
+  const chartBatch = clusterNums.length
+    ? fetch(`${root.dataset.batchUrl}?pairs=${clusterNums.map(num => `${ageNum}:${num}`).join(",")}`)
+        .then(res => res.ok ? res.json() : { charts: {} })
+        .then(batch => Object.assign(charts, batch.charts || {}))
+        .catch(() => charts)
+    : Promise.resolve(charts);
+
+  function fetchChartData(clusterNum, party, stance) {
+    const cached = charts[`${ageNum}:${clusterNum}`];
+    if (cached) return Promise.resolve(cached);
+    return chartBatch.then(all => {
+      if (all[`${ageNum}:${clusterNum}`]) return all[`${ageNum}:${clusterNum}`];
+      const url = root.dataset.chartUrl
+              + `?age_num=${ageNum}`
+              + `&cluster_num=${clusterNum}`
+              + `&party=${encodeURIComponent(party)}`
+              + `&stance=${stance}`;
+      return fetch(url).then(res => {
+        if (!res.ok) throw new Error("서버 응답 오류");
+        return res.json();
+      });
+    });
+  }
+
+  let chart;
+  function fetchAndRenderChart() {
+    const [party, stance, clusterNum] = topSelect.value.split("--");
+    if (!clusterNum) return;
+
+    fetchChartData(clusterNum, party, stance)
+      .then(chartData => {
+        if (chart) {
+          chart.updateOptions({ xaxis: { categories: chartData.categories }, series: chartData.series });
+        } else {
+          chart = new ApexCharts(chartContainer, {
+            chart: { type: 'bar', stacked: true, height: 400 },
+            plotOptions: { bar: { horizontal: false, borderRadius: 4 } },
+            xaxis: { categories: chartData.categories },
+            yaxis: { title: { text: "비율 (%)" }, max: 100 },
+            tooltip: { y: { formatter: val => `${val}%` } },
+            series: chartData.series,
+          });
+          chart.render();
+        }
+      })
+      .catch(err => console.error("차트 데이터 불러오기 실패:", err));
+  }
+
+  // 선택한 stance 옵션만 보이게 하고, 보이는 첫 옵션(또는 요청한 옵션)으로 차트 갱신
+  function filterTopSelectOptionsByStance(preferred) {
+    const options = Array.from(topSelect.options);
+    options.forEach(option => {
+      option.style.display = option.dataset.stance === stanceSelect.value ? "" : "none";
+    });
+    const visible = options.filter(option => option.style.display !== "none");
+    const target = visible.find(option => option.value === preferred) || visible[0];
+    if (target) {
+      topSelect.value = target.value;
+      fetchAndRenderChart();
+    }
+  }
+
+  stanceSelect.addEventListener("change", () => filterTopSelectOptionsByStance());
+  topSelect.addEventListener("change", fetchAndRenderChart);
+  if (cardnewsBtn) {
+    cardnewsBtn.addEventListener("click", () => {
+      const selected = topSelect.options[topSelect.selectedIndex];
+      if (selected && selected.dataset.url) window.open(selected.dataset.url, "_blank");
+    });
+  }
+
+  // ?stance=abstain&cluster_value=당--abstain--13 로 들어온 경우 그 옵션부터
+  const requestedStance = urlParams.get("stance");
+  if (requestedStance === "oppose" || requestedStance === "abstain") {
+    stanceSelect.value = requestedStance;
+  }
+  filterTopSelectOptionsByStance(urlParams.get("cluster_value"));
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 논쟁 지수 상위 의안 · 클러스터 ---
+function renderControversy(data) {
+  const billList = document.getElementById("controversyBills");
+  if (billList) {
+    billList.innerHTML = "";
+    data.bills.forEach(bill => {
+      const li = document.createElement("li");
+      li.className = "flex justify-between items-center border-b border-gray-100 pb-2";
+      const link = document.createElement("a");
+      link.href = bill.url;
+      link.className = "font-medium text-gray-800 hover:text-cyan-600 truncate mr-4";
+      link.textContent = bill.title;
+      const meta = document.createElement("span");
+      meta.className = "text-sm text-pink-500 whitespace-nowrap";
+      meta.textContent = `반대·기권 ${bill.split_ratio}% · 지수 ${bill.score}`;
+      li.append(link, meta);
+      billList.appendChild(li);
+    });
+    if (!data.bills.length) billList.innerHTML = '<li class="text-gray-500">표결 데이터가 없습니다.</li>';
+  }
+
+  const clusterList = document.getElementById("controversyClusters");
+  if (clusterList) {
+    clusterList.innerHTML = "";
+    data.clusters.forEach(cluster => {
+      const li = document.createElement("li");
+      const link = document.createElement("a");
+      link.href = cluster.url;
+      link.className = "text-cyan-600 hover:underline";
+      link.textContent = `#${cluster.keyword || cluster.cluster_num}`;
+      const meta = document.createElement("span");
+      meta.className = "ml-2 text-xs text-gray-500";
+      meta.textContent = `${cluster.bill_count}건 · 지수 ${cluster.score}`;
+      li.append(link, meta);
+      clusterList.appendChild(li);
+    });
+  }
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 정당 간 표결 일치율 히트맵 (06_agreementHeatmap, 클러스터별로 따로 요청) ---
+function initAgreement() {
+  const container = document.getElementById("agreementHeatmap");
+  const clusterSelect = document.getElementById("agreementClusterSelect");
+  if (!container || !clusterSelect || !root.dataset.agreementUrl) return;
+
+  let heatmap = null;
+  let optionsLoaded = false;
+
+  function render(data) {
+    if (!optionsLoaded) {
+      data.clusters.forEach(cluster => {
+        const option = document.createElement("option");
+        option.value = cluster.cluster_num;
+        option.textContent = `${cluster.keyword || `클러스터 ${cluster.cluster_num}`} (${cluster.bill_count}건)`;
+        clusterSelect.appendChild(option);
+      });
+      optionsLoaded = true;
+    }
+    setText("agreementBillCount", `표결 법안 ${data.bill_count}건 기준`);
+
+    // ApexCharts 히트맵은 행을 아래에서 위로 그리므로 뒤집어 넣는다
+    const series = data.parties.map((party, i) => ({
+      name: party,
+      data: data.parties.map((other, j) => ({ x: other, y: data.rates[i][j], pairs: data.pairs[i][j] })),
+    })).reverse();
+    const options = {
+      chart: { type: 'heatmap', height: 450, toolbar: { show: false } },
+      series: series,
+      dataLabels: { enabled: true, formatter: val => val == null ? '-' : val.toFixed(0) },
+      plotOptions: {
+        heatmap: {
+          enableShades: false,
+          colorScale: {
+            ranges: [
+              { from: 0, to: 40, color: '#60a5fa', name: '대립' },
+              { from: 40, to: 70, color: '#e5e7eb', name: '혼재' },
+              { from: 70, to: 100, color: '#ec4899', name: '연대' },
+            ],
+          },
+        },
+      },
+      tooltip: {
+        y: {
+          formatter: (val, { seriesIndex, dataPointIndex, w }) => {
+            const point = w.config.series[seriesIndex].data[dataPointIndex];
+            return val == null ? '함께 출석한 표결 없음' : `${val}% (의원 쌍 ${point.pairs.toLocaleString()})`;
+          },
+        },
+      },
+    };
+
+    if (heatmap) {
+      heatmap.updateOptions(options, true, true);
+    } else {
+      heatmap = new ApexCharts(container, options);
+      heatmap.render();
+    }
+  }
+
+  function load() {
+    const cluster = clusterSelect.value;
+    const url = root.dataset.agreementUrl + (cluster ? `?cluster=${cluster}` : "");
+    fetch(url)
+      .then(res => {
+        if (!res.ok) throw new Error("일치율 응답 오류");
+        return res.json();
+      })
+      .then(render)
+      .catch(err => console.error(err));
+  }
+
+  clusterSelect.addEventListener("change", load);
+  load();
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 팝업 ---
+function initPopup() {
+  const popupModal = document.getElementById("popupModal");
+  if (!popupModal) return;
+  const mainContent = document.querySelector(".flex-1.p-6");
+
+  function openPopup(title, contentHtml) {
+    document.getElementById("modalTitle").textContent = title;
+    document.getElementById("modalContent").innerHTML = contentHtml;
+    popupModal.classList.remove("hidden");
+    if (mainContent) mainContent.classList.add("opacity-70", "blur-sm");
+  }
+
+  function closePopup() {
+    popupModal.classList.add("hidden");
+    if (mainContent) mainContent.classList.remove("opacity-70", "blur-sm");
+  }
+
+  document.getElementById("closeModalBtn").addEventListener("click", closePopup);
+  document.getElementById("popupOverlay").addEventListener("click", closePopup);
+  document.querySelectorAll(".explain-btn").forEach(btn => {
+    btn.addEventListener("click", () => openPopup(btn.dataset.title, btn.dataset.content));
+  });
+}
+
+//----------------------------------------------------------------------------------------------------------
+// --- 초기화: 섹션 병렬 요청 ---
+const renderers = {
+  party: renderParty,
+  concentration: renderConcentration,
+  timeseries: renderTimeseries,
+  options: renderOptions,
+  controversy: renderControversy,
+};
+
+initPopup();
+initAgreement();
+sectionNames.forEach(name => {
+  fetchSection(name)
+    .then(data => renderers[name](data))
+    .catch(err => console.error(err));
+});
@@ -51,6 +51,7 @@ const mainContent = document.getElementById("mainContent");
 
 let svg, currentNode, hierarchyRoot;
 let selectedAge = null;
+let memberSummaries = {};   // 의원 id → 표결 요약 + 정당 일치율 (대수마다 한 번 받음)
 let defaultAgeBtn = null;
 
 // --- 색상 팔레트 정의 ---
@@ -251,6 +252,25 @@ voteTypes.forEach(type => {
   `;
 });
 
+  // 비슷하게 투표한 의원 (member_summaries 의 similar – 대수 전체 기준 상위 몇 명)
+  if (data.similar && data.similar.length > 0) {
+    html += `
+      <div class="card rounded-lg shadow-md bg-white p-4">
+        <div class="mb-3 font-semibold text-lg text-gray-700">🤝 비슷하게 투표한 의원</div>
+        <ul class="space-y-1">
+          ${data.similar.map(s => `
+            <li class="flex items-center justify-between text-base">
+              <span>
+                <span class="inline-block w-2 h-2 rounded-full mr-1" style="background:${s.color || '#ccc'}"></span>
+                ${s.name} <span class="text-sm text-gray-500">${s.party || ''}</span>
+              </span>
+              <span class="font-bold text-cyan-500" title="함께 출석한 ${s.common}건 기준">${s.rate.toFixed(1)}%</span>
+            </li>
+          `).join('')}
+        </ul>
+      </div>
+    `;
+  }
 
   html += '</div>';
   return html;
@@ -312,32 +332,14 @@ function render(node, width, height, selectedMemberName = null) {
       const card = container.append("div")
         .attr("class", `district-card${isSelected ? " selected" : ""} bg-white rounded-xl p-4 shadow-lg hover:shadow-xl transition-all duration-500 ease-in-out transform hover:-translate-y-1 cursor-pointer`)
         .style("border-color", d.data.color || "#888")
-        .on("click", async () => {
+        .on("click", () => {
           const memberName = d.data.member_name;
           if (!memberName) {
             alert("이 지역구에는 등록된 의원 정보가 없습니다.");
             return;
           }
-          try {
-            const res = await fetch(`/geovote/api/member-vote-summary/?member_name=${encodeURIComponent(memberName)}`);
-            if (!res.ok) throw new Error("API 호출 실패");
-            const summary = await res.json();
-
-            // 정당 일치율 API 추가 호출
-            const alignmentRes = await fetch(`/geovote/api/member-alignment/?member_name=${encodeURIComponent(memberName)}&congress_num=${selectedAge}`);
-            if (alignmentRes.ok) {
-              const alignment = await alignmentRes.json();
-              summary.party = alignment.party;
-              summary.alignment_rate = alignment.alignment_rate;
-              summary.deviation_rate = alignment.deviation_rate;
-            }
-
-            const summaryHtml = renderSummary(summary);
-            openPopup(`${memberName} 의원은 이렇게 투표했네요 📝🗳️`, summaryHtml);
-          } catch (err) {
-            console.error(err);
-            alert("표결 정보를 가져오지 못했습니다.");
-          }
+          const summaryHtml = renderSummary(memberSummaries[d.data.member_id]);
+          openPopup(`${memberName} 의원은 이렇게 투표했네요 📝🗳️`, summaryHtml);
         });
 
       card.append("img")
@@ -392,7 +394,7 @@ function render(node, width, height, selectedMemberName = null) {
     .join("g")
     .attr("transform", d => `translate(${x(d.x0)},${y(d.y0)})`)
     .style("cursor", d => d.children ? "pointer" : "default")
-    .on("click", async (event, d) => {
+    .on("click", (event, d) => {
       if (d.children) {
         currentNode = d;
         render(d, width, height);
@@ -402,16 +404,8 @@ function render(node, width, height, selectedMemberName = null) {
           alert("이 지역구에는 등록된 의원 정보가 없습니다.");
           return;
         }
-        try {
-          const res = await fetch(`/geovote/api/member-vote-summary/?member_name=${encodeURIComponent(memberName)}`);
-          if (!res.ok) throw new Error("API 호출 실패");
-          const summary = await res.json();
-          const summaryHtml = renderSummary(summary);
-          openPopup(`${memberName} 의원 표결 요약`, summaryHtml);
-        } catch (err) {
-          console.error(err);
-          alert("표결 정보를 가져오지 못했습니다.");
-        }
+        const summaryHtml = renderSummary(memberSummaries[d.data.member_id]);
+        openPopup(`${memberName} 의원 표결 요약`, summaryHtml);
       }
     });
 
@@ -484,9 +478,14 @@ async function loadData(age) {
 
 async function init(selectedAge) {
   try {
-    const res = await fetch(`/geovote/api/treemap-data/?age=${selectedAge}`);
+    // 트리와 의원 요약 묶음을 함께 요청 (의원 카드 클릭은 추가 요청 없이 처리)
+    const [res, summaryRes] = await Promise.all([
+      fetch(`/geovote/api/treemap-data/?age=${selectedAge}`),
+      fetch(`/geovote/api/member-summaries/?age=${selectedAge}`),
+    ]);
     if (!res.ok) throw new Error("트리맵 데이터를 가져오지 못했습니다.");
     const data = await res.json();
+    memberSummaries = summaryRes.ok ? (await summaryRes.json()).members : {};
     const root = d3.hierarchy(data).sum(d => d.value || 1).sort((a, b) => b.value - a.value);
     const width = container.clientWidth * 0.95;
     const height = container.clientHeight * 0.9;